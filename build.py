@@ -6,59 +6,135 @@ Handles:
 2. Building the Rust secure signer library
 """
 
+import hashlib
+import io
+import shutil
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+BUILD_CACHE_DIR = Path(".build_cache")
 
-def print_step(msg: str):
-    print(f"\n{'='*60}")
-    print(f"  {msg}")
-    print(f"{'='*60}\n")
+_BAR = "=" * 60
+_BUILD_BANNER = f"\n{_BAR}\n  SOLANA COLD WALLET BUILD\n{_BAR}"
 
+# Library name is based on crate name (solana_secure_signer)
+_LIB_NAME = {
+    "darwin": "libsolana_secure_signer.dylib",
+    "win32": "solana_secure_signer.dll",
+}.get(sys.platform, "libsolana_secure_signer.so")
+_BIN_NAME = "solana-signer.exe" if sys.platform == "win32" else "solana-signer"
+# Anchored to this file so main.py and `python build.py` hash and stamp the same tree
+SIGNER_DIR = Path(__file__).resolve().parent / "secure_signer"
+_TARGET_DIRS = (SIGNER_DIR / "target" / "release", SIGNER_DIR / "target" / "debug")
 
-def run_command(cmd: list, cwd: str = None, check: bool = True) -> bool:
-    """Run a command and return success status"""
+
+def print_step(msg: str, file=None):
+    print(f"\n{_BAR}\n  {msg}\n{_BAR}\n", file=file)
+
+
+def run_command(cmd: list, cwd: str = None, check: bool = True, output=None,
+                env: dict = None, capture: bytearray = None) -> bool:
+    """
+    Run a command and return success status.
+
+    The child's combined stdout/stderr is streamed as raw bytes in up to
+    64 KiB reads, without decoding, to the terminal or to `output` (a text
+    stream with an underlying .buffer) so that concurrent build steps
+    don't interleave their logs. If `capture` is given, the same bytes are
+    appended to it.
+    """
+    stream = output if output is not None else sys.stdout
     try:
-        print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(
+        print(f"Running: {' '.join(cmd)}", file=stream)
+        stream.flush()
+        proc = subprocess.Popen(
             cmd,
             cwd=cwd,
-            check=check,
-            capture_output=False,
-            text=True
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
         )
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"Command failed with exit code {e.returncode}")
-        return False
+        sink = stream.buffer
+        while True:
+            chunk = proc.stdout.read1(65536)
+            if not chunk:
+                break
+            sink.write(chunk)
+            if capture is not None:
+                capture += chunk
+            if output is None:
+                sink.flush()
+        returncode = proc.wait()
+        if check and returncode != 0:
+            print(f"Command failed with exit code {returncode}", file=stream)
+        return returncode == 0
     except FileNotFoundError:
-        print(f"Command not found: {cmd[0]}")
+        print(f"Command not found: {cmd[0]}", file=stream)
         return False
 
 
-def install_python_dependencies() -> bool:
-    """Install Python dependencies from local_requirements.txt"""
-    print_step("Installing Python Dependencies")
+def install_python_dependencies(output=None, force: bool = False) -> bool:
+    """
+    Install Python dependencies from local_requirements.txt.
+
+    Skips pip entirely when a stamp for the same requirements file and
+    interpreter already exists in .build_cache/. Pass force=True to reinstall.
+    """
+    print_step("Installing Python Dependencies", file=output)
     
     requirements_file = Path("local_requirements.txt")
     if not requirements_file.exists():
-        print("Warning: local_requirements.txt not found")
+        print("Warning: local_requirements.txt not found", file=output)
+        return True
+    
+    digest = hashlib.sha256(
+        requirements_file.read_bytes() + sys.version.encode() + sys.executable.encode()
+    ).hexdigest()
+    stamp = BUILD_CACHE_DIR / f"pip-{digest}.stamp"
+    
+    if force:
+        stamp.unlink(missing_ok=True)
+    elif stamp.exists():
+        print("Python dependencies up to date, skipping pip", file=output)
         return True
     
-    return run_command([
+    success = run_command([
         sys.executable, "-m", "pip", "install", 
         "-r", "local_requirements.txt",
+        "--cache-dir", str(BUILD_CACHE_DIR / "pip-wheels"),
         "--quiet"
-    ])
+    ], output=output)
+    
+    if success:
+        BUILD_CACHE_DIR.mkdir(exist_ok=True)
+        stamp.touch()
+    
+    return success
+
 
+@lru_cache(maxsize=1)
+def check_rust_installed(verbose: bool = False) -> bool:
+    """
+    Check if Rust/Cargo is installed.
 
-def check_rust_installed() -> bool:
-    """Check if Rust/Cargo is installed"""
+    Only looks up cargo on PATH; pass verbose=True to also run
+    `cargo --version` and print the toolchain version.
+    """
+    path = shutil.which("cargo")
+    if not path:
+        return False
+    
+    if not verbose:
+        print(f"Found cargo at: {path}")
+        return True
+    
     try:
         result = subprocess.run(
-            ["cargo", "--version"],
+            [path, "--version"],
             capture_output=True,
             text=True
         )
@@ -84,51 +160,136 @@ def install_rust() -> bool:
             check=True
         )
         os.environ["PATH"] = f"{Path.home()}/.cargo/bin:" + os.environ.get("PATH", "")
+        check_rust_installed.cache_clear()
         return True
     except subprocess.CalledProcessError:
         print("Failed to install Rust. Please install manually from: https://rustup.rs/")
         return False
 
 
-def build_rust_signer(release: bool = True) -> bool:
+def ensure_rust_toolchain() -> bool:
+    """Make sure cargo is available, installing it via rustup if needed"""
+    if not check_rust_installed():
+        if not install_rust():
+            return False
+    return True
+
+
+def _hash_tree(digest, root: Path, base: Path):
+    """Feed every file under root into digest in a stable order"""
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            _hash_tree(digest, Path(entry.path), base)
+        elif entry.is_file(follow_symlinks=False):
+            # Relative to the signer dir, so relative and absolute callers agree
+            digest.update(Path(entry.path).relative_to(base).as_posix().encode())
+            with open(entry.path, "rb") as f:
+                digest.update(f.read())
+
+
+def signer_source_hash(signer_dir: Path, release: bool = True) -> str:
+    """Hash the signer sources, manifest, lockfile and build profile"""
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(b"release" if release else b"debug")
+    _hash_tree(digest, signer_dir / "src", signer_dir)
+    for name in ("Cargo.toml", "Cargo.lock"):
+        path = signer_dir / name
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def signer_build_matches(signer_dir: Path, source_hash: str, release: bool = True) -> bool:
+    """True when the library exists and the last recorded build used source_hash"""
+    lib_path = signer_dir / "target" / ("release" if release else "debug") / _LIB_NAME
+    try:
+        hash_file = signer_dir / "target" / ".build-hash"
+        return lib_path.exists() and hash_file.read_text().strip() == source_hash
+    except OSError:
+        return False
+
+
+def record_signer_build(signer_dir: Path, source_hash: str):
+    """Remember source_hash as the inputs of the current build output"""
+    hash_file = signer_dir / "target" / ".build-hash"
+    tmp_hash = hash_file.with_suffix(".tmp")
+    tmp_hash.write_text(source_hash)
+    os.replace(tmp_hash, hash_file)
+
+
+# cargo output meaning an --offline build lacked something from the registry
+_OFFLINE_MISS_MARKERS = (
+    b"attempting to make an HTTP request, but --offline",
+    b"no matching package",
+    b"failed to download",
+    b"you're using offline mode",
+)
+
+
+def _offline_registry_miss(log: bytes) -> bool:
+    """True when a failed --offline build needs the registry rather than a code fix"""
+    return any(marker in log for marker in _OFFLINE_MISS_MARKERS)
+
+
+def build_rust_signer(release: bool = True, output=None, check_toolchain: bool = True) -> bool:
     """Build the Rust secure signer library"""
-    print_step("Building Rust Secure Signer")
+    print_step("Building Rust Secure Signer", file=output)
     
-    signer_dir = Path("secure_signer")
+    signer_dir = SIGNER_DIR
     if not signer_dir.exists():
-        print(f"Error: {signer_dir} directory not found")
+        print(f"Error: {signer_dir} directory not found", file=output)
         return False
     
     if not (signer_dir / "Cargo.toml").exists():
-        print(f"Error: Cargo.toml not found in {signer_dir}")
+        print(f"Error: Cargo.toml not found in {signer_dir}", file=output)
         return False
     
-    if not check_rust_installed():
-        if not install_rust():
-            return False
+    target_dir = _TARGET_DIRS[0] if release else _TARGET_DIRS[1]
+    binary_path = target_dir / _BIN_NAME
+    lib_path = target_dir / _LIB_NAME
+    
+    # Nothing changed since the last successful build: skip cargo entirely
+    source_hash = signer_source_hash(signer_dir, release)
+    if signer_build_matches(signer_dir, source_hash, release):
+        print("Rust signer is up to date, skipping cargo", file=output)
+        return True
+    
+    if check_toolchain and not ensure_rust_toolchain():
+        return False
     
-    cmd = ["cargo", "build", "--features", "ffi"]
+    cmd = ["cargo", "build", "--features", "ffi", "--jobs", str(os.cpu_count() or 1)]
     if release:
         cmd.append("--release")
     
-    success = run_command(cmd, cwd=str(signer_dir))
+    # Dependencies are already fetched once a lockfile and build output exist
+    target_root = signer_dir / "target"
+    if (signer_dir / "Cargo.lock").exists() and target_root.is_dir() and any(target_root.iterdir()):
+        cmd.append("--offline")
+    
+    env = None
+    if shutil.which("sccache"):
+        env = {**os.environ, "RUSTC_WRAPPER": "sccache"}
+    
+    log = bytearray()
+    success = run_command(cmd, cwd=str(signer_dir), output=output, env=env, capture=log)
+    if not success and "--offline" in cmd and _offline_registry_miss(log):
+        # A new dependency needs the registry after all; compile errors don't
+        print("Offline build is missing dependencies, retrying with the registry", file=output)
+        cmd.remove("--offline")
+        success = run_command(cmd, cwd=str(signer_dir), output=output, env=env)
     
     if success:
-        target_dir = "release" if release else "debug"
-        binary_path = signer_dir / "target" / target_dir / "solana-signer"
-        lib_path = signer_dir / "target" / target_dir / "libsecure_signer.so"
+        record_signer_build(signer_dir, source_hash)
         
-        if sys.platform == "darwin":
-            lib_path = signer_dir / "target" / target_dir / "libsecure_signer.dylib"
-        elif sys.platform == "win32":
-            lib_path = signer_dir / "target" / target_dir / "secure_signer.dll"
-            binary_path = signer_dir / "target" / target_dir / "solana-signer.exe"
+        _clear_caches()
         
-        print(f"\nBuild successful!")
+        print(f"\nBuild successful!", file=output)
         if binary_path.exists():
-            print(f"  Binary: {binary_path}")
+            print(f"  Binary: {binary_path}", file=output)
         if lib_path.exists():
-            print(f"  Library: {lib_path}")
+            print(f"  Library: {lib_path}", file=output)
     
     return success
 
@@ -137,19 +298,16 @@ def run_rust_tests() -> bool:
     """Run Rust tests with permissive memory mode"""
     print_step("Running Rust Tests")
     
-    signer_dir = Path("secure_signer")
+    signer_dir = SIGNER_DIR
     if not signer_dir.exists():
         print("Skipping tests: secure_signer directory not found")
         return True
     
-    env = os.environ.copy()
-    env["SIGNER_ALLOW_INSECURE_MEMORY"] = "1"
-    
     try:
         result = subprocess.run(
             ["cargo", "test", "--features", "ffi"],
             cwd=str(signer_dir),
-            env=env,
+            env={**os.environ, "SIGNER_ALLOW_INSECURE_MEMORY": "1"},
             check=False
         )
         return result.returncode == 0
@@ -158,16 +316,37 @@ def run_rust_tests() -> bool:
         return True
 
 
-def build_all(release: bool = True, run_tests: bool = False) -> bool:
+def build_all(release: bool = True, run_tests: bool = False, force: bool = False) -> bool:
     """Run the complete build process"""
-    print("\n" + "="*60)
-    print("  SOLANA COLD WALLET BUILD")
-    print("="*60)
+    print(_BUILD_BANNER)
+    
+    # rustup may prompt or modify PATH, so resolve the toolchain before
+    # starting the parallel steps
+    if not ensure_rust_toolchain():
+        print("\nError: Rust build failed")
+        return False
     
-    if not install_python_dependencies():
+    # pip and cargo are independent; run them side by side and print each
+    # log once it finishes so the output stays readable
+    pip_log = io.TextIOWrapper(io.BytesIO(), write_through=True)
+    cargo_log = io.TextIOWrapper(io.BytesIO(), write_through=True)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pip_future = executor.submit(install_python_dependencies, pip_log, force)
+        cargo_future = executor.submit(
+            build_rust_signer, release, cargo_log, False
+        )
+        pip_ok = pip_future.result()
+        cargo_ok = cargo_future.result()
+    
+    sys.stdout.flush()
+    sys.stdout.buffer.write(pip_log.buffer.getvalue())
+    sys.stdout.buffer.write(cargo_log.buffer.getvalue())
+    sys.stdout.buffer.flush()
+    
+    if not pip_ok:
         print("\nWarning: Some Python dependencies may not have installed correctly")
     
-    if not build_rust_signer(release=release):
+    if not cargo_ok:
         print("\nError: Rust build failed")
         return False
     
@@ -181,22 +360,16 @@ def build_all(release: bool = True, run_tests: bool = False) -> bool:
     return True
 
 
+@lru_cache(maxsize=1)
 def is_built() -> bool:
     """Check if the Rust signer is already built"""
-    signer_dir = Path("secure_signer")
-    
-    # Library name is based on crate name (solana_secure_signer)
-    if sys.platform == "darwin":
-        lib_name = "libsolana_secure_signer.dylib"
-    elif sys.platform == "win32":
-        lib_name = "solana_secure_signer.dll"
-    else:
-        lib_name = "libsolana_secure_signer.so"
-    
-    release_lib = signer_dir / "target" / "release" / lib_name
-    debug_lib = signer_dir / "target" / "debug" / lib_name
-    
-    return release_lib.exists() or debug_lib.exists()
+    return any((d / _LIB_NAME).exists() for d in _TARGET_DIRS)
+
+
+def _clear_caches():
+    """Forget memoized toolchain/build checks so the next call re-reads disk"""
+    check_rust_installed.cache_clear()
+    is_built.cache_clear()
 
 
 if __name__ == "__main__":
@@ -206,6 +379,7 @@ if __name__ == "__main__":
     parser.add_argument("--debug", action="store_true", help="Build in debug mode")
     parser.add_argument("--test", action="store_true", help="Run tests after building")
     parser.add_argument("--check", action="store_true", help="Only check if build exists")
+    parser.add_argument("--force", action="store_true", help="Reinstall Python dependencies even if cached")
     
     args = parser.parse_args()
     
@@ -217,5 +391,5 @@ if __name__ == "__main__":
             print("Rust signer needs to be built")
             sys.exit(1)
     
-    success = build_all(release=not args.debug, run_tests=args.test)
+    success = build_all(release=not args.debug, run_tests=args.test, force=args.force)
     sys.exit(0 if success else 1)
@@ -7,14 +7,29 @@ Usage:
     sudo python3 flash_usb.py /dev/sdX           # Flash to specific device
     sudo python3 flash_usb.py --build            # Build ISO then flash
     sudo python3 flash_usb.py --build-only       # Only build ISO, don't flash
+    sudo python3 flash_usb.py --no-cache         # Rescan USB devices, ignore cached scan
 
 B - Love U 3000
 """
 
+import asyncio
 import subprocess
 import sys
 import os
+import time
+import errno
+import fcntl
+import json
+import mmap
 import platform
+import plistlib
+import re
+import select
+import shlex
+import shutil
+import signal
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -25,20 +40,77 @@ try:
     HAS_RICH = True
 except ImportError:
     HAS_RICH = False
+    _TAG_RE = re.compile(r'\[/?(?:bold|green|red|yellow|cyan|white)\]')
+
     class Console:
         def print(self, *args, **kwargs):
-            text = str(args[0]) if args else ""
-            text = text.replace("[bold]", "").replace("[/bold]", "")
-            text = text.replace("[green]", "").replace("[/green]", "")
-            text = text.replace("[red]", "").replace("[/red]", "")
-            text = text.replace("[yellow]", "").replace("[/yellow]", "")
-            text = text.replace("[cyan]", "").replace("[/cyan]", "")
-            print(text)
+            print(_TAG_RE.sub('', str(args[0]) if args else ''))
     console = Console()
 
+_SYS = platform.system()
+_IS_MACOS = _SYS == 'Darwin'
+_IS_LINUX = _SYS == 'Linux'
+_IS_WINDOWS = _SYS == 'Windows'
 
-def print_banner():
-    banner = """
+# External tools, looked up once instead of discovering a missing one via a failed exec
+_TOOLS = {
+    tool: shutil.which(tool)
+    for tool in ('wipefs', 'lsblk', 'dd', 'diskutil', 'mkfs.ext4', 'umount', 'sync', 'tar', 'pigz')
+}
+
+# Optional io_uring binding (python-liburing) for the Linux fast write path
+try:
+    import liburing
+    HAS_LIBURING = True
+except ImportError:
+    HAS_LIBURING = False
+
+# Optional ISA-L gzip (python-isal), several times faster than zlib's inflate
+try:
+    from isal import igzip
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
+# io_uring write pipeline: URING_QUEUE_DEPTH chunks in flight, each read into
+# a registered page-aligned buffer and then written to the device with O_DIRECT
+URING_CHUNK_SIZE = 1024 * 1024
+URING_QUEUE_DEPTH = 32
+URING_SQPOLL_IDLE_MS = 2000
+URING_CQ_SPIN = 200
+DIRECT_IO_ALIGNMENT = 4096
+
+# copy_file_range/sendfile fallback: bytes handed to the kernel per call
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Short-lived cache of the last USB scan, shared between runs. Root (the
+# normal case, via sudo) keeps it under /var/run rather than a home
+# directory the invoking user may be able to write to
+if hasattr(os, 'geteuid') and os.geteuid() == 0:
+    USB_CACHE_FILE = Path("/var/run/coldstar/usb_enum.json")
+else:
+    USB_CACHE_FILE = Path.home() / ".cache" / "coldstar" / "usb_enum.json"
+USB_CACHE_TTL = 5
+
+# dd block size on macOS raw disks; larger blocks don't help on USB sticks
+MACOS_DD_BLOCK = 1024 * 1024
+
+# Seconds between progress requests sent to BSD dd on macOS
+DD_PROGRESS_INTERVAL = 5
+
+# Maximum number of `diskutil info` probes running at once on macOS
+DISKUTIL_CONCURRENCY = 8
+
+# ioctl to flush and invalidate a block device's buffer cache (<linux/fs.h>)
+BLKFLSBUF = 0x1261
+
+# Pipe buffer between pigz and tar, so decompression can run ahead during mkfs
+PIPE_BUFFER_SIZE = 1 << 20
+# Seconds tar may take to unpack the filesystem tarball onto the device
+EXTRACT_TIMEOUT = 300
+
+
+_BANNER = """
 ╔═══════════════════════════════════════════════════════════╗
 ║         SOLANA COLD WALLET - USB FLASH TOOL               ║
 ╠═══════════════════════════════════════════════════════════╣
@@ -46,12 +118,15 @@ def print_banner():
 ║  WARNING: This will erase ALL data on the target device!  ║
 ╚═══════════════════════════════════════════════════════════╝
 """
-    console.print(banner)
+
+
+def print_banner():
+    console.print(_BANNER)
 
 
 def check_root():
     # On macOS, diskutil can work without root for some operations
-    if platform.system() == 'Darwin':
+    if _IS_MACOS:
         # Just warn but don't exit
         if os.geteuid() != 0:
             console.print("[yellow]Note: Running without root. Some operations may require sudo.[/yellow]")
@@ -64,82 +139,222 @@ def check_root():
         sys.exit(1)
 
 
+IMAGE_NAMES = (
+    "solana-cold-wallet.img",
+    "solana-cold-wallet.iso",
+    "solana-cold-wallet.tar.gz",
+)
+IMAGE_DIRS = ("./output", ".")
+
+
 def find_image() -> Path:
     """Find the cold wallet image file"""
-    search_paths = [
-        Path("./output/solana-cold-wallet.img"),
-        Path("./output/solana-cold-wallet.tar.gz"),
-        Path("./solana-cold-wallet.img"),
-        Path("./solana-cold-wallet.tar.gz"),
-    ]
-    
-    for path in search_paths:
-        if path.exists():
-            return path
+    # One directory read per location instead of a stat per candidate
+    for directory in IMAGE_DIRS:
+        try:
+            with os.scandir(directory) as it:
+                names = {entry.name for entry in it if entry.is_file()}
+        except FileNotFoundError:
+            continue
+        
+        for name in IMAGE_NAMES:
+            if name in names:
+                return Path(directory) / name
     
     return None
 
 
-def list_usb_devices() -> list:
-    """List available USB block devices"""
+def _mounted_partitions(node: dict) -> list:
+    """Collect (device, mountpoint) pairs for an lsblk JSON node and its children"""
+    mounted = []
+    if node.get('mountpoint'):
+        mounted.append((f"/dev/{node['name']}", node['mountpoint']))
+    for child in node.get('children') or []:
+        mounted.extend(_mounted_partitions(child))
+    return mounted
+
+
+# Parsed `diskutil info` per /dev/diskN, kept for the life of the process so
+# enumeration and the later block-size probe share one diskutil run per disk
+_DISKUTIL_CACHE = {}
+
+_BLOCK_SIZE_RE = re.compile(r'Device Block Size:\s+(\d+)')
+
+
+def _parse_diskutil_info(text: str) -> dict:
+    """Pull size, model and block size out of `diskutil info` output"""
+    size = "Unknown"
+    model = "USB Device"
+    
+    for info_line in text.split('\n'):
+        if 'Disk Size:' in info_line:
+            # Extract size (e.g., "32.0 GB")
+            parts = info_line.split()
+            for i, p in enumerate(parts):
+                if 'GB' in p or 'MB' in p:
+                    if i > 0:
+                        size = f"{parts[i-1]} {p}"
+                    break
+        elif 'Device / Media Name:' in info_line:
+            model = info_line.split(':', 1)[1].strip()
+    
+    match = _BLOCK_SIZE_RE.search(text)
+    block_size = int(match.group(1)) if match else 512
+    
+    return {'size': size, 'model': model, 'block_size': block_size}
+
+
+def _diskutil_info(disk: str) -> dict:
+    """Memoized `diskutil info` for one disk; None if diskutil fails"""
+    if disk not in _DISKUTIL_CACHE:
+        result = subprocess.run(
+            ['diskutil', 'info', disk],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode != 0:
+            return None
+        _DISKUTIL_CACHE[disk] = _parse_diskutil_info(result.stdout)
+    return _DISKUTIL_CACHE[disk]
+
+
+def _device_block_size(device: str) -> int:
+    """Block size of a macOS disk as reported by diskutil"""
+    info = _diskutil_info(device)
+    return info['block_size'] if info else 512
+
+
+async def _diskutil_info_async(disk_name: str, limit: asyncio.Semaphore) -> dict:
+    """Run `diskutil info` for one disk; returns parsed info or None on failure"""
+    if disk_name in _DISKUTIL_CACHE:
+        return _DISKUTIL_CACHE[disk_name]
+    
+    async with limit:
+        proc = await asyncio.create_subprocess_exec(
+            'diskutil', 'info', disk_name,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None
+    
+    if proc.returncode != 0:
+        return None
+    
+    info = _parse_diskutil_info(stdout.decode(errors='replace'))
+    _DISKUTIL_CACHE[disk_name] = info
+    return info
+
+
+async def _diskutil_info_all(disk_names: list) -> list:
+    limit = asyncio.Semaphore(DISKUTIL_CONCURRENCY)
+    return await asyncio.gather(*(_diskutil_info_async(name, limit) for name in disk_names))
+
+
+def _invalidate_usb_cache():
+    try:
+        USB_CACHE_FILE.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _load_usb_cache():
+    """Return cached devices if the last scan is younger than USB_CACHE_TTL"""
+    try:
+        st = USB_CACHE_FILE.stat()
+        if time.time() - st.st_mtime >= USB_CACHE_TTL:
+            return None
+        # Only trust a file we own that nobody else can rewrite
+        if hasattr(os, 'geteuid') and (st.st_uid != os.geteuid() or st.st_mode & 0o022):
+            return None
+        cached = json.loads(USB_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    
+    # Monotonic time going backwards means the machine rebooted
+    if cached.get('system') != _SYS or cached.get('monotonic', 0) > time.monotonic():
+        return None
+    
+    return cached.get('devices')
+
+
+def _save_usb_cache(devices: list):
+    try:
+        USB_CACHE_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = USB_CACHE_FILE.with_suffix('.tmp')
+        tmp_file.write_text(json.dumps({
+            'system': _SYS,
+            'monotonic': time.monotonic(),
+            'devices': devices,
+        }))
+        os.replace(tmp_file, USB_CACHE_FILE)
+    except OSError:
+        pass  # Caching is best effort
+
+
+def list_usb_devices(use_cache: bool = True) -> list:
+    """
+    List available USB block devices.
+
+    Reuses a scan from the last USB_CACHE_TTL seconds (e.g. a retry right
+    after a cancelled flash) unless use_cache is False.
+    """
+    if use_cache:
+        cached = _load_usb_cache()
+        if cached is not None:
+            return cached
+    
+    devices = _scan_usb_devices()
+    if devices:
+        _save_usb_cache(devices)
+    return devices
+
+
+def _scan_usb_devices() -> list:
+    """Enumerate USB block devices with diskutil (macOS) or lsblk (Linux)"""
     devices = []
     
     # macOS support using diskutil
-    if platform.system() == 'Darwin':
+    if _IS_MACOS:
         try:
             result = subprocess.run(
-                ['diskutil', 'list'],
-                capture_output=True,
-                text=True
+                ['diskutil', 'list', '-plist', 'external', 'physical'],
+                capture_output=True
             )
             
             if result.returncode != 0:
                 console.print("[yellow]Warning: Could not list devices with diskutil[/yellow]")
                 return devices
             
-            # Parse diskutil output
-            lines = result.stdout.split('\n')
-            current_disk = None
+            # Identifiers and sizes come straight from the plist
+            listing = plistlib.loads(result.stdout)
+            disks = [
+                (f"/dev/{entry['DeviceIdentifier']}", entry.get('Size'))
+                for entry in listing.get('AllDisksAndPartitions', [])
+                if 'DeviceIdentifier' in entry
+            ]
             
-            for line in lines:
-                # Look for disk identifiers
-                if '/dev/disk' in line and '(external' in line:
-                    parts = line.split()
-                    for part in parts:
-                        if part.startswith('/dev/disk'):
-                            disk_name = part.rstrip(':')
-                            
-                            # Get detailed info
-                            info_result = subprocess.run(
-                                ['diskutil', 'info', disk_name],
-                                capture_output=True,
-                                text=True,
-                                timeout=5
-                            )
-                            
-                            if info_result.returncode == 0:
-                                size = "Unknown"
-                                model = "USB Device"
-                                
-                                for info_line in info_result.stdout.split('\n'):
-                                    if 'Disk Size:' in info_line:
-                                        # Extract size (e.g., "32.0 GB")
-                                        parts = info_line.split()
-                                        for i, p in enumerate(parts):
-                                            if 'GB' in p or 'MB' in p:
-                                                if i > 0:
-                                                    size = f"{parts[i-1]} {p}"
-                                                break
-                                    elif 'Device / Media Name:' in info_line:
-                                        model = info_line.split(':', 1)[1].strip()
-                                
-                                devices.append({
-                                    'name': disk_name.replace('/dev/', ''),
-                                    'path': disk_name,
-                                    'size': size,
-                                    'model': model
-                                })
-                            break
+            # The list plist has no model name, so only that (and the block
+            # size) needs a diskutil info probe; run them concurrently
+            disk_names = [name for name, _ in disks]
+            infos = asyncio.run(_diskutil_info_all(disk_names))
+            
+            for (disk_name, size_bytes), info in zip(disks, infos):
+                if size_bytes:
+                    size = f"{size_bytes / 1e9:.1f} GB"
+                else:
+                    size = info['size'] if info else "Unknown"
+                devices.append({
+                    'name': disk_name.replace('/dev/', ''),
+                    'path': disk_name,
+                    'size': size,
+                    'model': info['model'] if info else "USB Device"
+                })
             
             return devices
             
@@ -150,24 +365,20 @@ def list_usb_devices() -> list:
     # Linux support using lsblk
     try:
         result = subprocess.run(
-            ['lsblk', '-d', '-o', 'NAME,SIZE,TYPE,TRAN,MODEL', '-n'],
+            ['lsblk', '-d', '-J', '-o', 'NAME,SIZE,TYPE,TRAN,MODEL'],
             capture_output=True,
             text=True
         )
         
-        for line in result.stdout.strip().split('\n'):
-            parts = line.split()
-            if len(parts) >= 4:
-                name, size, dtype, tran = parts[0], parts[1], parts[2], parts[3]
-                model = ' '.join(parts[4:]) if len(parts) > 4 else 'Unknown'
-                
-                if tran == 'usb' and dtype == 'disk':
-                    devices.append({
-                        'name': name,
-                        'path': f'/dev/{name}',
-                        'size': size,
-                        'model': model
-                    })
+        data = json.loads(result.stdout)
+        for d in data.get('blockdevices', []):
+            if d.get('tran') == 'usb' and d.get('type') == 'disk':
+                devices.append({
+                    'name': d['name'],
+                    'path': f"/dev/{d['name']}",
+                    'size': d.get('size') or 'Unknown',
+                    'model': (d.get('model') or 'Unknown').strip()
+                })
     except Exception as e:
         console.print(f"[yellow]Warning: Could not list devices: {e}[/yellow]")
     
@@ -208,24 +419,46 @@ def select_device(devices: list) -> str:
             
             idx = int(choice) - 1
             if 0 <= idx < len(devices):
-                return devices[idx]['path']
+                path = devices[idx]['path']
+                if not os.path.exists(path):
+                    # Cached scan is out of date, enumerate again
+                    console.print(f"[yellow]{path} is no longer present, rescanning...[/yellow]")
+                    _invalidate_usb_cache()
+                    return select_device(list_usb_devices(use_cache=False))
+                return path
             else:
                 console.print("[red]Invalid selection[/red]")
         except ValueError:
             console.print("[red]Please enter a number[/red]")
 
 
+async def _umount(partition: str) -> int:
+    proc = await asyncio.create_subprocess_exec(
+        'umount', partition,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        await asyncio.wait_for(proc.communicate(), timeout=10)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise TimeoutError("umount timed out")
+    return proc.returncode
+
+
+async def _umount_all(partitions: list) -> list:
+    return await asyncio.gather(*(_umount(p) for p in partitions), return_exceptions=True)
+
+
 def unmount_all_partitions(device: str) -> bool:
     """Unmount all partitions on a device"""
-    is_macos = platform.system() == 'Darwin'
-    is_windows = platform.system() == 'Windows'
-    
-    if is_windows:
+    if _IS_WINDOWS:
         console.print("[yellow]Windows disk unmounting not implemented[/yellow]")
         return True
     
     try:
-        if is_macos:
+        if _IS_MACOS:
             # Use diskutil to unmount all partitions
             console.print(f"Unmounting all partitions on {device}...")
             result = subprocess.run(
@@ -246,34 +479,30 @@ def unmount_all_partitions(device: str) -> bool:
             # Linux: Find and unmount all partitions
             console.print(f"Unmounting partitions on {device}...")
             
-            # Get list of mounted partitions for this device
+            # Query mounts now, not at enumeration time, so a partition
+            # automounted since then is not left mounted under the write
             result = subprocess.run(
-                ['lsblk', '-ln', '-o', 'NAME,MOUNTPOINT', device],
+                ['lsblk', '-J', '-o', 'NAME,MOUNTPOINT', device],
                 capture_output=True,
                 text=True,
                 timeout=10
             )
+            mounted = []
+            if result.returncode == 0:
+                for node in json.loads(result.stdout).get('blockdevices', []):
+                    mounted.extend(_mounted_partitions(node))
+            
+            # Independent filesystems, so unmount them all at once
+            partitions = [partition for partition, _ in mounted]
+            results = asyncio.run(_umount_all(partitions)) if partitions else []
             
             unmounted = 0
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    parts = line.split()
-                    if len(parts) >= 2:  # Has a mount point
-                        partition = f"/dev/{parts[0]}"
-                        mount_point = parts[1]
-                        
-                        try:
-                            umount_result = subprocess.run(
-                                ['umount', partition],
-                                capture_output=True,
-                                text=True,
-                                timeout=10
-                            )
-                            if umount_result.returncode == 0:
-                                console.print(f"[green]✓ Unmounted {partition}[/green]")
-                                unmounted += 1
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Could not unmount {partition}: {e}[/yellow]")
+            for partition, result in zip(partitions, results):
+                if isinstance(result, Exception):
+                    console.print(f"[yellow]Warning: Could not unmount {partition}: {result}[/yellow]")
+                elif result == 0:
+                    console.print(f"[green]✓ Unmounted {partition}[/green]")
+                    unmounted += 1
             
             if unmounted > 0:
                 console.print(f"[green]✓ Unmounted {unmounted} partition(s)[/green]")
@@ -288,15 +517,20 @@ def unmount_all_partitions(device: str) -> bool:
         return False
 
 
-def wipe_disk_signatures(device: str) -> bool:
+def wipe_disk_signatures(device: str, image: Path = None) -> bool:
     """Wipe disk signatures and partition tables"""
-    is_macos = platform.system() == 'Darwin'
-    is_windows = platform.system() == 'Windows'
+    if image is not None and str(image).endswith(('.img', '.iso')):
+        # The raw image is written from sector 0 and replaces the partition table
+        return True
     
-    if is_windows or is_macos:
+    if _IS_WINDOWS or _IS_MACOS:
         # Skip signature wiping on Windows and macOS (dd will overwrite anyway)
         return True
     
+    if not _TOOLS['wipefs']:
+        # wipefs not installed, skip
+        return True
+    
     try:
         console.print(f"Wiping partition signatures on {device}...")
         
@@ -311,8 +545,8 @@ def wipe_disk_signatures(device: str) -> bool:
         if result.returncode == 0:
             console.print("[green]✓ Disk signatures wiped[/green]")
             return True
-        else:
-            # wipefs might not be available, try dd as fallback
+        elif _TOOLS['dd']:
+            # wipefs failed, try dd as fallback
             console.print("[yellow]Trying alternative method...[/yellow]")
             dd_result = subprocess.run(
                 ['dd', 'if=/dev/zero', f'of={device}', 'bs=512', 'count=1'],
@@ -324,13 +558,10 @@ def wipe_disk_signatures(device: str) -> bool:
             if dd_result.returncode == 0:
                 console.print("[green]✓ Partition table cleared[/green]")
                 return True
+        
+        console.print("[yellow]Warning: Could not wipe signatures[/yellow]")
+        return False
             
-            console.print("[yellow]Warning: Could not wipe signatures[/yellow]")
-            return False
-            
-    except FileNotFoundError:
-        # wipefs not found, skip
-        return True
     except Exception as e:
         console.print(f"[yellow]Warning: {e}[/yellow]")
         return False
@@ -338,9 +569,7 @@ def wipe_disk_signatures(device: str) -> bool:
 
 def check_for_keypair(device: str) -> bool:
     """Check if a keypair.json exists on the USB drive (macOS only)"""
-    is_macos = platform.system() == 'Darwin'
-    
-    if not is_macos:
+    if not _IS_MACOS:
         return False
     
     try:
@@ -397,13 +626,459 @@ def confirm_flash(device: str, image: Path) -> bool:
     return confirm == 'y'
 
 
+def kernel_supports_io_uring() -> bool:
+    """Check for Linux 5.6+, which has the fixed-buffer and linked ops we use"""
+    if not _IS_LINUX:
+        return False
+    try:
+        major, minor = (int(part) for part in platform.release().split('.')[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (5, 6)
+
+
+def _align_up(value: int, alignment: int) -> int:
+    return (value + alignment - 1) // alignment * alignment
+
+
+def _uring_peek(ring, cqe) -> bool:
+    """Non-blocking check for another completion; True if cqe was filled"""
+    try:
+        return liburing.io_uring_peek_cqe(ring, cqe) == 0
+    except BlockingIOError:
+        return False
+
+
+def _advise_sequential(fd: int):
+    """Tell the kernel the image is read once, front to back, so it reads ahead"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+
+def open_image_fds(image: Path, device: str) -> tuple:
+    """
+    Open the image and device once for the Linux fast write paths.
+
+    Returns (src_fd, dst_fd, image_size). The device is opened with O_DIRECT;
+    the same pair of fds is shared by every write attempt.
+    """
+    src_fd = os.open(str(image), os.O_RDONLY)
+    try:
+        total = os.fstat(src_fd).st_size
+        _advise_sequential(src_fd)
+        dst_fd = os.open(device, os.O_WRONLY | os.O_DIRECT)
+    except OSError:
+        os.close(src_fd)
+        raise
+    return src_fd, dst_fd, total
+
+
+def _uring_queue_init(entries: int, ring) -> bool:
+    """
+    Set up the ring, preferring a kernel SQ polling thread.
+
+    With SQPOLL the submit path needs no io_uring_enter() while the poller
+    is awake. Without the privilege for it, fall back to SINGLE_ISSUER +
+    DEFER_TASKRUN (Linux 6.1+), then to a plain ring.
+
+    Returns False for a DEFER_TASKRUN ring, whose completions are only
+    posted on entering the kernel and so can never be found by spinning.
+    """
+    params = liburing.io_uring_params()
+    params.flags = liburing.IORING_SETUP_SQPOLL
+    params.sq_thread_idle = URING_SQPOLL_IDLE_MS
+    try:
+        liburing.io_uring_queue_init_params(entries, ring, params)
+        return True
+    except OSError:
+        pass
+
+    try:
+        liburing.io_uring_queue_init(
+            entries, ring,
+            liburing.IORING_SETUP_SINGLE_ISSUER | liburing.IORING_SETUP_DEFER_TASKRUN
+        )
+        return False
+    except OSError:
+        liburing.io_uring_queue_init(entries, ring, 0)
+        return True
+
+
+def _uring_wait(ring, cqe, spin: bool):
+    """
+    Wait for the next completion, spinning on the shared CQ ring first.
+
+    Streaming writes complete within microseconds of each other, so a short
+    poll of the mapped CQ usually finds one without entering the kernel.
+    """
+    if spin:
+        for _ in range(URING_CQ_SPIN):
+            if _uring_peek(ring, cqe):
+                return
+            os.sched_yield()
+    liburing.io_uring_wait_cqe(ring, cqe)
+
+
+def write_image_io_uring(src_fd: int, dst_fd: int, total: int, device: str) -> bool:
+    """
+    Write the image to the device through an io_uring pipeline.
+
+    Keeps URING_QUEUE_DEPTH read->write pairs in flight so the USB queue
+    never drains between blocks. Both fds and all buffers are registered
+    with the ring once, so each op references them by index. Returns False
+    if io_uring is unavailable or fails, in which case the caller falls
+    back to another write path.
+    """
+    if not HAS_LIBURING or not kernel_supports_io_uring():
+        return False
+
+    ring = None
+    buffers = []
+
+    try:
+        ring = liburing.io_uring()
+        cqe = liburing.io_uring_cqe()
+        spin = _uring_queue_init(URING_QUEUE_DEPTH * 2, ring)
+
+        # Anonymous mmaps are page-aligned, as O_DIRECT requires
+        buffers = [mmap.mmap(-1, URING_CHUNK_SIZE) for _ in range(URING_QUEUE_DEPTH)]
+        iov = liburing.iovec(buffers)
+        liburing.io_uring_register_buffers(ring, iov, len(buffers))
+        liburing.io_uring_register_files(ring, [src_fd, dst_fd], 2)
+
+        console.print(f"Writing image to {device} (io_uring, "
+                      f"{URING_QUEUE_DEPTH} x {URING_CHUNK_SIZE // (1024 * 1024)} MiB in flight)...")
+
+        free_slots = list(range(URING_QUEUE_DEPTH))
+        chunk_len = {}
+        offset = 0
+        written = 0
+        last_report = 0
+
+        while written < total:
+            # Queue a linked read (image -> buffer) + write (buffer -> device) per free slot
+            while free_slots and offset < total:
+                slot = free_slots.pop()
+                length = min(URING_CHUNK_SIZE, total - offset)
+                write_len = _align_up(length, DIRECT_IO_ALIGNMENT)
+                if write_len != length:
+                    # O_DIRECT needs block-aligned writes; zero-pad the tail
+                    buffers[slot][length:write_len] = bytes(write_len - length)
+
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read_fixed(sqe, 0, iov[slot].iov_base, length, offset, slot)
+                # Buffered file reads may block; punt them to io-wq straight away
+                # rather than stalling the submitter. Device writes stay inline.
+                sqe.flags |= liburing.IOSQE_FIXED_FILE | liburing.IOSQE_IO_LINK | liburing.IOSQE_ASYNC
+                liburing.io_uring_sqe_set_data64(sqe, slot << 1)
+
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_write_fixed(sqe, 1, iov[slot].iov_base, write_len, offset, slot)
+                sqe.flags |= liburing.IOSQE_FIXED_FILE
+                liburing.io_uring_sqe_set_data64(sqe, (slot << 1) | 1)
+
+                chunk_len[slot] = length
+                offset += length
+
+            liburing.io_uring_submit(ring)
+            _uring_wait(ring, cqe, spin)
+
+            # Drain every completion that is already available
+            while True:
+                res, user_data = cqe.res, cqe.user_data
+                liburing.io_uring_cqe_seen(ring, cqe)
+
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res))
+
+                slot = user_data >> 1
+                if user_data & 1:
+                    written += chunk_len.pop(slot)
+                    free_slots.append(slot)
+                elif res != chunk_len[slot]:
+                    # A short read would have cancelled the linked write
+                    raise OSError(errno.EIO, "Short read from image")
+
+                if not _uring_peek(ring, cqe):
+                    break
+
+            if written - last_report >= 64 * 1024 * 1024 or written == total:
+                last_report = written
+                print(f"\r  {written // (1024 * 1024)} / {total // (1024 * 1024)} MiB written",
+                      end="", flush=True)
+
+        print()
+        os.fdatasync(dst_fd)
+        console.print(f"[cyan]{total} bytes copied via io_uring[/cyan]")
+        return True
+
+    except Exception as e:
+        console.print(f"[yellow]io_uring write unavailable ({e}), falling back[/yellow]")
+        return False
+    finally:
+        if ring is not None:
+            try:
+                liburing.io_uring_queue_exit(ring)
+            except Exception:
+                pass
+        for buf in buffers:
+            buf.close()
+
+
+def write_image_copy_file_range(src_fd: int, dst_fd: int, total: int, device: str) -> bool:
+    """
+    Copy the image to the device inside the kernel, with no userspace buffer.
+
+    Uses copy_file_range(2), falling back to sendfile(2) on kernels that
+    refuse copy_file_range to a block device. Returns False if neither is
+    usable so the caller can fall back to dd.
+    """
+    if not _IS_LINUX:
+        return False
+
+    try:
+        # Source offsets are passed explicitly; sendfile still writes at the
+        # device's file position, which a previous attempt may have moved
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        if total % DIRECT_IO_ALIGNMENT != 0:
+            # O_DIRECT needs every write block-aligned, including the last one
+            flags = fcntl.fcntl(dst_fd, fcntl.F_GETFL)
+            fcntl.fcntl(dst_fd, fcntl.F_SETFL, flags & ~os.O_DIRECT)
+
+        console.print(f"Writing image to {device} (in-kernel copy)...")
+
+        use_sendfile = not hasattr(os, 'copy_file_range')
+        offset = 0
+        iterations = 0
+        while offset < total:
+            count = min(COPY_CHUNK_SIZE, total - offset)
+            if not use_sendfile:
+                try:
+                    written = os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+                except OSError as e:
+                    if offset or e.errno not in (errno.EINVAL, errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP):
+                        raise
+                    use_sendfile = True
+                    continue
+            else:
+                written = os.sendfile(dst_fd, src_fd, offset, count)
+
+            if written == 0:
+                raise OSError(errno.EIO, "Unexpected end of image")
+            offset += written
+            iterations += 1
+
+            if iterations % 4 == 0 or offset == total:
+                print(f"\r  {offset // (1024 * 1024)} / {total // (1024 * 1024)} MiB written",
+                      end="", flush=True)
+
+        print()
+        os.fdatasync(dst_fd)
+        console.print(f"[cyan]{total} bytes copied[/cyan]")
+        return True
+
+    except OSError as e:
+        console.print(f"[yellow]In-kernel copy unavailable ({e}), falling back to dd[/yellow]")
+        return False
+
+
+def flush_device(device: str) -> bool:
+    """
+    Flush only the target device instead of running a system-wide sync.
+
+    Linux: fdatasync plus BLKFLSBUF to drop the device's buffers. macOS:
+    F_FULLFSYNC, which also flushes the drive's own write cache.
+    """
+    try:
+        fd = os.open(device, os.O_WRONLY)
+    except OSError:
+        return False
+    try:
+        if _IS_MACOS and hasattr(fcntl, 'F_FULLFSYNC'):
+            fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+        else:
+            os.fdatasync(fd)
+            if _IS_LINUX:
+                try:
+                    fcntl.ioctl(fd, BLKFLSBUF)
+                except OSError:
+                    pass  # Not a block device (or no CAP_SYS_ADMIN); data is synced anyway
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def write_image_dd(image: Path, device: str) -> bool:
+    """Write the image to the device with dd"""
+    target_device = device
+    if _IS_MACOS:
+        # Always write through the raw device, which bypasses the buffer cache
+        # but needs I/O aligned to the device block size
+        target_device = re.sub(r'^/dev/disk', '/dev/rdisk', device)
+        if target_device != device:
+            console.print(f"[cyan]Using raw disk device for faster writes: {target_device}[/cyan]")
+        block_size = 1 << (max(_device_block_size(device), MACOS_DD_BLOCK) - 1).bit_length()
+        bs = f'bs={block_size // 1024}k'
+    else:
+        bs = 'bs=16M'
+
+    cmd = ['dd', f'if={image}', f'of={target_device}', bs]
+
+    # Add status reporting. Write around the page cache (oflag=direct, GNU dd
+    # drops it for a short final block) and flush once with a single fdatasync
+    # at the end instead of syncing every block (oflag=sync)
+    if not _IS_MACOS:
+        cmd.extend(['status=progress', 'iflag=fullblock', 'oflag=direct', 'conv=fdatasync'])
+
+    console.print(f"Writing image to {target_device}...")
+    console.print("[yellow]This may take 5-15 minutes depending on USB speed...[/yellow]")
+
+    returncode, stderr = _run_dd_with_progress(cmd, timeout=1800)
+
+    if returncode != 0:
+        console.print(f"[red]Error during write:[/red]")
+        console.print(f"[red]{stderr}[/red]")
+        return False
+
+    # Show the final dd statistics; progress updates were already echoed live
+    stats = [line for line in stderr.replace('\r', '\n').split('\n')
+             if 'bytes' in line or 'copied' in line or 'transferred' in line]
+    if stats:
+        console.print("[cyan]Write statistics:[/cyan]")
+        console.print(f"[cyan]{stats[-1].strip()}[/cyan]")
+
+    return True
+
+
+def _run_dd_with_progress(cmd: list, timeout: int) -> tuple:
+    """
+    Run dd and echo its progress output as it arrives.
+
+    GNU dd prints status=progress itself; BSD dd on macOS only reports when
+    signalled, so it gets SIGINFO every DD_PROGRESS_INTERVAL seconds.
+    Returns (returncode, stderr text).
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, bufsize=0)
+    err_fd = proc.stderr.fileno()
+    os.set_blocking(err_fd, False)
+
+    output = bytearray()
+    started = last_signal = time.monotonic()
+    try:
+        while True:
+            ready, _, _ = select.select([err_fd], [], [], 1.0)
+            if ready:
+                chunk = os.read(err_fd, 4096)
+                if not chunk:
+                    break
+                output += chunk
+                sys.stdout.buffer.write(chunk)
+                sys.stdout.buffer.flush()
+
+            now = time.monotonic()
+            if now - started > timeout:
+                proc.kill()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if _IS_MACOS and now - last_signal >= DD_PROGRESS_INTERVAL and proc.poll() is None:
+                proc.send_signal(signal.SIGINFO)
+                last_signal = now
+
+        returncode = proc.wait()
+    finally:
+        proc.stderr.close()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    print()
+    return returncode, output.decode(errors='replace')
+
+
+def extract_tarball(image: Path, mount_point: str) -> bool:
+    """
+    Extract a .tar.gz rootfs onto the mounted device.
+
+    Used when pigz is not installed (flash_image sends that case to
+    format_and_extract_pigz). Tries a streaming tarfile read through
+    ISA-L's gzip, then plain tar.
+    """
+    if HAS_ISAL:
+        try:
+            with igzip.open(str(image), 'rb') as gz_file:
+                with tarfile.open(fileobj=gz_file, mode='r|') as tar:
+                    # The rootfs is our own build output and needs device nodes,
+                    # absolute symlinks and ownership restored as-is
+                    if hasattr(tarfile, 'fully_trusted_filter'):
+                        tar.extractall(mount_point, filter='fully_trusted')
+                    else:
+                        tar.extractall(mount_point)
+            return True
+        except Exception as e:
+            console.print(f"[yellow]ISA-L extraction failed ({e}), falling back to tar[/yellow]")
+
+    result = subprocess.run(
+        ['tar', '-xzf', str(image), '-C', mount_point],
+        timeout=300
+    )
+    return result.returncode == 0
+
+
+def format_and_extract_pigz(image: Path, device: str, mount_point: str) -> bool:
+    """
+    Format the device while pigz is already decompressing the tarball.
+
+    pigz starts together with mkfs.ext4 and fills an enlarged pipe, so gzip
+    inflate overlaps with formatting. tar reads the pipe once the new
+    filesystem is mounted.
+    """
+    mkfs = subprocess.Popen(['mkfs.ext4', '-F', device])
+    pigz = subprocess.Popen(['pigz', '-dc', str(image)], stdout=subprocess.PIPE)
+    tar = None
+    mounted = extracted = False
+    try:
+        if hasattr(fcntl, 'F_SETPIPE_SZ'):
+            try:
+                fcntl.fcntl(pigz.stdout.fileno(), fcntl.F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+            except OSError:
+                pass  # Above /proc/sys/fs/pipe-max-size, keep the default
+
+        if mkfs.wait(timeout=60) != 0:
+            return False
+        if subprocess.run(['mount', device, mount_point], timeout=30).returncode != 0:
+            return False
+        mounted = True
+
+        tar = subprocess.Popen(['tar', '-x', '-C', mount_point], stdin=pigz.stdout)
+        # Only tar should hold the read end, so pigz sees EPIPE if tar exits
+        pigz.stdout.close()
+        tar_rc = tar.wait(timeout=EXTRACT_TIMEOUT)
+        extracted = pigz.wait(timeout=30) == 0 and tar_rc == 0
+        return extracted
+    finally:
+        for proc in (mkfs, pigz, tar):
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        if mounted and not extracted:
+            # Nothing writes to the filesystem any more; don't leave it mounted
+            try:
+                subprocess.run(['umount', mount_point], timeout=60)
+            except subprocess.TimeoutExpired:
+                pass
+
+
 def flash_image(device: str, image: Path) -> bool:
     """Flash the image to the USB device"""
     console.print(f"\n[bold]Flashing {image.name} to {device}...[/bold]")
     console.print("This may take several minutes.\n")
     
-    is_macos = platform.system() == 'Darwin'
-    is_linux = platform.system() == 'Linux'
     
     try:
         # Step 1: Unmount all partitions
@@ -412,62 +1087,59 @@ def flash_image(device: str, image: Path) -> bool:
             console.print("[yellow]Warning: Some partitions may still be mounted[/yellow]")
             console.print("[yellow]Attempting to continue...[/yellow]")
         
-        # Step 2: Wipe disk signatures (Linux only)
-        if is_linux:
+        # Step 2: Wipe disk signatures (Linux only, filesystem images only)
+        if _IS_LINUX and not str(image).endswith(('.img', '.iso')):
             console.print("\n[bold]Step 2: Clearing partition table...[/bold]")
-            wipe_disk_signatures(device)
+            wipe_disk_signatures(device, image)
         
         console.print("\n[bold]Step 3: Writing image...[/bold]")
         
         if str(image).endswith('.img') or str(image).endswith('.iso'):
-            # For macOS, use rdisk for faster writes
-            target_device = device
-            if is_macos and 'disk' in device:
-                target_device = device.replace('/dev/disk', '/dev/rdisk')
-                console.print(f"[cyan]Using raw disk device for faster writes: {target_device}[/cyan]")
-            
-            cmd = ['dd', f'if={image}', f'of={target_device}', 'bs=4m' if is_macos else 'bs=4M']
-            
-            # Add status reporting
-            if not is_macos:
-                cmd.extend(['status=progress', 'oflag=sync'])
-            
-            console.print(f"Writing image to {target_device}...")
-            console.print("[yellow]This may take 5-15 minutes depending on USB speed...[/yellow]")
-            
-            # Run dd with error output capture
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)
-            
-            if result.returncode != 0:
-                console.print(f"[red]Error during write:[/red]")
-                console.print(f"[red]{result.stderr}[/red]")
+            # Prefer the io_uring pipeline on Linux, then an in-kernel copy,
+            # and dd everywhere else
+            written = False
+            if _IS_LINUX:
+                try:
+                    src_fd, dst_fd, total = open_image_fds(image, device)
+                except OSError as e:
+                    console.print(f"[yellow]Could not open {device} for direct I/O ({e}), using dd[/yellow]")
+                else:
+                    try:
+                        written = (
+                            write_image_io_uring(src_fd, dst_fd, total, device)
+                            or write_image_copy_file_range(src_fd, dst_fd, total, device)
+                        )
+                    finally:
+                        os.close(src_fd)
+                        os.close(dst_fd)
+            if not written and not write_image_dd(image, device):
                 return False
-            
-            # Show dd statistics if available
-            if result.stderr:
-                console.print("[cyan]Write statistics:[/cyan]")
-                for line in result.stderr.split('\n'):
-                    if 'bytes' in line or 'copied' in line:
-                        console.print(f"[cyan]{line}[/cyan]")
         else:
             console.print("Formatting USB as ext4...")
-            subprocess.run(['mkfs.ext4', '-F', device], timeout=60)
-            
             mount_point = f"/tmp/usb_flash_{os.getpid()}"
             os.makedirs(mount_point, exist_ok=True)
             
-            subprocess.run(['mount', device, mount_point], timeout=30)
-            
-            console.print("Extracting filesystem...")
-            result = subprocess.run(
-                ['tar', '-xzf', str(image), '-C', mount_point],
-                timeout=300
-            )
+            if _TOOLS['pigz']:
+                console.print("Extracting filesystem...")
+                extracted = format_and_extract_pigz(image, device, mount_point)
+            else:
+                # Format and mount in one shell; mount only runs if mkfs succeeded
+                result = subprocess.run(
+                    ['sh', '-c', f'mkfs.ext4 -F {shlex.quote(device)} && '
+                                 f'mount {shlex.quote(device)} {shlex.quote(mount_point)}'],
+                    timeout=90
+                )
+                if result.returncode != 0:
+                    # Extracting now would unpack into the host's mount_point directory
+                    console.print(f"[red]Failed to format or mount {device}[/red]")
+                    return False
+                
+                console.print("Extracting filesystem...")
+                extracted = extract_tarball(image, mount_point)
             
-            subprocess.run(['sync'])
-            subprocess.run(['umount', mount_point], timeout=30)
+            subprocess.run(['sh', '-c', f'sync && umount {shlex.quote(mount_point)}'], timeout=60)
             
-            if result.returncode == 0:
+            if extracted:
                 console.print("\n[bold][green]SUCCESS! USB cold wallet created![/green][/bold]")
                 return True
             return False
@@ -475,11 +1147,12 @@ def flash_image(device: str, image: Path) -> bool:
         # Step 4: Sync to ensure all data is written
         console.print("\n[bold]Step 4: Finalizing...[/bold]")
         console.print("Syncing data to disk...")
-        sync_result = subprocess.run(['sync'], timeout=60)
+        if not flush_device(device):
+            subprocess.run(['sync'], timeout=60)
         console.print("[green]✓ Sync complete[/green]")
         
         # On macOS, verify installation and eject the disk
-        if is_macos:
+        if _IS_MACOS:
             console.print("\n[bold]Step 5: Verifying installation...[/bold]")
             
             # Check if installation was successful by looking for keypair
@@ -543,38 +1216,88 @@ def build_iso() -> Path:
         sys.exit(1)
 
 
+# Child-process entry for build_iso_quietly; the image path is the last line
+_BUILD_ISO_SCRIPT = "import flash_usb; print(flash_usb.build_iso())"
+
+
+def build_iso_quietly() -> Path:
+    """
+    Build the ISO in a child process with all of its output captured.
+
+    The builder and the tools it runs would otherwise write over the
+    device prompt. The log is only shown if the build fails.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, (here, os.environ.get('PYTHONPATH'))))}
+    result = subprocess.run(
+        [sys.executable, '-c', _BUILD_ISO_SCRIPT],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env
+    )
+    output = result.stdout.decode(errors='replace')
+    lines = output.strip().splitlines()
+    if result.returncode != 0 or not lines or not Path(lines[-1]).exists():
+        sys.stdout.write(output)
+        console.print("[red]Failed to build ISO[/red]")
+        sys.exit(1)
+    return Path(lines[-1])
+
+
 def main():
     print_banner()
     
     build_only = '--build-only' in sys.argv
+    use_cache = '--no-cache' not in sys.argv
     do_build = '--build' in sys.argv or build_only
     
     args = [a for a in sys.argv[1:] if not a.startswith('--')]
     
+    # When the image still has to be built, build it in the background while
+    # the user picks a device; the two don't depend on each other
+    image = None
+    image_future = None
+    executor = ThreadPoolExecutor(max_workers=1)
+    
     if do_build:
-        image = build_iso()
         if build_only:
+            image = build_iso()
             console.print(f"\n[green]Image created: {image}[/green]")
             console.print("\nTo flash to USB, run:")
             console.print(f"  sudo python3 flash_usb.py {image}")
             sys.exit(0)
+        image_future = executor.submit(build_iso_quietly)
     else:
         image = find_image()
         if not image:
             console.print("[yellow]No cold wallet image found.[/yellow]")
             console.print("Building new image...\n")
-            image = build_iso()
+            image_future = executor.submit(build_iso_quietly)
     
-    check_root()
+    try:
+        check_root()
+        
+        if args:
+            device = args[0]
+            if not device.startswith('/dev/'):
+                console.print(f"[red]Invalid device path: {device}[/red]")
+                sys.exit(1)
+        else:
+            devices = list_usb_devices(use_cache=use_cache)
+            device = select_device(devices)
+    except SystemExit:
+        if image_future is not None and not image_future.done():
+            # A running build can't be interrupted safely; let it finish so
+            # the image is usable next time
+            console.print("[yellow]Waiting for the image build to finish...[/yellow]")
+        raise
+    finally:
+        executor.shutdown(wait=False)
     
-    if args:
-        device = args[0]
-        if not device.startswith('/dev/'):
-            console.print(f"[red]Invalid device path: {device}[/red]")
-            sys.exit(1)
-    else:
-        devices = list_usb_devices()
-        device = select_device(devices)
+    if image_future is not None:
+        image = image_future.result()
+        console.print(f"[green]✓ Image built: {image}[/green]")
     
     if not confirm_flash(device, image):
         console.print("\n[yellow]Flash cancelled[/yellow]")
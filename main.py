@@ -10,34 +10,111 @@ B - Love U 3000
 
 import sys
 import os
+import datetime
 import tempfile
 import subprocess
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
 
 from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
 
-from config import APP_NAME, APP_VERSION, SOLANA_RPC_URL
+from config import APP_NAME, APP_VERSION, SOLANA_RPC_URL, LAMPORTS_PER_SOL
 from src.ui import (
     print_banner, print_success, print_error, print_info, print_warning,
     print_section_header, print_wallet_info, print_transaction_summary,
     print_device_list, select_menu_option, get_text_input, get_float_input,
     confirm_dangerous_action, print_explorer_link, clear_screen, console,
-    print_step
+    create_progress_bar, get_password_input, select_menu_index
 )
 from src.wallet import WalletManager, create_wallet_structure
 from src.usb import USBManager
 from src.network import SolanaNetwork
 from src.transaction import TransactionManager
 from src.iso_builder import ISOBuilder
+from build import SIGNER_DIR, record_signer_build, signer_build_matches, signer_source_hash
+
+
+# A blockhash stays valid for ~150 slots (~60s); leave headroom for signing and send
+BLOCKHASH_PREFETCH_MAX_AGE = 30.0
+
+# Delays between balance polls after a confirmed transaction (~400ms slots)
+BALANCE_POLL_BACKOFF = (0.1, 0.2, 0.4, 0.8, 1.5)
+
+_YES_NO = ("Yes", "No")
+
+# Pre-styled history status cells; Text objects bypass rich's markup parser per row
+_TX_SUCCESS = Text("✓ Success", style="green")
+_TX_FAILED = Text("✗ Failed", style="red")
+
+
+def _list_tx_files(directory, prefix: str) -> list:
+    """Names of prefix*.json files in directory, without building a Path per entry"""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(e.name for e in entries
+                          if e.name.startswith(prefix) and e.name.endswith(".json")
+                          and e.is_file(follow_symlinks=False))
+    except FileNotFoundError:
+        return []
+
+
+class _BlockhashCache:
+    """Keeps the latest blockhash for a short window so back-to-back sends skip the RPC"""
+    
+    def __init__(self, network: SolanaNetwork, ttl: float = 1.5):
+        self.network = network
+        self.ttl = ttl
+        self._value = None
+        self._fetched_at = 0.0
+    
+    def get(self):
+        if self._value is not None and time.monotonic() - self._fetched_at < self.ttl:
+            return self._value
+        
+        value = self.network.get_latest_blockhash()
+        if value:
+            self._value = value
+            self._fetched_at = time.monotonic()
+        return value
+    
+    def invalidate(self):
+        self._value = None
 
 
 class SolanaColdWalletCLI:
+    # Menu labels are fixed; dispatch is by position in the tuple
+    _NO_USB_OPTIONS = (
+        "1. Refresh (Check for USB)",
+        "2. Network Status",
+        "0. Exit",
+    )
+    _USB_DETECTED_OPTIONS = (
+        "1. Flash Cold Wallet OS to USB",
+        "2. Mount USB (Check for existing wallet)",
+        "3. Network Status",
+        "4. Refresh Devices",
+        "0. Exit",
+    )
+    
     def __init__(self):
         self.wallet_manager = WalletManager()
         self.usb_manager = USBManager()
         self.network = SolanaNetwork()
         self.transaction_manager = TransactionManager()
         self.iso_builder = ISOBuilder()
+        self._blockhash_cache = _BlockhashCache(self.network, ttl=1.5)
+        # {key: (value, expires_at)} for read-mostly RPCs hit on every redraw
+        self._rpc_cache = {}
+        # Background RPCs that can overlap with UI drawing
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._balance_future = None
+        # {signature: getTransaction result} filled by the batched history fetch
+        self._tx_details_cache = {}
         
         self.current_usb_device = None
         self.current_public_key = None
@@ -45,18 +122,77 @@ class SolanaColdWalletCLI:
     
     def _check_usb_for_wallet(self, mount_point: str) -> tuple:
         """Check if mounted USB has a cold wallet with pubkey.txt"""
-        pubkey_path = Path(mount_point) / "wallet" / "pubkey.txt"
-        if pubkey_path.exists():
-            with open(pubkey_path, 'r') as f:
-                return True, f.read().strip()
-        return False, None
+        try:
+            fd = os.open(os.path.join(mount_point, "wallet", "pubkey.txt"), os.O_RDONLY)
+        except FileNotFoundError:
+            return False, None
+        try:
+            # A base58 public key is at most 44 characters
+            data = os.read(fd, 256)
+        finally:
+            os.close(fd)
+        return True, data.decode().strip()
+    
+    def _get_cached_blockhash(self):
+        """Latest (blockhash, last_valid_block_height), reused for up to 1.5s"""
+        return self._blockhash_cache.get()
+    
+    def _cached_rpc(self, key, ttl, fetch):
+        entry = self._rpc_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry[1]:
+            return entry[0]
+        
+        value = fetch()
+        self._rpc_cache[key] = (value, now + ttl)
+        return value
+    
+    def _cached_is_connected(self):
+        """Node health, reused for up to 2s across menu redraws"""
+        return self._cached_rpc("is_connected", 2.0, self.network.is_connected)
+    
+    def _cached_get_balance(self, public_key):
+        """SOL balance for a key, reused for up to 500ms"""
+        return self._cached_rpc(("balance", public_key), 0.5,
+                                lambda: self.network.get_balance(public_key))
+    
+    def _invalidate_balance(self, public_key):
+        self._rpc_cache.pop(("balance", public_key), None)
+    
+    def _wait_for_balance_change(self, public_key, previous, timeout=5.0):
+        """Poll the balance with backoff until it differs from previous (or timeout); returns the last value"""
+        deadline = time.monotonic() + timeout
+        balance = self.network.get_balance(public_key)
+        for delay in BALANCE_POLL_BACKOFF:
+            if balance != previous or time.monotonic() + delay > deadline:
+                break
+            time.sleep(delay)
+            balance = self.network.get_balance(public_key)
+        self._rpc_cache[("balance", public_key)] = (balance, time.monotonic() + 0.5)
+        return balance
+    
+    def _prefetch_balance(self, public_key):
+        """Start the balance RPC now so it is in flight while the screen is drawn"""
+        # Goes through the balance cache, so the value is reused by later reads
+        self._balance_future = self._executor.submit(self._cached_get_balance, public_key)
     
     def _display_wallet_balance(self):
         if not self.current_public_key:
             return
         
         print_section_header("WALLET STATUS")
-        balance = self.network.get_balance(self.current_public_key)
+        future, self._balance_future = self._balance_future, None
+        if future is not None:
+            try:
+                balance = future.result(timeout=1.0)
+            except FutureTimeoutError:
+                # Still in flight; read through the balance cache instead
+                balance = self._cached_get_balance(self.current_public_key)
+            except Exception as e:
+                print_error(f"Error getting balance: {e}")
+                balance = None
+        else:
+            balance = self._cached_get_balance(self.current_public_key)
         print_wallet_info(self.current_public_key, balance)
         console.print()
     
@@ -78,7 +214,7 @@ class SolanaColdWalletCLI:
         clear_screen()
         print_banner()
         print_info(f"Network: {SOLANA_RPC_URL}")
-        if self.network.is_connected():
+        if self._cached_is_connected():
             print_success("Status: Connected")
         else:
             print_warning("Status: Offline")
@@ -100,25 +236,24 @@ class SolanaColdWalletCLI:
         print_warning("Please connect a USB drive to continue.")
         console.print()
         
-        options = [
-            "1. Refresh (Check for USB)",
-            "2. Network Status",
-            "0. Exit"
-        ]
-        
-        choice = select_menu_option(options, "Select an option:")
-        
-        if choice is None:
-            return
-        
-        choice_num = choice.split(".")[0].strip()
+        # Same order as _NO_USB_OPTIONS
+        handlers = (
+            self._refresh_devices,
+            self._network_status_screen,
+            self.exit_app,
+        )
         
-        if choice_num == "2":
-            self._draw_header()
-            self.show_network_status()
-            self._wait_for_key()
-        elif choice_num == "0":
-            self.exit_app()
+        index = select_menu_index(self._NO_USB_OPTIONS, "Select an option:")
+        if index is not None:
+            handlers[index]()
+    
+    def _refresh_devices(self):
+        self.usb_manager.detect_usb_devices(force=True)
+    
+    def _network_status_screen(self):
+        self._draw_header()
+        self.show_network_status()
+        self._wait_for_key()
     
     def _wait_for_key(self):
         console.print()
@@ -129,32 +264,23 @@ class SolanaColdWalletCLI:
         print_device_list(devices)
         console.print()
         
-        options = [
-            "1. Flash Cold Wallet OS to USB",
-            "2. Mount USB (Check for existing wallet)",
-            "3. Network Status",
-            "0. Exit"
-        ]
-        
-        choice = select_menu_option(options, "Select an option:")
-        
-        if choice is None:
-            return
+        # Same order as _USB_DETECTED_OPTIONS
+        handlers = (
+            lambda: self._flash_screen(devices),
+            lambda: self._mount_and_check_wallet(devices),
+            self._network_status_screen,
+            self._refresh_devices,
+            self.exit_app,
+        )
         
-        choice_num = choice.split(".")[0].strip()
-        
-        if choice_num == "1":
-            self._draw_header()
-            self.flash_cold_wallet()
-            self._wait_for_key()
-        elif choice_num == "2":
-            self._mount_and_check_wallet(devices)
-        elif choice_num == "3":
-            self._draw_header()
-            self.show_network_status()
-            self._wait_for_key()
-        elif choice_num == "0":
-            self.exit_app()
+        index = select_menu_index(self._USB_DETECTED_OPTIONS, "Select an option:")
+        if index is not None:
+            handlers[index]()
+    
+    def _flash_screen(self, devices=None):
+        self._draw_header()
+        self.flash_cold_wallet(devices)
+        self._wait_for_key()
     
     def _wallet_menu(self):
         """Launch the modern TUI interface when wallet is mounted"""
@@ -174,7 +300,7 @@ class SolanaColdWalletCLI:
         # When TUI exits, return to main loop
         return
     
-    def flash_cold_wallet(self):
+    def flash_cold_wallet(self, devices=None):
         """Build and flash cold wallet OS to USB"""
         print_section_header("FLASH COLD WALLET OS")
         
@@ -187,7 +313,9 @@ class SolanaColdWalletCLI:
         console.print()
         
         print_info("Detected USB devices:")
-        devices = self.usb_manager.detect_usb_devices()
+        # The menu that led here has just enumerated; only rescan if it found nothing
+        if not devices:
+            devices = self.usb_manager.detect_usb_devices()
         if not devices:
             print_error("No USB devices found. Please insert a USB drive.")
             return
@@ -217,7 +345,6 @@ class SolanaColdWalletCLI:
         console.print()
         
         # Simple yes/no confirmation is sufficient
-        from src.ui import select_menu_option
         confirm_choice = select_menu_option(
             ["Yes, erase and flash", "Cancel"],
             f"Erase and flash {device['device']}?"
@@ -234,14 +361,7 @@ class SolanaColdWalletCLI:
         
         # Build and flash the cold wallet
         try:
-            import time
-            
-            # Show progress through the build process
-            print_step(1, 7, "Initializing ISO builder...")
-            time.sleep(0.5)
-            
-            # The ISOBuilder will handle the actual animated steps
-            result_path = self.iso_builder.build_complete_iso("./output")
+            result_path = self._build_iso_with_progress("./output")
             
             if not result_path or not result_path.exists():
                 print_error("Failed to build cold wallet image")
@@ -262,7 +382,6 @@ class SolanaColdWalletCLI:
                 # Display the generated public key if available
                 if self.iso_builder.generated_pubkey:
                     console.print()
-                    from rich.panel import Panel
                     wallet_info = f"""[bold green]Wallet Generated Successfully![/bold green]
 
 [yellow]Public Key (Wallet Address):[/yellow]
@@ -281,7 +400,6 @@ Write down or photograph this address to receive payments."""
                 print_info("  4. Keep the USB offline and secure when not in use")
                 console.print()
                 
-                from rich.panel import Panel
                 security_msg = """[bold yellow]SECURITY REMINDERS:[/bold yellow]
 
 • This USB should ONLY be used on air-gapped computers
@@ -297,10 +415,29 @@ Write down or photograph this address to receive payments."""
         
         except Exception as e:
             print_error(f"Flash operation failed: {e}")
-            import traceback
             if "--debug" in sys.argv:
                 traceback.print_exc()
     
+    def _build_iso_with_progress(self, output_dir: str):
+        """Run the ISO build on a worker thread while the UI shows live stage progress"""
+        with create_progress_bar("Building cold wallet image") as progress:
+            task = progress.add_task("Initializing ISO builder...", total=7)
+            
+            def on_progress(step, total, message):
+                progress.update(task, completed=step - 1, total=total, description=message)
+            
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(self.iso_builder.build_complete_iso, output_dir, on_progress)
+                while not future.done():
+                    time.sleep(0.1)
+                
+                result_path = future.result()
+            
+            if result_path:
+                # Stages 6-7 (flash, keygen) run after the build returns
+                progress.update(task, completed=5, description="Image built")
+        return result_path
+    
     def _mount_and_check_wallet(self, devices):
         if len(devices) == 1:
             idx = 0
@@ -327,6 +464,7 @@ Write down or photograph this address to receive payments."""
             if is_wallet:
                 self.usb_is_cold_wallet = True
                 self.current_public_key = pubkey
+                self._prefetch_balance(pubkey)
                 self.current_usb_device = device
                 print_success("Cold wallet found on USB!")
                 print_info(f"Public Key: {pubkey}")
@@ -368,6 +506,7 @@ Write down or photograph this address to receive payments."""
         if self.wallet_manager.save_keypair():
             self.usb_is_cold_wallet = True
             self.current_public_key = public_key
+            self._prefetch_balance(public_key)
             self.current_usb_device = device
             
             print_success("✓ Wallet created successfully!")
@@ -398,16 +537,25 @@ Write down or photograph this address to receive payments."""
             print_error("Keypair not found on USB")
             return
         
-        # Load wallet (without password prompt)
-        self.wallet_manager.load_keypair(str(keypair_path))
-        # Note: load_keypair now returns None for encrypted wallets, which is fine
-        # We'll get the password later after SEND confirmation
+        # A send in the last SIGNING_SESSION_TTL seconds leaves the wallet unlocked
+        session = self.wallet_manager.get_cached_key_for_signing(str(keypair_path))
+        if session is None:
+            # Load wallet (without password prompt)
+            self.wallet_manager.load_keypair(str(keypair_path))
+            # Note: load_keypair now returns None for encrypted wallets, which is fine
+            # We'll get the password later after SEND confirmation
             
+        # Balance and blockhash are independent; fetch both while the user types
+        prefetch = ThreadPoolExecutor(max_workers=2)
         try:
             from_address = self.current_public_key
             print_info(f"From: {from_address}")
             
-            balance = self.network.get_balance(from_address)
+            balance_future = prefetch.submit(self._cached_get_balance, from_address)
+            blockhash_future = prefetch.submit(self.network.get_latest_blockhash)
+            prefetched_at = time.monotonic()
+            
+            balance = balance_future.result()
             if balance is not None:
                 print_info(f"Current balance: {balance:.9f} SOL")
             
@@ -432,16 +580,34 @@ Write down or photograph this address to receive payments."""
             print_transaction_summary(from_address, to_address, amount)
             console.print()
             
-            # Password IS the confirmation
-            from src.ui import get_password_input
-            password = get_password_input("Type your password to confirm transaction:")
-            
-            if not password:
-                print_info("Transaction cancelled")
-                return
+            if session is not None:
+                confirm_choice = select_menu_option(["Yes, send", "Cancel"], "Send this transaction?")
+                if not confirm_choice or "Cancel" in confirm_choice:
+                    print_info("Transaction cancelled")
+                    return
+                # The prompts may have outlasted the session, whose timer then wiped it
+                session = self.wallet_manager.get_cached_key_for_signing(str(keypair_path))
+                if session is not None:
+                    encrypted_container, password = session
+                else:
+                    password = get_password_input("Signing session expired. Type your password to sign:")
+                    if not password:
+                        print_info("Transaction cancelled")
+                        return
+            else:
+                # Password IS the confirmation
+                password = get_password_input("Type your password to confirm transaction:")
+                
+                if not password:
+                    print_info("Transaction cancelled")
+                    return
             
-            # Get fresh blockhash
-            blockhash_result = self.network.get_latest_blockhash()
+            # Use the prefetched blockhash unless the user took long enough for it to near expiry
+            blockhash_result = None
+            if time.monotonic() - prefetched_at < BLOCKHASH_PREFETCH_MAX_AGE:
+                blockhash_result = blockhash_future.result()
+            if not blockhash_result:
+                blockhash_result = self._get_cached_blockhash()
             if not blockhash_result:
                 print_error("Failed to get blockhash from network")
                 return
@@ -459,27 +625,34 @@ Write down or photograph this address to receive payments."""
             # Sign transaction securely with Rust signer
             print_info("Signing transaction securely...")
             
-            # Load encrypted container from wallet
-            encrypted_container = self.wallet_manager.load_encrypted_container(str(keypair_path), password)
-            if not encrypted_container:
-                print_error("Failed to load encrypted wallet container")
-                return
+            if session is None:
+                # Load encrypted container from wallet
+                encrypted_container = self.wallet_manager.load_encrypted_container(str(keypair_path), password)
+                if not encrypted_container:
+                    print_error("Failed to load encrypted wallet container")
+                    return
             
             signed_tx = self.transaction_manager.sign_transaction_secure(tx_bytes, encrypted_container, password)
             
             if not signed_tx:
                 return
+            if session is None:
+                # The password checked out; reuse it for the next few seconds of sends
+                self.wallet_manager.cache_key_for_signing(str(keypair_path), encrypted_container, password)
+            # A str can't be wiped, only dropped; the session keeps its own locked copy
+            password = None
             
             # Broadcast transaction
             print_info("Broadcasting transaction...")
             
-            import base64
-            tx_base64 = base64.b64encode(signed_tx).decode('utf-8')
-            
-            signature = self.network.send_transaction(tx_base64)
+            signature = self.network.send_transaction(signed_tx)
+            if not signature:
+                # The blockhash may be what the node rejected; fetch a fresh one next time
+                self._blockhash_cache.invalidate()
             
             if signature:
                 print_success("Transaction sent!")
+                self._invalidate_balance(from_address)
                 print_info(f"Signature: {signature}")
                 print_info("Waiting for confirmation...")
                 
@@ -488,9 +661,7 @@ Write down or photograph this address to receive payments."""
                     console.print()
                     
                     # Refresh balance after successful transaction
-                    import time
-                    time.sleep(2)  # Wait a bit for balance to update on chain
-                    new_balance = self.network.get_balance(from_address)
+                    new_balance = self._wait_for_balance_change(from_address, balance)
                     if new_balance is not None:
                         print_success(f"Updated balance: {new_balance:.9f} SOL")
                     
@@ -502,87 +673,9 @@ Write down or photograph this address to receive payments."""
                     print_explorer_link(signature)
         
         finally:
-            # CRITICAL: Clear key from memory
-            self.wallet_manager.clear_memory()
-    
-    def sign_transaction(self):
-        """Sign a transaction using the local wallet"""
-        print_section_header("SIGN TRANSACTION (LOCAL)")
-        
-        if not self.current_public_key:
-            print_error("No wallet connected. Mount a USB with a cold wallet first.")
-            return
-            
-        wallet_dir = Path(self.usb_manager.mount_point) / "wallet"
-        keypair_path = wallet_dir / "keypair.json"
-        
-        if not keypair_path.exists():
-            print_error("Keypair not found on USB")
-            return
-        
-        # Load encrypted container for secure signing
-        encrypted_container = self.wallet_manager.load_encrypted_container(str(keypair_path))
-        if not encrypted_container:
-            print_error("Failed to load encrypted wallet container")
-            return
-            
-        # Select transaction file
-        if not self.usb_manager.mount_point:
-             print_error("No USB mounted.")
-             return
-
-        inbox_dir = Path(self.usb_manager.mount_point) / "inbox"
-        outbox_dir = Path(self.usb_manager.mount_point) / "outbox"
-        outbox_dir.mkdir(exist_ok=True)
-        
-        unsigned_files = list(inbox_dir.glob("unsigned_*.json")) if inbox_dir.exists() else []
-        
-        if not unsigned_files:
-            print_warning("No unsigned transactions found in USB inbox.")
-            print_info("Create a transaction first using 'Send SOL' option.")
-            return
-            
-        file_options = [f.name for f in unsigned_files]
-        file_options.append("Cancel")
-        
-        selection = select_menu_option(file_options, "Select transaction to sign:")
-        
-        if not selection or "Cancel" in selection:
-            return
-            
-        tx_path = inbox_dir / selection
-        
-        # Get password for secure signing - use cached password if available
-        password = self.wallet_manager.get_cached_password()
-        if password is None:
-            from src.ui import get_password_input
-            password = get_password_input("Enter wallet password for secure signing:")
-            
-        try:
-            # Load and sign the transaction
-            unsigned_tx = self.transaction_manager.load_unsigned_transaction(str(tx_path))
-            if not unsigned_tx:
-                return
-            
-            print_info("Signing transaction securely with Rust signer...")
-            signed_tx = self.transaction_manager.sign_transaction_secure(unsigned_tx, encrypted_container, password)
-            
-            if signed_tx:
-                # Save to outbox with signed_ prefix
-                output_name = selection.replace("unsigned_", "signed_")
-                output_path = outbox_dir / output_name
-                
-                if self.transaction_manager.save_signed_transaction(signed_tx, str(output_path)):
-                    print_success("Transaction signed and saved to outbox!")
-                    print_info(f"Signed file: {output_name}")
-                    print_info("You can now broadcast this transaction.")
-                    
-                    # Auto-delete the unsigned transaction to keep inbox clean
-                    tx_path.unlink()
-                    print_success("Unsigned transaction removed from inbox.")
-        finally:
-            self.wallet_manager.clear_memory()
-
+            prefetch.shutdown(wait=False)
+            # CRITICAL: Clear key from memory (the signing session's timer wipes it at expiry)
+            self.wallet_manager.clear_memory(keep_signing_session=True)
     
     def create_unsigned_transaction(self):
         print_section_header("CREATE UNSIGNED TRANSACTION")
@@ -619,7 +712,7 @@ Write down or photograph this address to receive payments."""
         print_transaction_summary(from_address, to_address, amount)
         console.print()
         
-        blockhash_result = self.network.get_latest_blockhash()
+        blockhash_result = self._get_cached_blockhash()
         if not blockhash_result:
             print_error("Failed to get blockhash from network")
             return
@@ -639,7 +732,6 @@ Write down or photograph this address to receive payments."""
                 output_dir = Path("./transactions")
                 output_dir.mkdir(exist_ok=True)
             
-            import time
             filename = f"unsigned_tx_{int(time.time())}.json"
             output_path = output_dir / filename
             
@@ -665,7 +757,7 @@ Write down or photograph this address to receive payments."""
         outbox_dir.mkdir(exist_ok=True)
         
         # Look for unsigned transactions in inbox
-        unsigned_files = list(inbox_dir.glob("unsigned_*.json")) if inbox_dir.exists() else []
+        unsigned_files = _list_tx_files(inbox_dir, "unsigned_")
         
         if not unsigned_files:
             print_warning("No unsigned transactions found in USB inbox.")
@@ -702,27 +794,30 @@ Write down or photograph this address to receive payments."""
         # Get password - use cached password if available
         password = self.wallet_manager.get_cached_password()
         if password is None:
-            from src.ui import get_password_input
             password = get_password_input("Enter wallet password for secure signing:")
         
         # Let user select which transaction to sign
-        file_options = [f.name for f in unsigned_files]
-        file_options.append("Cancel")
+        file_options = unsigned_files + ["Cancel"]
         
         selection = select_menu_option(file_options, "Select transaction to sign:")
         
         if not selection or "Cancel" in selection:
+            self.wallet_manager.clear_memory()
             return
         
         tx_path = inbox_dir / selection
         
-        # Load and sign the transaction
-        unsigned_tx = self.transaction_manager.load_unsigned_transaction(str(tx_path))
-        if not unsigned_tx:
-            return
-        
-        print_info("Signing transaction securely with Rust signer...")
-        signed_tx = self.transaction_manager.sign_transaction_secure(unsigned_tx, encrypted_container, password)
+        try:
+            # Load and sign the transaction
+            unsigned_tx = self.transaction_manager.load_unsigned_transaction(str(tx_path))
+            if not unsigned_tx:
+                return
+            
+            print_info("Signing transaction securely with Rust signer...")
+            signed_tx = self.transaction_manager.sign_transaction_secure(unsigned_tx, encrypted_container, password)
+        finally:
+            # CRITICAL: Clear key from memory
+            self.wallet_manager.clear_memory()
         
         if signed_tx:
             # Save to outbox with signed_ prefix
@@ -736,7 +831,7 @@ Write down or photograph this address to receive payments."""
                 
                 # Optionally delete the unsigned transaction
                 delete_choice = select_menu_option(
-                    ["Yes", "No"],
+                    _YES_NO,
                     "Delete the unsigned transaction from inbox?"
                 )
                 
@@ -753,14 +848,13 @@ Write down or photograph this address to receive payments."""
         
         outbox_dir = Path(self.usb_manager.mount_point) / "outbox"
         
-        signed_files = list(outbox_dir.glob("signed_*.json")) if outbox_dir.exists() else []
+        file_options = _list_tx_files(outbox_dir, "signed_")
         
-        if not signed_files:
+        if not file_options:
             print_warning("No signed transactions found in USB outbox")
             print_info("Sign transactions on the air-gapped device first.")
             return
         
-        file_options = [f.name for f in signed_files]
         file_options.append("Cancel")
         
         selection = select_menu_option(file_options, "Select transaction to broadcast:")
@@ -788,7 +882,10 @@ Write down or photograph this address to receive payments."""
         if not tx_base64:
             return
         
+        previous_balance = self._cached_get_balance(self.current_public_key) if self.current_public_key else None
         signature = self.network.send_transaction(tx_base64)
+        if not signature:
+            self._blockhash_cache.invalidate()
         
         if signature:
             print_info("Waiting for confirmation...")
@@ -798,10 +895,8 @@ Write down or photograph this address to receive payments."""
                 console.print()
                 
                 # Refresh balance after successful transaction
-                import time
-                time.sleep(2)  # Wait for balance to update on chain
                 if self.current_public_key:
-                    new_balance = self.network.get_balance(self.current_public_key)
+                    new_balance = self._wait_for_balance_change(self.current_public_key, previous_balance)
                     if new_balance is not None:
                         print_success(f"Updated balance: {new_balance:.9f} SOL")
             else:
@@ -828,7 +923,19 @@ Write down or photograph this address to receive payments."""
         print_info(f"Fetching last {limit} transactions...")
         console.print()
         
-        transactions = self.network.get_transaction_history(public_key, limit)
+        transactions = []
+        try:
+            # The next signature page is already in flight while this page's details load
+            for page in self.network.iter_transaction_history(public_key, limit):
+                transactions.extend(page)
+                # One batched getTransaction per page instead of a round trip per lookup
+                self._tx_details_cache.update(self.network.get_transaction_details_batch(
+                    [tx["signature"] for tx in page if tx.get("signature")]
+                ))
+        except Exception as e:
+            print_error(f"Failed to get transaction history: {e}")
+            if not transactions:
+                return
         
         if not transactions:
             print_warning("No transaction history found")
@@ -837,43 +944,36 @@ Write down or photograph this address to receive payments."""
         print_success(f"Found {len(transactions)} transaction(s)")
         console.print()
         
-        from rich.table import Table
-        
         table = Table(title="Recent Transactions", show_header=True, header_style="bold cyan")
         table.add_column("#", style="dim", width=4)
         table.add_column("Signature", style="cyan", width=50)
         table.add_column("Status", width=12)
         table.add_column("Slot", justify="right", width=10)
+        table.add_column("Fee (SOL)", justify="right", width=12)
         table.add_column("Time", width=20)
         
         for idx, tx in enumerate(transactions, 1):
             signature = tx.get("signature", "Unknown")
-            slot = str(tx.get("slot", "N/A"))
-            
-            # Determine status
-            err = tx.get("err")
-            if err is None:
-                status = "[green]✓ Success[/green]"
-            else:
-                status = "[red]✗ Failed[/red]"
+            slot = f"{tx.get('slot', 'N/A')}"
+            status = _TX_SUCCESS if tx.get("err") is None else _TX_FAILED
             
             # Format timestamp
             block_time = tx.get("blockTime")
-            if block_time:
-                import datetime
-                dt = datetime.datetime.fromtimestamp(block_time)
-                time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                time_str = "Pending"
+            # isoformat skips strftime's locale-aware formatting path
+            time_str = datetime.datetime.fromtimestamp(block_time).isoformat(sep=" ", timespec="seconds") if block_time else "Pending"
             
-            # Truncate signature for display
-            sig_display = signature[:20] + "..." + signature[-20:] if len(signature) > 44 else signature
+            # Truncate signature for display (signatures are always 86-88 base58 chars)
+            sig_display = signature[:20] + "..." + signature[-20:]
+            
+            details = self._tx_details_cache.get(signature)
+            fee = f"{details['meta']['fee'] / LAMPORTS_PER_SOL:.6f}" if details and details.get("meta") else "-"
             
             table.add_row(
-                str(idx),
+                f"{idx}",
                 sig_display,
                 status,
                 slot,
+                fee,
                 time_str
             )
         
@@ -882,7 +982,7 @@ Write down or photograph this address to receive payments."""
         
         # Offer to view details of a specific transaction
         view_details = select_menu_option(
-            ["Yes", "No"],
+            _YES_NO,
             "View details of a specific transaction?"
         )
         
@@ -899,9 +999,10 @@ Write down or photograph this address to receive payments."""
     def _show_transaction_details(self, signature: str):
         """Show detailed information about a specific transaction"""
         console.print()
-        print_info(f"Fetching details for transaction: {signature[:20]}...")
-        
-        details = self.network.get_transaction_details(signature)
+        details = self._tx_details_cache.get(signature)
+        if details is None:
+            print_info(f"Fetching details for transaction: {signature[:20]}...")
+            details = self.network.get_transaction_details(signature)
         
         if not details:
             print_error("Could not fetch transaction details")
@@ -911,21 +1012,21 @@ Write down or photograph this address to receive payments."""
         print_success("Transaction Details:")
         console.print()
         
-        from rich.panel import Panel
-        from rich.json import JSON
-        
         # Extract key information
-        meta = details.get("meta", {})
-        transaction = details.get("transaction", {})
+        meta = details.get("meta") or {}
+        fee_sol = meta.get("fee", 0) / LAMPORTS_PER_SOL
+        # Balance arrays can be empty for some failed or pruned transactions
+        pre_sol = (meta.get("preBalances") or (0,))[0] / LAMPORTS_PER_SOL
+        post_sol = (meta.get("postBalances") or (0,))[0] / LAMPORTS_PER_SOL
         
         info_text = f"""[bold]Signature:[/bold] {signature}
 [bold]Slot:[/bold] {details.get('slot', 'N/A')}
 [bold]Block Time:[/bold] {details.get('blockTime', 'N/A')}
-[bold]Fee:[/bold] {meta.get('fee', 0) / 1000000000} SOL
+[bold]Fee:[/bold] {fee_sol} SOL
 
 [bold]Status:[/bold] {'✓ Success' if meta.get('err') is None else '✗ Failed'}
-[bold]Pre Balance:[/bold] {meta.get('preBalances', [0])[0] / 1000000000} SOL
-[bold]Post Balance:[/bold] {meta.get('postBalances', [0])[0] / 1000000000} SOL
+[bold]Pre Balance:[/bold] {pre_sol} SOL
+[bold]Post Balance:[/bold] {post_sol} SOL
 """
         
         console.print(Panel(info_text, title="Transaction Info", border_style="cyan"))
@@ -955,9 +1056,11 @@ Write down or photograph this address to receive payments."""
         
         print_info(f"Requesting {amount} SOL airdrop...")
         
+        previous_balance = self._cached_get_balance(public_key)
         signature = self.network.request_airdrop(public_key, amount)
         
         if signature:
+            self._invalidate_balance(public_key)
             print_info("Waiting for confirmation...")
             
             if self.network.confirm_transaction(signature):
@@ -965,9 +1068,7 @@ Write down or photograph this address to receive payments."""
                 console.print()
                 
                 # Refresh balance after successful airdrop
-                import time
-                time.sleep(2)  # Wait for balance to update on chain
-                balance = self.network.get_balance(public_key)
+                balance = self._wait_for_balance_change(public_key, previous_balance)
                 if balance is not None:
                     print_success(f"Updated balance: {balance:.9f} SOL")
             else:
@@ -980,14 +1081,14 @@ Write down or photograph this address to receive payments."""
         
         print_info(f"RPC URL: {SOLANA_RPC_URL}")
         
-        if self.network.is_connected():
+        status = self.network.status_bundle()
+        if status["connected"]:
             print_success("Connection: OK")
             
-            info = self.network.get_network_info()
-            if "error" not in info:
-                print_info(f"Solana Version: {info.get('version', 'Unknown')}")
-                print_info(f"Current Slot: {info.get('slot', 'Unknown')}")
-                print_info(f"Current Epoch: {info.get('epoch', 'Unknown')}")
+            if "error" not in status:
+                print_info(f"Solana Version: {status.get('version', 'Unknown')}")
+                print_info(f"Current Slot: {status.get('slot', 'Unknown')}")
+                print_info(f"Current Epoch: {status.get('epoch', 'Unknown')}")
         else:
             print_error("Connection: FAILED")
             print_info("Check your internet connection or RPC URL")
@@ -1000,6 +1101,8 @@ Write down or photograph this address to receive payments."""
     
     def cleanup(self):
         try:
+            self.wallet_manager.clear_memory()
+            self._executor.shutdown(wait=False, cancel_futures=True)
             self.network.close()
             if self.usb_manager.mount_point:
                 self.usb_manager.unmount_device()
@@ -1009,6 +1112,15 @@ Write down or photograph this address to receive payments."""
 
 def build_rust_signer():
     """Build the Rust secure signer before running the application."""
+    # Skip forking cargo entirely when the release build matches the sources;
+    # same content-hash check and signer dir as build.py, so the two never disagree
+    secure_signer_dir = SIGNER_DIR
+    source_hash = None
+    if secure_signer_dir.exists():
+        source_hash = signer_source_hash(secure_signer_dir)
+        if signer_build_matches(secure_signer_dir, source_hash):
+            return
+    
     console = Console()
     console.print("🔨 Building Rust Secure Signer...", style="cyan")
     
@@ -1028,7 +1140,6 @@ def build_rust_signer():
         sys.exit(1)
     
     # Navigate to secure_signer directory
-    secure_signer_dir = Path(__file__).parent / "secure_signer"
     if not secure_signer_dir.exists():
         console.print(f"❌ secure_signer directory not found at {secure_signer_dir}!", style="red")
         sys.exit(1)
@@ -1043,6 +1154,7 @@ def build_rust_signer():
             text=True,
             check=True
         )
+        record_signer_build(secure_signer_dir, source_hash)
         console.print("✅ BUILD SUCCESSFUL!", style="green bold")
         console.print()
     except subprocess.CalledProcessError as e:
@@ -12,15 +12,68 @@ Security guarantees:
 - Memory is locked and zeroized in Rust
 """
 
-import json
 import subprocess
 import sys
 from ctypes import *
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 import base64
 import base58
 
+from src.json_codec import dumps as _json_dumps, loads as _json_loads
+
+
+_HERE = Path(__file__).parent
+
+# Candidate build outputs, checked in order (secure_signer first, legacy rust_signer last)
+_LIBRARY_CANDIDATES = (
+    _HERE / "secure_signer" / "target" / "release" / "libsolana_secure_signer.so",
+    _HERE / "secure_signer" / "target" / "release" / "libsolana_secure_signer.dylib",
+    _HERE / "secure_signer" / "target" / "release" / "solana_secure_signer.dll",
+    _HERE / "secure_signer" / "target" / "debug" / "libsolana_secure_signer.so",
+    _HERE / "secure_signer" / "target" / "debug" / "libsolana_secure_signer.dylib",
+    _HERE / "secure_signer" / "target" / "debug" / "solana_secure_signer.dll",
+    _HERE / "rust_signer" / "target" / "release" / "libsolana_secure_signer.so",
+    _HERE / "rust_signer" / "target" / "release" / "libsolana_secure_signer.dylib",
+    _HERE / "rust_signer" / "target" / "release" / "solana_secure_signer.dll",
+)
+
+_BINARY_CANDIDATES = (
+    _HERE / "secure_signer" / "target" / "release" / "solana-signer",
+    _HERE / "secure_signer" / "target" / "release" / "solana-signer.exe",
+    _HERE / "secure_signer" / "target" / "debug" / "solana-signer",
+    _HERE / "secure_signer" / "target" / "debug" / "solana-signer.exe",
+    _HERE / "rust_signer" / "target" / "release" / "solana-signer",
+    _HERE / "rust_signer" / "target" / "release" / "solana-signer.exe",
+)
+
+
+@lru_cache(maxsize=1)
+def _resolve_library_path() -> str:
+    """Find the compiled Rust library (resolved once per process)."""
+    for path in _LIBRARY_CANDIDATES:
+        if path.exists():
+            return str(path)
+    
+    raise FileNotFoundError(
+        "Could not find Rust library. Please compile it first:\n"
+        "  cd secure_signer && cargo build --release --features ffi"
+    )
+
+
+@lru_cache(maxsize=1)
+def _resolve_binary_path() -> str:
+    """Find the compiled Rust binary (resolved once per process)."""
+    for path in _BINARY_CANDIDATES:
+        if path.exists():
+            return str(path)
+    
+    raise FileNotFoundError(
+        "Could not find Rust binary. Please compile it first:\n"
+        "  cd secure_signer && cargo build --release --features ffi"
+    )
+
 
 # ============================================================================
 # Method 1: FFI Integration (ctypes)
@@ -46,6 +99,14 @@ class FFIResult(Structure):
     ]
 
 
+class SignerResultStruct(Structure):
+    """Result structure matching Rust's SignerResult."""
+    _fields_ = [
+        ("error_code", c_int),
+        ("result", c_void_p),  # kept as a raw pointer so it can be freed
+    ]
+
+
 class SolanaSecureSigner:
     """
     Python wrapper for the Rust signing library using FFI.
@@ -63,46 +124,17 @@ class SolanaSecureSigner:
                      If None, will search in common locations.
         """
         if lib_path is None:
-            lib_path = self._find_library()
+            lib_path = _resolve_library_path()
         
         self.lib = CDLL(str(lib_path))
         self._setup_functions()
-    
-    def _find_library(self) -> str:
-        """Find the compiled Rust library."""
-        possible_paths = [
-            # secure_signer paths (primary) - library name is based on crate name
-            Path(__file__).parent / "secure_signer" / "target" / "release" / "libsolana_secure_signer.so",
-            Path(__file__).parent / "secure_signer" / "target" / "release" / "libsolana_secure_signer.dylib",
-            Path(__file__).parent / "secure_signer" / "target" / "release" / "solana_secure_signer.dll",
-            Path(__file__).parent / "secure_signer" / "target" / "debug" / "libsolana_secure_signer.so",
-            Path(__file__).parent / "secure_signer" / "target" / "debug" / "libsolana_secure_signer.dylib",
-            Path(__file__).parent / "secure_signer" / "target" / "debug" / "solana_secure_signer.dll",
-            # Legacy rust_signer paths (fallback)
-            Path(__file__).parent / "rust_signer" / "target" / "release" / "libsolana_secure_signer.so",
-            Path(__file__).parent / "rust_signer" / "target" / "release" / "libsolana_secure_signer.dylib",
-            Path(__file__).parent / "rust_signer" / "target" / "release" / "solana_secure_signer.dll",
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                return str(path)
-        
-        raise FileNotFoundError(
-            "Could not find Rust library. Please compile it first:\n"
-            "  cd secure_signer && cargo build --release --features ffi"
-        )
+        self.has_binary_signing = hasattr(self.lib, "signer_sign_transaction_bin")
     
     def _setup_functions(self):
-        """Set up ctypes function signatures."""
-        # SignerResult struct
-        class SignerResultStruct(Structure):
-            _fields_ = [
-                ("error_code", c_int),
-                ("result", c_char_p),
-            ]
-        
-        self.SignerResultStruct = SignerResultStruct
+        """Set up ctypes function signatures (once per CDLL handle)."""
+        if getattr(self.lib, "_signer_configured", False):
+            return
+        self.lib._signer_configured = True
         
         # signer_create_container
         self.lib.signer_create_container.argtypes = [
@@ -119,8 +151,20 @@ class SolanaSecureSigner:
         ]
         self.lib.signer_sign_transaction.restype = SignerResultStruct
         
+        # signer_sign_transaction_bin (raw bytes in, packed bytes out; absent from older builds)
+        if hasattr(self.lib, "signer_sign_transaction_bin"):
+            # c_char_p lets Python bytes be passed without copying
+            self.lib.signer_sign_transaction_bin.argtypes = [
+                c_char_p, c_size_t,  # container_json
+                c_char_p, c_size_t,  # passphrase
+                c_char_p, c_size_t,  # transaction
+            ]
+            self.lib.signer_sign_transaction_bin.restype = FFIResult
+            self.lib.signer_free_ffi_result.argtypes = [POINTER(FFIResult)]
+            self.lib.signer_free_ffi_result.restype = None
+        
         # signer_free_string
-        self.lib.signer_free_string.argtypes = [c_char_p]
+        self.lib.signer_free_string.argtypes = [c_void_p]
         self.lib.signer_free_string.restype = None
         
         # signer_version
@@ -131,6 +175,18 @@ class SolanaSecureSigner:
         self.lib.signer_check_mlock_support.argtypes = []
         self.lib.signer_check_mlock_support.restype = c_int
     
+    def _take_result(self, result: SignerResultStruct, action: str) -> bytes:
+        """Copy out a SignerResult's string and free the Rust allocation."""
+        try:
+            data = string_at(result.result) if result.result else b""
+        finally:
+            self.lib.signer_free_string(result.result)
+        
+        if result.error_code != 0:
+            error_msg = data.decode('utf-8', errors='replace') or "Unknown error"
+            raise RuntimeError(f"{action} failed: {error_msg}")
+        return data
+    
     def get_version(self) -> str:
         """Get the library version."""
         return self.lib.signer_version().decode('utf-8')
@@ -169,19 +225,12 @@ class SolanaSecureSigner:
             passphrase.encode('utf-8')
         )
         
-        # Handle result
-        if result.error_code != 0:
-            error_msg = result.result.decode('utf-8') if result.result else "Unknown error"
-            raise RuntimeError(f"Encryption failed: {error_msg}")
-        
-        # Parse JSON result
-        result_json = json.loads(result.result.decode('utf-8'))
-        return result_json
+        return _json_loads(self._take_result(result, "Encryption"))
     
     def sign_transaction(
         self,
         encrypted_container: dict,
-        passphrase: str,
+        passphrase,
         transaction: bytes
     ) -> Tuple[bytes, bytes]:
         """
@@ -195,7 +244,8 @@ class SolanaSecureSigner:
         
         Args:
             encrypted_container: Encrypted key container (from create_encrypted_container)
-            passphrase: Passphrase for decryption
+            passphrase: Passphrase for decryption, as str or UTF-8 bytes; a
+                bytearray is handed to Rust in place, without a copy
             transaction: Unsigned transaction bytes
             
         Returns:
@@ -204,29 +254,66 @@ class SolanaSecureSigner:
         Raises:
             RuntimeError: If signing fails
         """
-        # Serialize container to JSON
+        # Serialize container to JSON bytes
         if isinstance(encrypted_container, dict):
-            container_json = json.dumps(encrypted_container)
+            container_bytes = _json_dumps(encrypted_container)
         else:
-            container_json = encrypted_container
+            container_bytes = encrypted_container.encode('utf-8')
         
+        if isinstance(passphrase, str):
+            passphrase = passphrase.encode('utf-8')
+        
+        if not self.has_binary_signing:
+            return self._sign_transaction_json(container_bytes, bytes(passphrase), transaction)
+        
+        pass_len = len(passphrase)
+        if isinstance(passphrase, bytearray):
+            passphrase = (c_char * pass_len).from_buffer(passphrase)
+        transaction = bytes(transaction)
+        
+        # Hand Rust the raw bytes directly - no base64 or JSON on either side
+        result = self.lib.signer_sign_transaction_bin(
+            container_bytes, len(container_bytes),
+            passphrase, pass_len,
+            transaction, len(transaction)
+        )
+        
+        try:
+            if result.error_code != 0:
+                error_msg = result.error_message.decode('utf-8') if result.error_message else "Unknown error"
+                raise RuntimeError(f"Signing failed: {error_msg}")
+            
+            # Packed layout: [signature:64][tx_len:u32 LE][signed_tx:tx_len]
+            blob = string_at(result.data, result.data_len)
+        finally:
+            self.lib.signer_free_ffi_result(byref(result))
+        
+        tx_len = int.from_bytes(blob[64:68], "little")
+        return blob[:64], blob[68:68 + tx_len]
+    
+    def _sign_transaction_json(
+        self,
+        container_json: bytes,
+        passphrase: bytes,
+        transaction: bytes
+    ) -> Tuple[bytes, bytes]:
+        """
+        Sign via the base64/JSON entry point.
+        
+        Deprecated: only used with library builds that predate
+        signer_sign_transaction_bin.
+        """
         # Convert transaction to base64
         transaction_b64 = base64.b64encode(transaction).decode('utf-8')
         
         # Call FFI
         result = self.lib.signer_sign_transaction(
-            container_json.encode('utf-8'),
-            passphrase.encode('utf-8'),
+            container_json,
+            passphrase,
             transaction_b64.encode('utf-8')
         )
         
-        # Handle result
-        if result.error_code != 0:
-            error_msg = result.result.decode('utf-8') if result.result else "Unknown error"
-            raise RuntimeError(f"Signing failed: {error_msg}")
-        
-        # Parse result
-        result_json = json.loads(result.result.decode('utf-8'))
+        result_json = _json_loads(self._take_result(result, "Signing"))
         
         # Decode signature and signed transaction from base58/base64
         signature = base58.b58decode(result_json['signature']) if 'signature' in result_json else b''
@@ -244,7 +331,8 @@ class SolanaSignerCLI:
     Python wrapper for the Rust signing CLI using subprocess.
     
     This is useful when FFI is not available or as a fallback.
-    Slightly slower than FFI but more portable.
+    A single `sign-stream` process is kept alive and reused across calls,
+    so only the first signature pays the process spawn cost.
     """
     
     def __init__(self, binary_path: Optional[str] = None):
@@ -256,31 +344,32 @@ class SolanaSignerCLI:
                         If None, will search in common locations.
         """
         if binary_path is None:
-            binary_path = self._find_binary()
+            binary_path = _resolve_binary_path()
         
         self.binary_path = binary_path
+        self._process: Optional[subprocess.Popen] = None
     
-    def _find_binary(self) -> str:
-        """Find the compiled Rust binary."""
-        possible_paths = [
-            # secure_signer paths (primary)
-            Path(__file__).parent / "secure_signer" / "target" / "release" / "solana-signer",
-            Path(__file__).parent / "secure_signer" / "target" / "release" / "solana-signer.exe",
-            Path(__file__).parent / "secure_signer" / "target" / "debug" / "solana-signer",
-            Path(__file__).parent / "secure_signer" / "target" / "debug" / "solana-signer.exe",
-            # Legacy rust_signer paths (fallback)
-            Path(__file__).parent / "rust_signer" / "target" / "release" / "solana-signer",
-            Path(__file__).parent / "rust_signer" / "target" / "release" / "solana-signer.exe",
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                return str(path)
-        
-        raise FileNotFoundError(
-            "Could not find Rust binary. Please compile it first:\n"
-            "  cd secure_signer && cargo build --release --features ffi"
-        )
+    def _get_process(self) -> subprocess.Popen:
+        """Return the running signer stream, spawning it if needed."""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                [self.binary_path, "sign-stream"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                bufsize=0
+            )
+        return self._process
+    
+    @staticmethod
+    def _read_exact(stream, size: int) -> bytes:
+        """Read exactly `size` bytes from an unbuffered pipe."""
+        data = bytearray()
+        while len(data) < size:
+            chunk = stream.read(size - len(data))
+            if not chunk:
+                raise RuntimeError("CLI signer stream closed unexpectedly")
+            data += chunk
+        return bytes(data)
     
     def sign_transaction_stdin(
         self,
@@ -289,7 +378,7 @@ class SolanaSignerCLI:
         transaction: bytes
     ) -> Tuple[bytes, bytes]:
         """
-        Sign a transaction using the CLI via stdin/stdout.
+        Sign a transaction using the persistent CLI signer stream.
         
         Args:
             encrypted_container: Encrypted key container
@@ -302,31 +391,46 @@ class SolanaSignerCLI:
         Raises:
             RuntimeError: If signing fails
         """
-        # Prepare input
-        container_json = json.dumps(encrypted_container)
-        tx_hex = transaction.hex()
+        container_json = _json_dumps(encrypted_container)
+        passphrase_bytes = passphrase.encode()
         
-        input_data = f"{container_json}\n{tx_hex}\n"
+        request = b"".join((
+            len(container_json).to_bytes(4, "big"), container_json,
+            len(passphrase_bytes).to_bytes(4, "big"), passphrase_bytes,
+            len(transaction).to_bytes(4, "big"), transaction,
+        ))
         
-        # Run CLI
+        process = self._get_process()
         try:
-            result = subprocess.run(
-                [self.binary_path, "sign-stdin", "-p", passphrase],
-                input=input_data,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Parse output
-            output_data = json.loads(result.stdout)
-            signature = base64.b64decode(output_data['signature']) if isinstance(output_data['signature'], str) else bytes(output_data['signature'])
-            signed_tx = base64.b64decode(output_data['signed_transaction']) if isinstance(output_data['signed_transaction'], str) else bytes(output_data['signed_transaction'])
-            
-            return signature, signed_tx
-            
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"CLI signing failed: {e.stderr}")
+            process.stdin.write(request)
+            header = self._read_exact(process.stdout, 5)
+            payload = self._read_exact(process.stdout, int.from_bytes(header[1:], "big"))
+        except (BrokenPipeError, RuntimeError) as e:
+            self.close()
+            raise RuntimeError(f"CLI signing failed: {e}")
+        
+        if header[0] != 0:
+            raise RuntimeError(f"CLI signing failed: {payload.decode(errors='replace')}")
+        
+        return payload[:64], payload[64:]
+    
+    def close(self):
+        """Shut down the signer stream process."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 # ============================================================================
@@ -415,6 +519,8 @@ def example_cli():
         print("CLI Integration Example Complete")
         print("=" * 70)
         
+        cli.close()
+        
     except FileNotFoundError as e:
         print(f"\n⚠ CLI binary not found: {e}")
         print("   Skipping CLI example. Compile with: cd rust_signer && cargo build --release")
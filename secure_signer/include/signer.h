@@ -20,6 +20,7 @@
 #ifndef SOLANA_SECURE_SIGNER_H
 #define SOLANA_SECURE_SIGNER_H
 
+#include <stddef.h>
 #include <stdint.h>
 
 #ifdef __cplusplus
@@ -48,6 +49,20 @@ typedef struct {
     char* result;
 } SignerResult;
 
+/**
+ * Binary result for the raw-bytes signing functions.
+ * 
+ * On success data/data_len hold the payload and error_message is NULL;
+ * on failure data is NULL and error_message describes the error.
+ * Release with signer_free_ffi_result().
+ */
+typedef struct {
+    int32_t error_code;
+    uint8_t* data;
+    size_t data_len;
+    char* error_message;
+} FFIResult;
+
 /**
  * Create an encrypted key container from a private key.
  * 
@@ -90,6 +105,95 @@ SignerResult signer_sign_transaction(
     const char* transaction_b64
 );
 
+/**
+ * Sign raw transaction bytes using an encrypted key container.
+ * 
+ * Same JSON result as signer_sign_transaction(), without base64-encoding
+ * the transaction first.
+ * 
+ * @param container_json JSON string of the encrypted container
+ * @param passphrase     Null-terminated passphrase for decryption
+ * @param tx_ptr         Unsigned transaction bytes
+ * @param tx_len         Length of the transaction in bytes
+ * @return SignerResult with signing result on success
+ */
+SignerResult signer_sign_transaction_bytes(
+    const char* container_json,
+    const char* passphrase,
+    const uint8_t* tx_ptr, size_t tx_len
+);
+
+/**
+ * Sign a transaction from raw byte buffers, returning a packed result.
+ * 
+ * None of the buffers need to be null-terminated. On success data is laid out as
+ * [signature:64][tx_len:uint32 little-endian][signed_tx:tx_len].
+ */
+FFIResult signer_sign_transaction_bin(
+    const uint8_t* container_ptr, size_t container_len,
+    const uint8_t* pass_ptr, size_t pass_len,
+    const uint8_t* tx_ptr, size_t tx_len
+);
+
+/**
+ * Sign a transaction into caller-supplied buffers.
+ * 
+ * Nothing is allocated for the caller to free.
+ * 
+ * @param sig_out    Receives the 64-byte signature
+ * @param pubkey_out Receives the 32-byte public key
+ * @return 0 on success, otherwise an error code
+ */
+int32_t signer_sign_transaction_into(
+    const char* container_json,
+    const char* passphrase,
+    const uint8_t* tx_ptr, size_t tx_len,
+    uint8_t* sig_out,
+    uint8_t* pubkey_out
+);
+
+/**
+ * Sign several transactions with a single container decryption.
+ * 
+ * The Argon2id key derivation and AES-GCM decryption run once for the
+ * whole batch instead of once per transaction.
+ * 
+ * @param container_json    JSON string of the encrypted container
+ * @param passphrase        Null-terminated passphrase for decryption
+ * @param transactions_json JSON array of base64-encoded unsigned transactions
+ * @return SignerResult with batch signing result on success
+ * 
+ * The returned JSON has the format:
+ * {
+ *   "signatures": ["<base58>", ...],
+ *   "signed_transactions": ["<base64>", ...],
+ *   "public_key": "<base58>"
+ * }
+ */
+SignerResult signer_sign_transaction_batch(
+    const char* container_json,
+    const char* passphrase,
+    const char* transactions_json
+);
+
+/**
+ * Sign a batch of transactions laid out in one contiguous buffer.
+ * 
+ * Transaction i is tx_blob[offsets[i] .. offsets[i + 1]], so offsets has
+ * count + 1 entries. The container is decrypted once for the whole batch.
+ * 
+ * @param sigs_out Receives 64 * count bytes of signatures, in input order
+ * @return 0 on success, otherwise an error code
+ */
+int32_t signer_sign_batch_raw(
+    const char* container_json,
+    const char* passphrase,
+    const uint8_t* tx_blob,
+    const uint32_t* offsets,
+    uint32_t count,
+    uint8_t* sigs_out
+);
+
 /**
  * Sign a message directly with a private key.
  * 
@@ -116,6 +220,13 @@ SignerResult signer_sign_direct(
  */
 void signer_free_result(SignerResult result);
 
+/**
+ * Free the buffers owned by an FFIResult and reset its pointers.
+ * 
+ * @param result The result to free (may be NULL)
+ */
+void signer_free_ffi_result(FFIResult* result);
+
 /**
  * Free a string allocated by the library.
  * 
@@ -15,21 +15,44 @@ Usage:
 """
 
 import argparse
+import asyncio
 import base64
 import ctypes
+import itertools
 import json
 import os
+import selectors
 import subprocess
 import sys
+import threading
+import time
+import weakref
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.json_codec import dumps as _json_dumps, loads as _json_loads
 
 
 # =============================================================================
 # SUBPROCESS MODE - Call Rust binary as a subprocess
 # =============================================================================
 
+def _stop_server(proc: subprocess.Popen):
+    """Ask a `--server` child to quit and reap it, killing it if it does not exit."""
+    if proc.poll() is not None:
+        return
+    try:
+        proc.stdin.write(b'{"action":"quit"}\n')
+        proc.stdin.close()
+        proc.wait(timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        proc.kill()
+        proc.wait()
+
+
 class SubprocessSigner:
     """
     Secure signer using subprocess to invoke the Rust binary.
@@ -38,6 +61,9 @@ class SubprocessSigner:
     - Provides process isolation (separate memory space)
     - Ensures cleanup even on crashes
     - Works without shared library compilation
+    
+    One `--server` child is spawned on first use and shared by every call,
+    so the fork/exec cost is paid once rather than per request.
     """
     
     def __init__(self, binary_path: str = "solana-signer"):
@@ -48,49 +74,113 @@ class SubprocessSigner:
             binary_path: Path to the solana-signer binary
         """
         self.binary_path = binary_path
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._prepared: Optional[Tuple[str, str]] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._buffer = bytearray()
+        # Stops the server when this signer is collected or at interpreter exit
+        self._finalizer: Optional[weakref.finalize] = None
     
-    def _run_command(self, args: list) -> dict:
-        """Run a command and parse JSON output."""
-        try:
-            result = subprocess.run(
-                [self.binary_path] + args,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            output = result.stdout.strip() or result.stderr.strip()
-            return json.loads(output)
-            
-        except subprocess.TimeoutExpired:
-            return {"success": False, "error": "Command timed out"}
-        except json.JSONDecodeError as e:
-            return {"success": False, "error": f"Invalid JSON: {e}"}
-        except FileNotFoundError:
-            return {"success": False, "error": f"Binary not found: {self.binary_path}"}
-    
-    def _run_stdin_mode(self, command: dict) -> dict:
-        """Run command via stdin (more secure, avoids command-line exposure)."""
-        try:
-            proc = subprocess.Popen(
-                [self.binary_path, "--stdin"],
+    def _get_proc(self) -> subprocess.Popen:
+        """Return the server process, (re)spawning it if it is not running."""
+        if self._proc is None or self._proc.poll() is not None:
+            self._discard_proc()
+            self._proc = subprocess.Popen(
+                [self.binary_path, "--server"],
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.DEVNULL,
+                bufsize=0
             )
+            self._finalizer = weakref.finalize(self, _stop_server, self._proc)
+            if sys.platform != "win32":
+                # Windows selectors only accept sockets, so pipes there block without a deadline
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(self._proc.stdout, selectors.EVENT_READ)
+        return self._proc
+    
+    def _send_recv(self, payload: bytes, timeout: float) -> bytes:
+        """Write one request line and read one reply line, raising TimeoutError past the deadline."""
+        proc = self._get_proc()
+        proc.stdin.write(payload)
+        if self._selector is None:
+            return proc.stdout.readline()
+        
+        fd = proc.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
+                raise TimeoutError
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                return b""
+            self._buffer += chunk
+        
+        end = self._buffer.index(b"\n") + 1
+        line = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return line
+    
+    def _run_stdin_mode(self, command: dict, timeout: float = 60) -> dict:
+        """Run command via the server's stdin (more secure, avoids command-line exposure)."""
+        with self._lock:
+            try:
+                request_id = next(self._ids)
+                line = self._send_recv(_json_dumps({**command, "id": request_id}) + b"\n", timeout)
+            except FileNotFoundError:
+                return {"success": False, "error": f"Binary not found: {self.binary_path}"}
+            except TimeoutError:
+                # A late reply would be read as the answer to the next request
+                self._discard_proc()
+                return {"success": False, "error": "Command timed out"}
+            except OSError as e:
+                self._discard_proc()
+                return {"success": False, "error": f"Signer process failed: {e}"}
             
-            stdout, stderr = proc.communicate(json.dumps(command) + "\n", timeout=60)
-            output = stdout.strip() or stderr.strip()
-            return json.loads(output)
+            if not line:
+                self._discard_proc()
+                return {"success": False, "error": "Signer process exited unexpectedly"}
             
-        except subprocess.TimeoutExpired:
+            try:
+                reply = _json_loads(line)
+            except json.JSONDecodeError as e:
+                self._discard_proc()
+                return {"success": False, "error": f"Invalid JSON: {e}"}
+            
+            if reply.pop("id", None) != request_id:
+                # Out of step with the server; restart it rather than misroute replies
+                self._discard_proc()
+                return {"success": False, "error": "Mismatched reply from signer process"}
+            return reply
+    
+    def _discard_proc(self):
+        """Drop a broken server process so the next call respawns it."""
+        proc, self._proc = self._proc, None
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        self._buffer.clear()
+        if proc is not None and proc.poll() is None:
             proc.kill()
-            return {"success": False, "error": "Command timed out"}
-        except json.JSONDecodeError as e:
-            return {"success": False, "error": f"Invalid JSON: {e}"}
-        except FileNotFoundError:
-            return {"success": False, "error": f"Binary not found: {self.binary_path}"}
+            proc.wait()
+    
+    def close(self):
+        """Ask the server to quit and reap it, killing it if it does not exit."""
+        with self._lock:
+            self._proc = None
+            finalizer, self._finalizer = self._finalizer, None
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
+            self._buffer.clear()
+        if finalizer is not None:
+            finalizer()
     
     def create_container(self, private_key_b58: str, passphrase: str) -> dict:
         """
@@ -126,27 +216,224 @@ class SubprocessSigner:
         Returns:
             dict with signature and signed transaction on success
         """
-        transaction_b64 = base64.b64encode(transaction_bytes).decode('ascii')
-        
         return self._run_stdin_mode({
             "action": "sign",
             "container": container_json,
             "passphrase": passphrase,
-            "transaction": transaction_b64
+            "transaction": transaction_bytes.hex(),
+            "transaction_encoding": "hex"
+        })
+    
+    def sign_transactions(
+        self,
+        container_json: str,
+        passphrase: str,
+        transaction_bytes_list: List[bytes]
+    ) -> dict:
+        """
+        Sign several transactions, decrypting the container only once.
+        
+        Returns:
+            dict whose data holds parallel "signatures" / "signed_transactions"
+            lists and the signing "public_key"
+        """
+        return self._run_stdin_mode({
+            "action": "sign_batch",
+            "container": container_json,
+            "passphrase": passphrase,
+            "transactions": [tx.hex() for tx in transaction_bytes_list],
+            "transaction_encoding": "hex"
         })
     
+    def prepare(self, container_json: str, passphrase: str):
+        """Remember the credentials for sign_prepared()."""
+        self._prepared = (container_json, passphrase)
+    
+    def clear_prepared(self):
+        """Drop the credentials remembered by prepare()."""
+        self._prepared = None
+    
+    def sign_prepared(self, transaction_bytes: bytes) -> dict:
+        """Sign with the credentials remembered by prepare()."""
+        if self._prepared is None:
+            raise RuntimeError("prepare() must be called before sign_prepared()")
+        return self.sign_transaction(*self._prepared, transaction_bytes)
+    
     def check_capabilities(self) -> dict:
         """Check system capabilities (mlock support, etc.)."""
         return self._run_stdin_mode({"action": "check"})
 
 
+class AsyncSubprocessSigner:
+    """
+    asyncio client for the persistent `--server` signer process.
+    
+    Requests are tagged with ids and written without waiting for earlier
+    replies; a background reader task resolves each request's future as its
+    reply arrives, so many signatures can be in flight over one pipe.
+    """
+    
+    # Batch replies can exceed asyncio's default 64 KiB readline limit
+    STREAM_LIMIT = 1 << 20
+    
+    def __init__(self, binary_path: str = "solana-signer"):
+        """
+        Initialize the async subprocess signer.
+        
+        Args:
+            binary_path: Path to the solana-signer binary
+        """
+        self.binary_path = binary_path
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._pending: dict = {}
+        self._next_id = itertools.count(1)
+        # Created on first use so it belongs to the running loop
+        self._start_lock: Optional[asyncio.Lock] = None
+    
+    async def start(self):
+        """Spawn the server process and its reply reader (no-op if running)."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        # Concurrent first requests must share one server, not spawn one each
+        async with self._start_lock:
+            if self._proc is not None and self._proc.returncode is None:
+                return
+            self._proc = await asyncio.create_subprocess_exec(
+                self.binary_path, "--server",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=self.STREAM_LIMIT
+            )
+            self._reader = asyncio.create_task(self._read_replies(self._proc))
+    
+    async def _read_replies(self, proc: asyncio.subprocess.Process):
+        """Route each reply line to the future waiting on its id."""
+        error = "Signer process exited unexpectedly"
+        killed = False
+        while True:
+            try:
+                line = await proc.stdout.readline()
+            except ValueError as e:
+                # Reply longer than STREAM_LIMIT: the stream is now mid-line,
+                # so the server cannot be read from again
+                error = f"Signer reply too large: {e}"
+                if self._proc is proc:
+                    self._proc = None
+                if proc.returncode is None:
+                    proc.kill()
+                    killed = True
+                break
+            if not line:
+                break
+            try:
+                reply = _json_loads(line)
+            except ValueError:
+                continue
+            future = self._pending.pop(reply.pop("id", None), None)
+            if future is not None and not future.done():
+                future.set_result(reply)
+        
+        # Server has gone away; fail everything still waiting
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_result({"success": False, "error": error})
+        if killed:
+            await proc.wait()
+    
+    async def _request(self, command: dict) -> dict:
+        try:
+            await self.start()
+        except FileNotFoundError:
+            return {"success": False, "error": f"Binary not found: {self.binary_path}"}
+        
+        request_id = next(self._next_id)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._proc.stdin.write(_json_dumps({**command, "id": request_id}) + b"\n")
+            await self._proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self._pending.pop(request_id, None)
+            return {"success": False, "error": f"Signer process failed: {e}"}
+        return await future
+    
+    async def create_container(self, private_key_b58: str, passphrase: str) -> dict:
+        """Create an encrypted key container."""
+        return await self._request({
+            "action": "create_container",
+            "private_key": private_key_b58,
+            "passphrase": passphrase
+        })
+    
+    async def sign_transaction(
+        self,
+        container_json: str,
+        passphrase: str,
+        transaction_bytes: bytes
+    ) -> dict:
+        """Sign a transaction using an encrypted container."""
+        return await self._request({
+            "action": "sign",
+            "container": container_json,
+            "passphrase": passphrase,
+            "transaction": transaction_bytes.hex(),
+            "transaction_encoding": "hex"
+        })
+    
+    async def sign_transactions(
+        self,
+        container_json: str,
+        passphrase: str,
+        transaction_bytes_list: List[bytes]
+    ) -> dict:
+        """Sign several transactions, decrypting the container only once."""
+        return await self._request({
+            "action": "sign_batch",
+            "container": container_json,
+            "passphrase": passphrase,
+            "transactions": [tx.hex() for tx in transaction_bytes_list],
+            "transaction_encoding": "hex"
+        })
+    
+    async def check_capabilities(self) -> dict:
+        """Check system capabilities (mlock support, etc.)."""
+        return await self._request({"action": "check"})
+    
+    async def close(self):
+        """Ask the server to quit and reap it, killing it if it does not exit."""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            proc.stdin.write(b'{"action":"quit"}\n')
+            await proc.stdin.drain()
+            proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except (OSError, asyncio.TimeoutError):
+            proc.kill()
+            await proc.wait()
+        if self._reader is not None:
+            await self._reader
+            self._reader = None
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
 # =============================================================================
 # FFI MODE - Load shared library directly
 # =============================================================================
 
 @dataclass
 class SignerResult:
-    """Result from FFI signing operations."""
+    """Result from FFI signing operations (kept for API compatibility)."""
     error_code: int
     result: str
     
@@ -156,7 +443,7 @@ class SignerResult:
     
     def to_dict(self) -> dict:
         if self.success:
-            return {"success": True, "data": json.loads(self.result)}
+            return {"success": True, "data": _json_loads(self.result)}
         else:
             return {"success": False, "error": self.result}
 
@@ -169,6 +456,43 @@ class FFISignerResult(ctypes.Structure):
     ]
 
 
+# Checked in order by _resolve_library_path()
+_LIBRARY_CANDIDATES = (
+    # Development builds
+    "./target/release/libsolana_secure_signer.so",
+    "./target/debug/libsolana_secure_signer.so",
+    "./secure_signer/target/release/libsolana_secure_signer.so",
+    "./secure_signer/target/debug/libsolana_secure_signer.so",
+    # System-wide
+    "/usr/local/lib/libsolana_secure_signer.so",
+    # Windows
+    "./target/release/solana_secure_signer.dll",
+    "./secure_signer/target/release/solana_secure_signer.dll",
+    # macOS
+    "./target/release/libsolana_secure_signer.dylib",
+    "./secure_signer/target/release/libsolana_secure_signer.dylib",
+)
+
+
+@lru_cache(maxsize=1)
+def _resolve_library_path() -> str:
+    """Find the shared library on the system (resolved once per process)."""
+    for path in _LIBRARY_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    
+    raise FileNotFoundError(
+        "Could not find libsolana_secure_signer. "
+        "Please build with: cargo build --release"
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_library(library_path: str) -> ctypes.CDLL:
+    """dlopen each library path once and share the handle between signers."""
+    return ctypes.CDLL(library_path)
+
+
 class FFISigner:
     """
     Secure signer using FFI to call the Rust library directly.
@@ -185,41 +509,31 @@ class FFISigner:
             library_path: Path to the shared library (.so/.dll/.dylib)
         """
         if library_path is None:
-            library_path = self._find_library()
+            library_path = _resolve_library_path()
         
-        self.lib = ctypes.CDLL(library_path)
+        self.lib = _load_library(library_path)
         self._setup_functions()
-    
-    def _find_library(self) -> str:
-        """Find the shared library on the system."""
-        # Check common locations
-        candidates = [
-            # Development builds
-            "./target/release/libsolana_secure_signer.so",
-            "./target/debug/libsolana_secure_signer.so",
-            "./secure_signer/target/release/libsolana_secure_signer.so",
-            "./secure_signer/target/debug/libsolana_secure_signer.so",
-            # System-wide
-            "/usr/local/lib/libsolana_secure_signer.so",
-            # Windows
-            "./target/release/solana_secure_signer.dll",
-            "./secure_signer/target/release/solana_secure_signer.dll",
-            # macOS
-            "./target/release/libsolana_secure_signer.dylib",
-            "./secure_signer/target/release/libsolana_secure_signer.dylib",
-        ]
         
-        for path in candidates:
-            if os.path.exists(path):
-                return path
+        # Per-thread output buffers for sign_transaction_raw, so threads
+        # sharing this signer never wait on each other's KDF
+        self._bufs = threading.local()
         
-        raise FileNotFoundError(
-            "Could not find libsolana_secure_signer. "
-            "Please build with: cargo build --release"
-        )
+        # Credentials encoded once by prepare() for repeated signing
+        self._prepared: Optional[Tuple[str, str]] = None
+        self._enc_container: Optional[bytes] = None
+        self._enc_passphrase: Optional[bytes] = None
     
     def _setup_functions(self):
-        """Configure ctypes function signatures."""
+        """
+        Configure ctypes function signatures (once per shared CDLL handle).
+        
+        Entry points newer than the original API are bound only if the
+        library exports them, so an older build still loads.
+        """
+        if getattr(self.lib, "_signer_configured", False):
+            return
+        self.lib._signer_configured = True
+        
         # signer_create_container
         self.lib.signer_create_container.argtypes = [
             ctypes.c_char_p,  # private_key_b58
@@ -235,6 +549,49 @@ class FFISigner:
         ]
         self.lib.signer_sign_transaction.restype = FFISignerResult
         
+        # signer_sign_transaction_bytes (raw tx in, JSON result out)
+        if hasattr(self.lib, "signer_sign_transaction_bytes"):
+            self.lib.signer_sign_transaction_bytes.argtypes = [
+                ctypes.c_char_p,  # container_json
+                ctypes.c_char_p,  # passphrase
+                ctypes.c_char_p,  # transaction bytes (passed without copying)
+                ctypes.c_size_t   # transaction length
+            ]
+            self.lib.signer_sign_transaction_bytes.restype = FFISignerResult
+        
+        # signer_sign_transaction_into (binary: raw tx in, signature/pubkey out)
+        if hasattr(self.lib, "signer_sign_transaction_into"):
+            self.lib.signer_sign_transaction_into.argtypes = [
+                ctypes.c_char_p,                   # container_json
+                ctypes.c_char_p,                   # passphrase
+                ctypes.POINTER(ctypes.c_ubyte),    # transaction bytes
+                ctypes.c_size_t,                   # transaction length
+                ctypes.POINTER(ctypes.c_ubyte),    # signature out (64 bytes)
+                ctypes.POINTER(ctypes.c_ubyte)     # public key out (32 bytes)
+            ]
+            self.lib.signer_sign_transaction_into.restype = ctypes.c_int32
+        
+        # signer_sign_batch_raw (one concatenated tx buffer + offsets, signatures out)
+        if hasattr(self.lib, "signer_sign_batch_raw"):
+            self.lib.signer_sign_batch_raw.argtypes = [
+                ctypes.c_char_p,                   # container_json
+                ctypes.c_char_p,                   # passphrase
+                ctypes.c_char_p,                   # concatenated transactions
+                ctypes.POINTER(ctypes.c_uint32),   # count + 1 offsets
+                ctypes.c_uint32,                   # count
+                ctypes.POINTER(ctypes.c_ubyte)     # signatures out (64 * count bytes)
+            ]
+            self.lib.signer_sign_batch_raw.restype = ctypes.c_int32
+        
+        # signer_sign_transaction_batch
+        if hasattr(self.lib, "signer_sign_transaction_batch"):
+            self.lib.signer_sign_transaction_batch.argtypes = [
+                ctypes.c_char_p,  # container_json
+                ctypes.c_char_p,  # passphrase
+                ctypes.c_char_p   # transactions_json (array of base64 strings)
+            ]
+            self.lib.signer_sign_transaction_batch.restype = FFISignerResult
+        
         # signer_sign_direct
         self.lib.signer_sign_direct.argtypes = [
             ctypes.c_char_p,  # private_key_b58
@@ -254,16 +611,34 @@ class FFISigner:
         self.lib.signer_check_mlock_support.argtypes = []
         self.lib.signer_check_mlock_support.restype = ctypes.c_int32
     
+    def prepare(self, container_json: str, passphrase: str):
+        """Encode the container and passphrase once for a run of signatures."""
+        self._prepared = (container_json, passphrase)
+        self._enc_container = container_json.encode('utf-8')
+        self._enc_passphrase = passphrase.encode('utf-8')
+    
+    def clear_prepared(self):
+        """Drop the credentials cached by prepare()."""
+        self._prepared = self._enc_container = self._enc_passphrase = None
+    
+    def _encode_credentials(self, container_json: str, passphrase: str) -> Tuple[bytes, bytes]:
+        """UTF-8 container/passphrase, reusing the prepare() bytes for the same objects."""
+        prepared = self._prepared
+        if prepared is not None and prepared[0] is container_json and prepared[1] is passphrase:
+            return self._enc_container, self._enc_passphrase
+        return container_json.encode('utf-8'), passphrase.encode('utf-8')
+    
     def _process_result(self, ffi_result: FFISignerResult) -> dict:
         """Process FFI result and free memory."""
-        result_str = ffi_result.result.decode('utf-8') if ffi_result.result else ""
-        error_code = ffi_result.error_code
+        code = ffi_result.error_code
+        raw = ffi_result.result or b""  # c_char_p reads copy the bytes out
         
         # Free the result memory
         self.lib.signer_free_result(ffi_result)
         
-        signer_result = SignerResult(error_code, result_str)
-        return signer_result.to_dict()
+        if code == 0:
+            return {"success": True, "data": _json_loads(raw)}
+        return {"success": False, "error": raw.decode('utf-8', errors='replace')}
     
     def create_container(self, private_key_b58: str, passphrase: str) -> dict:
         """Create an encrypted key container."""
@@ -280,15 +655,155 @@ class FFISigner:
         transaction_bytes: bytes
     ) -> dict:
         """Sign a transaction using an encrypted container."""
-        transaction_b64 = base64.b64encode(transaction_bytes).decode('ascii')
+        enc_container, enc_passphrase = self._encode_credentials(container_json, passphrase)
+        
+        if not hasattr(self.lib, "signer_sign_transaction_bytes"):
+            # Library predates the raw-bytes entry point
+            result = self.lib.signer_sign_transaction(
+                enc_container,
+                enc_passphrase,
+                base64.b64encode(transaction_bytes)
+            )
+            return self._process_result(result)
+        
+        # Raw bytes go straight across the boundary; no base64 round trip
+        transaction_bytes = bytes(transaction_bytes)  # no copy when already bytes
+        result = self.lib.signer_sign_transaction_bytes(
+            enc_container,
+            enc_passphrase,
+            transaction_bytes,
+            len(transaction_bytes)
+        )
+        return self._process_result(result)
+    
+    def sign_prepared(self, transaction_bytes: bytes) -> dict:
+        """Sign with the credentials cached by prepare()."""
+        if self._prepared is None:
+            raise RuntimeError("prepare() must be called before sign_prepared()")
+        return self.sign_transaction(*self._prepared, transaction_bytes)
+    
+    def sign_transaction_raw(
+        self,
+        container_json: str,
+        passphrase: str,
+        transaction_bytes: bytes
+    ) -> Tuple[bytes, bytes]:
+        """
+        Sign a transaction over the binary entry point.
+        
+        No base64 or JSON is involved in either direction.
+        
+        Returns:
+            Tuple of (64-byte signature, 32-byte public key)
+            
+        Raises:
+            RuntimeError: If signing fails
+        """
+        self._require("signer_sign_transaction_into")
+        enc_container, enc_passphrase = self._encode_credentials(container_json, passphrase)
+        tx_buf = (ctypes.c_ubyte * len(transaction_bytes)).from_buffer_copy(transaction_bytes)
+        
+        bufs = self._bufs
+        if not hasattr(bufs, "sig"):
+            bufs.sig = (ctypes.c_ubyte * 64)()
+            bufs.pk = (ctypes.c_ubyte * 32)()
+        
+        code = self.lib.signer_sign_transaction_into(
+            enc_container,
+            enc_passphrase,
+            tx_buf,
+            len(transaction_bytes),
+            bufs.sig,
+            bufs.pk
+        )
+        if code != 0:
+            raise RuntimeError(f"Signing failed (error code {code})")
+        return bytes(bufs.sig), bytes(bufs.pk)
+    
+    def sign_transactions(
+        self,
+        container_json: str,
+        passphrase: str,
+        transaction_bytes_list: List[bytes]
+    ) -> dict:
+        """Sign several transactions with a single container decryption."""
+        if not hasattr(self.lib, "signer_sign_transaction_batch"):
+            return self._sign_each(container_json, passphrase, transaction_bytes_list)
+        transactions_json = _json_dumps(
+            [base64.b64encode(tx).decode('ascii') for tx in transaction_bytes_list]
+        )
+        enc_container, enc_passphrase = self._encode_credentials(container_json, passphrase)
         
-        result = self.lib.signer_sign_transaction(
-            container_json.encode('utf-8'),
-            passphrase.encode('utf-8'),
-            transaction_b64.encode('utf-8')
+        result = self.lib.signer_sign_transaction_batch(
+            enc_container,
+            enc_passphrase,
+            transactions_json
         )
         return self._process_result(result)
     
+    def sign_transactions_raw(
+        self,
+        container_json: str,
+        passphrase: str,
+        transaction_bytes_list: List[bytes]
+    ) -> List[bytes]:
+        """
+        Batch-sign over the binary entry point.
+        
+        The transactions cross the boundary as one joined buffer plus an
+        offsets array rather than one allocation per transaction.
+        
+        Returns:
+            List of 64-byte signatures, in input order
+            
+        Raises:
+            RuntimeError: If signing fails
+        """
+        self._require("signer_sign_batch_raw")
+        count = len(transaction_bytes_list)
+        blob = b"".join(transaction_bytes_list)
+        offsets = (ctypes.c_uint32 * (count + 1))(
+            *itertools.accumulate((len(tx) for tx in transaction_bytes_list), initial=0)
+        )
+        sigs = (ctypes.c_ubyte * (64 * count))()
+        enc_container, enc_passphrase = self._encode_credentials(container_json, passphrase)
+        
+        code = self.lib.signer_sign_batch_raw(enc_container, enc_passphrase, blob, offsets, count, sigs)
+        if code != 0:
+            raise RuntimeError(f"Batch signing failed (error code {code})")
+        
+        raw = bytes(sigs)
+        return [raw[i:i + 64] for i in range(0, len(raw), 64)]
+    
+    def _sign_each(
+        self,
+        container_json: str,
+        passphrase: str,
+        transaction_bytes_list: List[bytes]
+    ) -> dict:
+        """sign_transactions() result built from one call per transaction, for older libraries."""
+        signatures, signed_transactions, public_key = [], [], None
+        for tx in transaction_bytes_list:
+            result = self.sign_transaction(container_json, passphrase, tx)
+            if not result["success"]:
+                return result
+            data = result["data"]
+            signatures.append(data["signature"])
+            signed_transactions.append(data.get("signed_transaction"))
+            public_key = public_key or data["public_key"]
+        return {"success": True, "data": {
+            "signatures": signatures,
+            "signed_transactions": signed_transactions,
+            "public_key": public_key
+        }}
+    
+    def _require(self, symbol: str):
+        """Raise RuntimeError if the loaded library does not export symbol."""
+        if not hasattr(self.lib, symbol):
+            raise RuntimeError(
+                f"Signer library has no {symbol}; rebuild with: cargo build --release"
+            )
+    
     def sign_direct(self, private_key_b58: str, message: bytes) -> dict:
         """Sign a message directly (less secure than using container)."""
         message_b64 = base64.b64encode(message).decode('ascii')
@@ -364,6 +879,27 @@ class SecureSigner:
         """Sign a transaction using an encrypted key container."""
         return self._backend.sign_transaction(container_json, passphrase, transaction_bytes)
     
+    def sign_transactions(
+        self,
+        container_json: str,
+        passphrase: str,
+        transaction_bytes_list: List[bytes]
+    ) -> dict:
+        """Sign a batch of transactions, running the key derivation only once."""
+        return self._backend.sign_transactions(container_json, passphrase, transaction_bytes_list)
+    
+    def prepare(self, container_json: str, passphrase: str):
+        """Hoist credential encoding out of a signing loop; pair with sign_prepared()."""
+        self._backend.prepare(container_json, passphrase)
+    
+    def clear_prepared(self):
+        """Forget the credentials passed to prepare()."""
+        self._backend.clear_prepared()
+    
+    def sign_prepared(self, transaction_bytes: bytes) -> dict:
+        """Sign a transaction with the credentials passed to prepare()."""
+        return self._backend.sign_prepared(transaction_bytes)
+    
     def __repr__(self):
         return f"SecureSigner(mode={self.mode!r})"
 
@@ -183,6 +183,62 @@ pub fn decrypt_and_sign(
     passphrase: &str,
     transaction_bytes: &[u8],
 ) -> Result<SigningResult, SignerError> {
+    let mut secure_key = decrypt_container_key(container_json, passphrase)?;
+
+    // Create signing key from secure buffer
+    // MEMORY LIFECYCLE: The signing key is created from our secure buffer
+    // and will be zeroized when dropped (ed25519-dalek supports zeroize)
+    let result = sign_with_secure_key(&mut secure_key, transaction_bytes);
+
+    // Explicit zeroization (also happens on drop)
+    secure_key.zeroize();
+
+    result
+}
+
+/// Decrypt a key container once and sign every transaction with it
+///
+/// The Argon2id derivation and AES-GCM decryption run a single time for the
+/// whole batch; the key is zeroized after the last signature (or first error).
+///
+/// # Returns
+/// One signing result per transaction, in input order
+pub fn decrypt_and_sign_batch<T: AsRef<[u8]>>(
+    container_json: &str,
+    passphrase: &str,
+    transactions: &[T],
+) -> Result<Vec<SigningResult>, SignerError> {
+    let mut secure_key = decrypt_container_key(container_json, passphrase)?;
+
+    let result = transactions
+        .iter()
+        .map(|tx| sign_with_secure_key(&mut secure_key, tx.as_ref()))
+        .collect();
+
+    secure_key.zeroize();
+
+    result
+}
+
+/// JSON body for a batch: parallel signature / signed transaction lists
+///
+/// Used by both the CLI and the FFI so their batch formats stay identical.
+pub fn batch_result_json(results: Vec<SigningResult>) -> serde_json::Value {
+    let public_key = results.first().map(|r| r.public_key.clone());
+    let (signatures, signed_transactions): (Vec<_>, Vec<_>) = results
+        .into_iter()
+        .map(|r| (r.signature, r.signed_transaction))
+        .unzip();
+
+    serde_json::json!({
+        "signatures": signatures,
+        "signed_transactions": signed_transactions,
+        "public_key": public_key,
+    })
+}
+
+/// Derive the container key and decrypt the private key into a secure buffer
+fn decrypt_container_key(container_json: &str, passphrase: &str) -> Result<SecureBuffer, SignerError> {
     // Parse the container
     let container = EncryptedKeyContainer::from_json(container_json)?;
 
@@ -203,22 +259,14 @@ pub fn decrypt_and_sign(
         .map_err(|_| SignerError::DecryptionFailed)?;
 
     // Immediately move to secure buffer and zeroize intermediate
-    let mut secure_key = SecureBuffer::from_slice_with_mode(&plaintext, get_locking_mode())?;
+    let secure_key = SecureBuffer::from_slice_with_mode(&plaintext, get_locking_mode())?;
 
     // Zeroize the derived key and plaintext copy
     derived_key.zeroize();
     // Note: plaintext is owned by cipher, can't zeroize it directly
     // But we've copied to secure buffer immediately
 
-    // Create signing key from secure buffer
-    // MEMORY LIFECYCLE: The signing key is created from our secure buffer
-    // and will be zeroized when dropped (ed25519-dalek supports zeroize)
-    let result = sign_with_secure_key(&mut secure_key, transaction_bytes);
-
-    // Explicit zeroization (also happens on drop)
-    secure_key.zeroize();
-
-    result
+    Ok(secure_key)
 }
 
 /// Sign a transaction with a key in a secure buffer
@@ -389,6 +437,25 @@ mod tests {
         assert!(matches!(result, Err(SignerError::DecryptionFailed)));
     }
 
+    #[test]
+    fn test_batch_matches_single_signing() {
+        enable_permissive_mode();
+
+        let mut seed = [0u8; 32];
+        OsRng.fill_bytes(&mut seed);
+        let passphrase = "batch_passphrase";
+        let json = EncryptedKeyContainer::encrypt(&seed, passphrase).unwrap().to_json().unwrap();
+
+        let messages: [&[u8]; 2] = [b"first message", b"second message"];
+        let results = decrypt_and_sign_batch(&json, passphrase, &messages).unwrap();
+
+        assert_eq!(results.len(), 2);
+        for (message, result) in messages.iter().zip(&results) {
+            let single = decrypt_and_sign(&json, passphrase, message).unwrap();
+            assert_eq!(result.signature, single.signature);
+        }
+    }
+
     #[test]
     fn test_signature_verification() {
         enable_permissive_mode();
@@ -14,8 +14,13 @@
 
 use std::ffi::{CStr, CString};
 use std::os::raw::c_char;
+use std::slice;
 
-use crate::crypto::{create_encrypted_key_container, decrypt_and_sign};
+use serde::Serialize;
+
+use crate::crypto::{
+    batch_result_json, create_encrypted_key_container, decrypt_and_sign_batch, SigningResult,
+};
 
 /// Result code for FFI operations
 #[repr(C)]
@@ -43,6 +48,45 @@ impl SignerResult {
     }
 }
 
+/// Binary result for the raw-bytes FFI entry points
+///
+/// On success `data`/`data_len` hold the payload and `error_message` is null;
+/// on failure `data` is null and `error_message` describes the error.
+/// Must be released with signer_free_ffi_result().
+#[repr(C)]
+pub struct FFIResult {
+    /// 0 for success, non-zero for error
+    pub error_code: i32,
+    /// Payload bytes (null on error)
+    pub data: *mut u8,
+    /// Length of the payload in bytes
+    pub data_len: usize,
+    /// Error message (null on success)
+    pub error_message: *mut c_char,
+}
+
+impl FFIResult {
+    fn success(data: Vec<u8>) -> Self {
+        let data = data.into_boxed_slice();
+        let data_len = data.len();
+        Self {
+            error_code: 0,
+            data: Box::into_raw(data) as *mut u8,
+            data_len,
+            error_message: std::ptr::null_mut(),
+        }
+    }
+
+    fn error(code: i32, message: &str) -> Self {
+        Self {
+            error_code: code,
+            data: std::ptr::null_mut(),
+            data_len: 0,
+            error_message: CString::new(message).unwrap_or_default().into_raw(),
+        }
+    }
+}
+
 /// Create an encrypted key container from a private key
 ///
 /// # Arguments
@@ -87,6 +131,110 @@ pub unsafe extern "C" fn signer_create_container(
     }
 }
 
+/// Error code and message from a failed FFI call
+///
+/// Converted into whichever result type the entry point returns; the
+/// integer-returning entry points use only `code`.
+struct FfiError {
+    code: i32,
+    message: String,
+}
+
+impl FfiError {
+    fn new(code: i32, message: impl Into<String>) -> Self {
+        Self {
+            code,
+            message: message.into(),
+        }
+    }
+}
+
+impl From<FfiError> for SignerResult {
+    fn from(e: FfiError) -> Self {
+        SignerResult::error(e.code, &e.message)
+    }
+}
+
+impl From<FfiError> for FFIResult {
+    fn from(e: FfiError) -> Self {
+        FFIResult::error(e.code, &e.message)
+    }
+}
+
+/// Borrow a null-terminated UTF-8 argument
+unsafe fn str_arg<'a>(ptr: *const c_char, name: &str) -> Result<&'a str, FfiError> {
+    if ptr.is_null() {
+        return Err(FfiError::new(1, "Null pointer argument"));
+    }
+    CStr::from_ptr(ptr)
+        .to_str()
+        .map_err(|_| FfiError::new(2, format!("Invalid UTF-8 in {}", name)))
+}
+
+/// Borrow a pointer/length byte argument
+unsafe fn bytes_arg<'a>(ptr: *const u8, len: usize) -> Result<&'a [u8], FfiError> {
+    if ptr.is_null() {
+        return Err(FfiError::new(1, "Null pointer argument"));
+    }
+    Ok(slice::from_raw_parts(ptr, len))
+}
+
+/// Borrow a pointer/length UTF-8 argument (not null-terminated)
+unsafe fn utf8_arg<'a>(ptr: *const u8, len: usize, name: &str) -> Result<&'a str, FfiError> {
+    std::str::from_utf8(bytes_arg(ptr, len)?)
+        .map_err(|_| FfiError::new(2, format!("Invalid UTF-8 in {}", name)))
+}
+
+/// Decrypt the container once and sign each transaction
+///
+/// Every signing entry point goes through here; they differ only in how
+/// their arguments arrive and how the results are packed.
+fn sign_all<T: AsRef<[u8]>>(
+    container: &str,
+    passphrase: &str,
+    transactions: &[T],
+) -> Result<Vec<SigningResult>, FfiError> {
+    decrypt_and_sign_batch(container, passphrase, transactions)
+        .map_err(|e| FfiError::new(4, e.to_string()))
+}
+
+fn sign_one(container: &str, passphrase: &str, transaction: &[u8]) -> Result<SigningResult, FfiError> {
+    sign_all(container, passphrase, &[transaction])?
+        .pop()
+        .ok_or_else(|| FfiError::new(4, "No signing result"))
+}
+
+/// Decode a base58 result field into a buffer of exactly its size
+fn decode_exact(encoded: &str, out: &mut [u8]) -> Result<(), FfiError> {
+    let expected = out.len();
+    match bs58::decode(encoded).onto(out) {
+        Ok(n) if n == expected => Ok(()),
+        Ok(n) => Err(FfiError::new(
+            5,
+            format!("Serialization error: expected {} bytes, got {}", expected, n),
+        )),
+        Err(e) => Err(FfiError::new(5, format!("Serialization error: {}", e))),
+    }
+}
+
+fn decode_signed_tx(result: &SigningResult) -> Result<Vec<u8>, FfiError> {
+    match &result.signed_transaction {
+        Some(signed_tx) => base64::Engine::decode(&base64::engine::general_purpose::STANDARD, signed_tx)
+            .map_err(|e| FfiError::new(5, format!("Serialization error: {}", e))),
+        None => Ok(Vec::new()),
+    }
+}
+
+fn json_result<T: Serialize>(result: Result<T, FfiError>) -> SignerResult {
+    match result.and_then(|value| {
+        serde_json::to_string(&value)
+            .map_err(|e| FfiError::new(5, format!("Serialization error: {}", e)))
+    }) {
+        Ok(json) => SignerResult::success(json),
+        Err(e) => e.into(),
+    }
+}
+
 /// Decrypt a key container and sign a transaction
 ///
 /// # Arguments
@@ -105,40 +253,236 @@ pub unsafe extern "C" fn signer_sign_transaction(
     passphrase: *const c_char,
     transaction_b64: *const c_char,
 ) -> SignerResult {
-    // Validate inputs
-    if container_json.is_null() || passphrase.is_null() || transaction_b64.is_null() {
-        return SignerResult::error(1, "Null pointer argument");
+    json_result((|| -> Result<SigningResult, FfiError> {
+        let container = str_arg(container_json, "container")?;
+        let passphrase = str_arg(passphrase, "passphrase")?;
+        let transaction = base64::Engine::decode(
+            &base64::engine::general_purpose::STANDARD,
+            str_arg(transaction_b64, "transaction")?,
+        )
+        .map_err(|e| FfiError::new(3, format!("Base64 decode error: {}", e)))?;
+
+        sign_one(container, passphrase, &transaction)
+    })())
+}
+
+/// Sign raw transaction bytes using an encrypted key container
+///
+/// Same JSON result as signer_sign_transaction, but the transaction is passed
+/// as a pointer and length instead of a base64 string.
+///
+/// # Arguments
+/// * `container_json` - JSON string of the encrypted container
+/// * `passphrase` - Null-terminated passphrase string
+/// * `tx_ptr`/`tx_len` - Raw unsigned transaction bytes
+///
+/// # Returns
+/// SignerResult with JSON signing result on success
+///
+/// # Safety
+/// Strings must be valid and null-terminated; `tx_ptr` must be valid for `tx_len` bytes.
+#[no_mangle]
+pub unsafe extern "C" fn signer_sign_transaction_bytes(
+    container_json: *const c_char,
+    passphrase: *const c_char,
+    tx_ptr: *const u8,
+    tx_len: usize,
+) -> SignerResult {
+    json_result((|| -> Result<SigningResult, FfiError> {
+        sign_one(
+            str_arg(container_json, "container")?,
+            str_arg(passphrase, "passphrase")?,
+            bytes_arg(tx_ptr, tx_len)?,
+        )
+    })())
+}
+
+/// Sign several transactions with one container decryption
+///
+/// # Arguments
+/// * `container_json` - JSON string of the encrypted container
+/// * `passphrase` - Null-terminated passphrase string
+/// * `transactions_json` - JSON array of base64-encoded unsigned transactions
+///
+/// # Returns
+/// SignerResult with JSON `{"signatures": [...], "signed_transactions": [...], "public_key": ...}`
+///
+/// # Safety
+/// All pointers must be valid, null-terminated C strings.
+#[no_mangle]
+pub unsafe extern "C" fn signer_sign_transaction_batch(
+    container_json: *const c_char,
+    passphrase: *const c_char,
+    transactions_json: *const c_char,
+) -> SignerResult {
+    json_result((|| -> Result<serde_json::Value, FfiError> {
+        let container = str_arg(container_json, "container")?;
+        let passphrase = str_arg(passphrase, "passphrase")?;
+        let encoded: Vec<String> = serde_json::from_str(str_arg(transactions_json, "transaction list")?)
+            .map_err(|e| FfiError::new(2, format!("Invalid transaction list: {}", e)))?;
+
+        let transactions = encoded
+            .iter()
+            .map(|tx| base64::Engine::decode(&base64::engine::general_purpose::STANDARD, tx))
+            .collect::<Result<Vec<_>, _>>()
+            .map_err(|e| FfiError::new(3, format!("Base64 decode error: {}", e)))?;
+
+        Ok(batch_result_json(sign_all(container, passphrase, &transactions)?))
+    })())
+}
+
+/// Sign a transaction from raw byte buffers, returning a packed binary result
+///
+/// # Arguments
+/// * `container_ptr`/`container_len` - Encrypted container JSON (UTF-8, not null-terminated)
+/// * `pass_ptr`/`pass_len` - Passphrase (UTF-8, not null-terminated)
+/// * `tx_ptr`/`tx_len` - Raw unsigned transaction bytes
+///
+/// On success `data` is laid out as `[signature:64][tx_len:u32 LE][signed_tx:tx_len]`.
+///
+/// # Returns
+/// FFIResult; must be released with signer_free_ffi_result()
+///
+/// # Safety
+/// Each pointer must be valid for reads of its length.
+#[no_mangle]
+pub unsafe extern "C" fn signer_sign_transaction_bin(
+    container_ptr: *const u8,
+    container_len: usize,
+    pass_ptr: *const u8,
+    pass_len: usize,
+    tx_ptr: *const u8,
+    tx_len: usize,
+) -> FFIResult {
+    let packed = (|| -> Result<Vec<u8>, FfiError> {
+        let result = sign_one(
+            utf8_arg(container_ptr, container_len, "container")?,
+            utf8_arg(pass_ptr, pass_len, "passphrase")?,
+            bytes_arg(tx_ptr, tx_len)?,
+        )?;
+
+        let mut signature = [0u8; 64];
+        decode_exact(&result.signature, &mut signature)?;
+        let signed_tx = decode_signed_tx(&result)?;
+
+        let mut data = Vec::with_capacity(signature.len() + 4 + signed_tx.len());
+        data.extend_from_slice(&signature);
+        data.extend_from_slice(&(signed_tx.len() as u32).to_le_bytes());
+        data.extend_from_slice(&signed_tx);
+        Ok(data)
+    })();
+
+    match packed {
+        Ok(data) => FFIResult::success(data),
+        Err(e) => e.into(),
     }
+}
 
-    let container_str = match CStr::from_ptr(container_json).to_str() {
-        Ok(s) => s,
-        Err(_) => return SignerResult::error(2, "Invalid UTF-8 in container"),
-    };
+/// Sign a transaction into caller-supplied buffers, allocating nothing on the Rust side
+///
+/// # Arguments
+/// * `container_json` - Null-terminated JSON string of the encrypted container
+/// * `passphrase` - Null-terminated passphrase string
+/// * `tx_ptr`/`tx_len` - Raw unsigned transaction bytes
+/// * `sig_out` - Receives the 64-byte signature
+/// * `pubkey_out` - Receives the 32-byte public key
+///
+/// # Returns
+/// 0 on success, otherwise the error code (same codes as SignerResult)
+///
+/// # Safety
+/// Strings must be valid and null-terminated, `tx_ptr` valid for `tx_len` bytes,
+/// `sig_out` writable for 64 bytes and `pubkey_out` for 32 bytes.
+#[no_mangle]
+pub unsafe extern "C" fn signer_sign_transaction_into(
+    container_json: *const c_char,
+    passphrase: *const c_char,
+    tx_ptr: *const u8,
+    tx_len: usize,
+    sig_out: *mut u8,
+    pubkey_out: *mut u8,
+) -> i32 {
+    if sig_out.is_null() || pubkey_out.is_null() {
+        return 1;
+    }
 
-    let passphrase_str = match CStr::from_ptr(passphrase).to_str() {
-        Ok(s) => s,
-        Err(_) => return SignerResult::error(2, "Invalid UTF-8 in passphrase"),
-    };
+    let signed = (|| -> Result<(), FfiError> {
+        let result = sign_one(
+            str_arg(container_json, "container")?,
+            str_arg(passphrase, "passphrase")?,
+            bytes_arg(tx_ptr, tx_len)?,
+        )?;
+        decode_exact(&result.signature, slice::from_raw_parts_mut(sig_out, 64))?;
+        decode_exact(&result.public_key, slice::from_raw_parts_mut(pubkey_out, 32))
+    })();
+
+    match signed {
+        Ok(()) => 0,
+        Err(e) => e.code,
+    }
+}
 
-    let transaction_str = match CStr::from_ptr(transaction_b64).to_str() {
-        Ok(s) => s,
-        Err(_) => return SignerResult::error(2, "Invalid UTF-8 in transaction"),
-    };
+/// Sign a batch of transactions laid out in one contiguous buffer
+///
+/// Transaction `i` is `tx_blob[offsets[i]..offsets[i + 1]]`, so `offsets` holds
+/// `count + 1` entries. The container is decrypted once for the whole batch.
+///
+/// # Arguments
+/// * `container_json` - Null-terminated JSON string of the encrypted container
+/// * `passphrase` - Null-terminated passphrase string
+/// * `tx_blob` - All unsigned transactions concatenated
+/// * `offsets` - `count + 1` ascending byte offsets into `tx_blob`
+/// * `count` - Number of transactions
+/// * `sigs_out` - Receives `64 * count` bytes of signatures, in order
+///
+/// # Returns
+/// 0 on success, otherwise an error code (same codes as SignerResult)
+///
+/// # Safety
+/// Strings must be valid and null-terminated, `offsets` readable for `count + 1`
+/// entries, `tx_blob` readable up to `offsets[count]` and `sigs_out` writable
+/// for `64 * count` bytes.
+#[no_mangle]
+pub unsafe extern "C" fn signer_sign_batch_raw(
+    container_json: *const c_char,
+    passphrase: *const c_char,
+    tx_blob: *const u8,
+    offsets: *const u32,
+    count: u32,
+    sigs_out: *mut u8,
+) -> i32 {
+    if offsets.is_null() || sigs_out.is_null() {
+        return 1;
+    }
 
-    // Decode the transaction
-    let transaction_bytes =
-        match base64::Engine::decode(&base64::engine::general_purpose::STANDARD, transaction_str) {
-            Ok(t) => t,
-            Err(e) => return SignerResult::error(3, &format!("Base64 decode error: {}", e)),
-        };
+    let signed = (|| -> Result<(), FfiError> {
+        let container = str_arg(container_json, "container")?;
+        let passphrase = str_arg(passphrase, "passphrase")?;
 
-    // Decrypt and sign
-    match decrypt_and_sign(container_str, passphrase_str, &transaction_bytes) {
-        Ok(result) => match serde_json::to_string(&result) {
-            Ok(json) => SignerResult::success(json),
-            Err(e) => SignerResult::error(5, &format!("Serialization error: {}", e)),
-        },
-        Err(e) => SignerResult::error(4, &e.to_string()),
+        let count = count as usize;
+        let offsets = slice::from_raw_parts(offsets, count + 1);
+        if offsets.windows(2).any(|w| w[0] > w[1]) {
+            return Err(FfiError::new(1, "Offsets are not ascending"));
+        }
+        let blob_len = offsets[count] as usize;
+        let blob = if blob_len == 0 { &[][..] } else { bytes_arg(tx_blob, blob_len)? };
+
+        let transactions: Vec<&[u8]> = offsets
+            .windows(2)
+            .map(|w| &blob[w[0] as usize..w[1] as usize])
+            .collect();
+
+        let results = sign_all(container, passphrase, &transactions)?;
+        let sigs = slice::from_raw_parts_mut(sigs_out, 64 * count);
+        for (result, out) in results.iter().zip(sigs.chunks_exact_mut(64)) {
+            decode_exact(&result.signature, out)?;
+        }
+        Ok(())
+    })();
+
+    match signed {
+        Ok(()) => 0,
+        Err(e) => e.code,
     }
 }
 
@@ -220,6 +564,28 @@ pub unsafe extern "C" fn signer_free_result(result: SignerResult) {
     signer_free_string(result.result);
 }
 
+/// Free the buffers owned by an FFIResult and reset it
+///
+/// # Safety
+/// The result must have been returned by signer_sign_transaction_bin.
+#[no_mangle]
+pub unsafe extern "C" fn signer_free_ffi_result(result: *mut FFIResult) {
+    if result.is_null() {
+        return;
+    }
+
+    let result = &mut *result;
+    if !result.data.is_null() {
+        let data = slice::from_raw_parts_mut(result.data, result.data_len);
+        drop(Box::from_raw(data as *mut [u8]));
+    }
+    signer_free_string(result.error_message);
+
+    result.data = std::ptr::null_mut();
+    result.data_len = 0;
+    result.error_message = std::ptr::null_mut();
+}
+
 /// Get the library version
 ///
 /// # Returns
@@ -275,6 +641,83 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_ffi_sign_transaction_bin() {
+        let seed = [7u8; 32];
+        let container = create_encrypted_key_container(&seed, "test_password").unwrap();
+        let passphrase = b"test_password";
+        let transaction = b"raw transaction bytes";
+
+        unsafe {
+            let mut result = signer_sign_transaction_bin(
+                container.as_ptr(),
+                container.len(),
+                passphrase.as_ptr(),
+                passphrase.len(),
+                transaction.as_ptr(),
+                transaction.len(),
+            );
+            assert_eq!(result.error_code, 0);
+
+            let data = slice::from_raw_parts(result.data, result.data_len);
+            let tx_len = u32::from_le_bytes(data[64..68].try_into().unwrap()) as usize;
+            assert_eq!(data.len(), 68 + tx_len);
+
+            signer_free_ffi_result(&mut result);
+        }
+    }
+
+    #[test]
+    fn test_ffi_sign_transaction_into() {
+        let seed = [7u8; 32];
+        let container = CString::new(create_encrypted_key_container(&seed, "test_password").unwrap()).unwrap();
+        let pass_cstr = CString::new("test_password").unwrap();
+        let transaction = b"raw transaction bytes";
+        let mut signature = [0u8; 64];
+        let mut public_key = [0u8; 32];
+
+        unsafe {
+            let code = signer_sign_transaction_into(
+                container.as_ptr(),
+                pass_cstr.as_ptr(),
+                transaction.as_ptr(),
+                transaction.len(),
+                signature.as_mut_ptr(),
+                public_key.as_mut_ptr(),
+            );
+            assert_eq!(code, 0);
+        }
+
+        let expected = ed25519_dalek::SigningKey::from_bytes(&seed).verifying_key();
+        assert_eq!(&public_key, expected.as_bytes());
+    }
+
+    #[test]
+    fn test_ffi_sign_batch_raw() {
+        let seed = [7u8; 32];
+        let json = create_encrypted_key_container(&seed, "test_password").unwrap();
+        let container = CString::new(json.clone()).unwrap();
+        let pass_cstr = CString::new("test_password").unwrap();
+        let blob = b"firstsecond";
+        let offsets: [u32; 3] = [0, 5, 11];
+        let mut sigs = [0u8; 128];
+
+        let code = unsafe {
+            signer_sign_batch_raw(
+                container.as_ptr(),
+                pass_cstr.as_ptr(),
+                blob.as_ptr(),
+                offsets.as_ptr(),
+                2,
+                sigs.as_mut_ptr(),
+            )
+        };
+        assert_eq!(code, 0);
+
+        let second = crate::crypto::decrypt_and_sign(&json, "test_password", b"second").unwrap();
+        assert_eq!(bs58::encode(&sigs[64..]).into_string(), second.signature);
+    }
+
     #[test]
     fn test_ffi_version() {
         let version_ptr = signer_version();
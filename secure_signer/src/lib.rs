@@ -28,8 +28,8 @@ pub mod secure_buffer;
 pub mod ffi;
 
 pub use crypto::{
-    create_encrypted_key_container, decrypt_and_sign, sign_transaction, EncryptedKeyContainer,
-    SigningResult,
+    batch_result_json, create_encrypted_key_container, decrypt_and_sign, decrypt_and_sign_batch,
+    sign_transaction, EncryptedKeyContainer, SigningResult,
 };
 pub use error::SignerError;
 pub use secure_buffer::{LockingMode, SecureBuffer};
@@ -40,7 +40,8 @@ pub const VERSION: &str = env!("CARGO_PKG_VERSION");
 /// Re-export for convenience
 pub mod prelude {
     pub use crate::crypto::{
-        create_encrypted_key_container, decrypt_and_sign, EncryptedKeyContainer,
+        create_encrypted_key_container, decrypt_and_sign, decrypt_and_sign_batch,
+        EncryptedKeyContainer,
     };
     pub use crate::error::SignerError;
     pub use crate::secure_buffer::SecureBuffer;
@@ -14,6 +14,12 @@
 //!
 //! # One-shot mode (stdin/stdout)
 //! echo '{"action":"sign",...}' | solana-signer --stdin
+//!
+//! # Persistent server mode (newline-delimited JSON, replies echo the request id)
+//! solana-signer --server
+//!
+//! # Persistent binary signing stream (length-prefixed frames)
+//! solana-signer sign-stream
 //! ```
 //!
 //! # Security
@@ -24,11 +30,12 @@
 
 use clap::{Parser, Subcommand};
 use serde::{Deserialize, Serialize};
-use std::io::{self, BufRead, Write};
+use std::io::{self, BufRead, Read, Write};
+use zeroize::Zeroize;
 
 use solana_secure_signer::{
-    create_encrypted_key_container, decrypt_and_sign, sign_transaction, EncryptedKeyContainer,
-    SignerError,
+    batch_result_json, create_encrypted_key_container, decrypt_and_sign, decrypt_and_sign_batch,
+    sign_transaction, EncryptedKeyContainer, SignerError,
 };
 
 #[derive(Parser)]
@@ -43,6 +50,10 @@ struct Cli {
     #[arg(long)]
     stdin: bool,
 
+    /// Serve JSON requests tagged with an "id" until EOF or {"action":"quit"}
+    #[arg(long)]
+    server: bool,
+
     /// Output format: json or text
     #[arg(long, default_value = "json")]
     format: String,
@@ -91,6 +102,15 @@ enum Commands {
         message: String,
     },
 
+    /// Sign repeatedly over stdin/stdout using length-prefixed binary frames
+    ///
+    /// Request: three frames (container JSON, passphrase, raw transaction),
+    /// each a 4-byte big-endian length followed by that many bytes.
+    /// Reply: 1 status byte (0 = ok), 4-byte big-endian length, payload.
+    /// On success the payload is the 64-byte signature followed by the
+    /// signed transaction; on error it is the UTF-8 error message.
+    SignStream,
+
     /// Check system capabilities
     Check,
 }
@@ -109,6 +129,16 @@ enum StdinCommand {
         container: String,
         passphrase: String,
         transaction: String,
+        #[serde(default)]
+        transaction_encoding: Option<String>,
+    },
+    #[serde(rename = "sign_batch")]
+    SignBatch {
+        container: String,
+        passphrase: String,
+        transactions: Vec<String>,
+        #[serde(default)]
+        transaction_encoding: Option<String>,
     },
     #[serde(rename = "sign_direct")]
     SignDirect { private_key: String, message: String },
@@ -116,6 +146,14 @@ enum StdinCommand {
     Check,
 }
 
+/// Server-mode reply: the output tagged with the request id
+#[derive(Serialize)]
+struct ServerReply {
+    id: serde_json::Value,
+    #[serde(flatten)]
+    output: Output,
+}
+
 /// JSON output format
 #[derive(Serialize)]
 struct Output {
@@ -147,6 +185,11 @@ impl Output {
 fn main() {
     let cli = Cli::parse();
 
+    if cli.server {
+        run_server_mode();
+        return;
+    }
+
     if cli.stdin {
         run_stdin_mode();
         return;
@@ -167,6 +210,11 @@ fn main() {
 
         Some(Commands::SignDirect { key, message }) => handle_sign_direct(&key, &message),
 
+        Some(Commands::SignStream) => {
+            run_sign_stream();
+            return;
+        }
+
         Some(Commands::Check) => handle_check(),
 
         None => {
@@ -213,12 +261,153 @@ fn run_stdin_mode() {
     }
 }
 
+fn run_server_mode() {
+    let stdin = io::stdin();
+    let stdout = io::stdout();
+    let mut stdout = stdout.lock();
+
+    for line in stdin.lock().lines() {
+        let line = match line {
+            Ok(l) => l,
+            Err(_) => return,
+        };
+
+        if line.trim().is_empty() {
+            continue;
+        }
+
+        let request: serde_json::Value = match serde_json::from_str(&line) {
+            Ok(v) => v,
+            Err(e) => {
+                let reply = ServerReply {
+                    id: serde_json::Value::Null,
+                    output: Output::error(&format!("Invalid JSON: {}", e)),
+                };
+                if writeln!(stdout, "{}", serde_json::to_string(&reply).unwrap()).is_err() {
+                    return;
+                }
+                let _ = stdout.flush();
+                continue;
+            }
+        };
+
+        if request.get("action").and_then(|a| a.as_str()) == Some("quit") {
+            return;
+        }
+
+        let id = request.get("id").cloned().unwrap_or(serde_json::Value::Null);
+        let output = match serde_json::from_value::<StdinCommand>(request) {
+            Ok(command) => run_command(command),
+            Err(e) => Output::error(&format!("Invalid JSON: {}", e)),
+        };
+
+        let reply = ServerReply { id, output };
+        if writeln!(stdout, "{}", serde_json::to_string(&reply).unwrap()).is_err()
+            || stdout.flush().is_err()
+        {
+            return;
+        }
+    }
+}
+
+/// Largest sign-stream frame accepted (1 MiB, the same as the Python STREAM_LIMIT)
+const MAX_FRAME_LEN: usize = 1 << 20;
+
+/// Read one length-prefixed frame; `Ok(None)` on a clean EOF before the header
+fn read_frame(reader: &mut impl Read) -> io::Result<Option<Vec<u8>>> {
+    let mut header = [0u8; 4];
+    match reader.read_exact(&mut header) {
+        Ok(()) => {}
+        Err(e) if e.kind() == io::ErrorKind::UnexpectedEof => return Ok(None),
+        Err(e) => return Err(e),
+    }
+
+    // The length is untrusted; refuse it before allocating
+    let len = u32::from_be_bytes(header) as usize;
+    if len > MAX_FRAME_LEN {
+        return Err(io::Error::new(
+            io::ErrorKind::InvalidData,
+            format!("frame of {} bytes exceeds the {} byte limit", len, MAX_FRAME_LEN),
+        ));
+    }
+
+    let mut frame = vec![0u8; len];
+    reader.read_exact(&mut frame)?;
+    Ok(Some(frame))
+}
+
+fn run_sign_stream() {
+    let stdin = io::stdin();
+    let mut input = stdin.lock();
+    let stdout = io::stdout();
+    let mut output = stdout.lock();
+
+    loop {
+        let container = match read_frame(&mut input) {
+            Ok(Some(frame)) => frame,
+            _ => return,
+        };
+        let mut passphrase = match read_frame(&mut input) {
+            Ok(Some(frame)) => frame,
+            _ => return,
+        };
+        let transaction = match read_frame(&mut input) {
+            Ok(Some(frame)) => frame,
+            _ => {
+                passphrase.zeroize();
+                return;
+            }
+        };
+
+        let reply = sign_stream_request(&container, &passphrase, &transaction);
+        passphrase.zeroize();
+
+        let (status, payload) = match reply {
+            Ok(payload) => (0u8, payload),
+            Err(e) => (1u8, e.to_string().into_bytes()),
+        };
+
+        let written = output
+            .write_all(&[status])
+            .and_then(|_| output.write_all(&(payload.len() as u32).to_be_bytes()))
+            .and_then(|_| output.write_all(&payload))
+            .and_then(|_| output.flush());
+        if written.is_err() {
+            return;
+        }
+    }
+}
+
+fn sign_stream_request(
+    container: &[u8],
+    passphrase: &[u8],
+    transaction: &[u8],
+) -> Result<Vec<u8>, SignerError> {
+    let container_json =
+        std::str::from_utf8(container).map_err(|e| SignerError::ContainerError(e.to_string()))?;
+    let passphrase =
+        std::str::from_utf8(passphrase).map_err(|e| SignerError::SerializationError(e.to_string()))?;
+
+    let result = decrypt_and_sign(container_json, passphrase, transaction)?;
+
+    let mut payload = bs58::decode(&result.signature).into_vec()?;
+    if let Some(signed_tx) = result.signed_transaction {
+        payload.extend(base64::Engine::decode(
+            &base64::engine::general_purpose::STANDARD,
+            signed_tx,
+        )?);
+    }
+    Ok(payload)
+}
+
 fn process_stdin_command(json: &str) -> Output {
-    let command: StdinCommand = match serde_json::from_str(json) {
-        Ok(c) => c,
-        Err(e) => return Output::error(&format!("Invalid JSON: {}", e)),
-    };
+    match serde_json::from_str(json) {
+        Ok(command) => run_command(command),
+        Err(e) => Output::error(&format!("Invalid JSON: {}", e)),
+    }
+}
 
+fn run_command(command: StdinCommand) -> Output {
     let result = match command {
         StdinCommand::CreateContainer {
             private_key,
@@ -229,7 +418,25 @@ fn process_stdin_command(json: &str) -> Output {
             container,
             passphrase,
             transaction,
-        } => handle_sign_inline(&container, &passphrase, &transaction),
+            transaction_encoding,
+        } => handle_sign_inline(
+            &container,
+            &passphrase,
+            &transaction,
+            transaction_encoding.as_deref(),
+        ),
+
+        StdinCommand::SignBatch {
+            container,
+            passphrase,
+            transactions,
+            transaction_encoding,
+        } => handle_sign_batch(
+            &container,
+            &passphrase,
+            &transactions,
+            transaction_encoding.as_deref(),
+        ),
 
         StdinCommand::SignDirect {
             private_key,
@@ -287,20 +494,33 @@ fn handle_sign(
         std::fs::read_to_string(container_path)?
     };
 
-    handle_sign_inline(&container_json, passphrase, transaction_b64)
+    handle_sign_inline(&container_json, passphrase, transaction_b64, None)
+}
+
+/// Decode a transaction sent as base64 (the default) or hex
+fn decode_transaction(encoded: &str, encoding: Option<&str>) -> Result<Vec<u8>, SignerError> {
+    match encoding {
+        None | Some("base64") => {
+            base64::Engine::decode(&base64::engine::general_purpose::STANDARD, encoded)
+                .map_err(|e| SignerError::Base64Error(e.to_string()))
+        }
+        Some("hex") => hex::decode(encoded)
+            .map_err(|e| SignerError::InvalidTransaction(format!("hex decoding error: {}", e))),
+        Some(other) => Err(SignerError::InvalidTransaction(format!(
+            "unknown transaction encoding: {}",
+            other
+        ))),
+    }
 }
 
 fn handle_sign_inline(
     container_json: &str,
     passphrase: &str,
-    transaction_b64: &str,
+    transaction: &str,
+    encoding: Option<&str>,
 ) -> Result<Output, SignerError> {
     // Decode transaction
-    let transaction_bytes = base64::Engine::decode(
-        &base64::engine::general_purpose::STANDARD,
-        transaction_b64,
-    )
-    .map_err(|e| SignerError::Base64Error(e.to_string()))?;
+    let transaction_bytes = decode_transaction(transaction, encoding)?;
 
     // Sign
     let result = decrypt_and_sign(container_json, passphrase, &transaction_bytes)?;
@@ -308,6 +528,23 @@ fn handle_sign_inline(
     Ok(Output::success(serde_json::to_value(&result)?))
 }
 
+fn handle_sign_batch(
+    container_json: &str,
+    passphrase: &str,
+    encoded_transactions: &[String],
+    encoding: Option<&str>,
+) -> Result<Output, SignerError> {
+    let transactions = encoded_transactions
+        .iter()
+        .map(|tx| decode_transaction(tx, encoding))
+        .collect::<Result<Vec<_>, _>>()?;
+
+    // One key derivation and decryption for the whole batch
+    let results = decrypt_and_sign_batch(container_json, passphrase, &transactions)?;
+
+    Ok(Output::success(batch_result_json(results)))
+}
+
 fn handle_sign_direct(key_b58: &str, message_b64: &str) -> Result<Output, SignerError> {
     // Decode inputs
     let private_key = bs58::decode(key_b58)
@@ -341,10 +578,33 @@ fn handle_check() -> Result<Output, SignerError> {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_read_frame() {
+        let mut data: &[u8] = &[0, 0, 0, 3, b'a', b'b', b'c'];
+        assert_eq!(read_frame(&mut data).unwrap(), Some(b"abc".to_vec()));
+        assert_eq!(read_frame(&mut data).unwrap(), None);
+    }
+
+    #[test]
+    fn test_read_frame_rejects_oversized_length() {
+        let mut data: &[u8] = &[0xff, 0xff, 0xff, 0xff];
+        let err = read_frame(&mut data).unwrap_err();
+        assert_eq!(err.kind(), io::ErrorKind::InvalidData);
+    }
+
     #[test]
     fn test_stdin_command_parsing() {
         let json = r#"{"action":"check"}"#;
         let cmd: StdinCommand = serde_json::from_str(json).unwrap();
         assert!(matches!(cmd, StdinCommand::Check));
     }
+
+    #[test]
+    fn test_decode_transaction_encodings() {
+        let bytes = b"\x01\x02\xfe\xff";
+        assert_eq!(decode_transaction("AQL+/w==", None).unwrap(), bytes);
+        assert_eq!(decode_transaction("AQL+/w==", Some("base64")).unwrap(), bytes);
+        assert_eq!(decode_transaction("0102feff", Some("hex")).unwrap(), bytes);
+        assert!(decode_transaction("0102feff", Some("base32")).is_err());
+    }
 }
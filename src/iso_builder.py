@@ -11,8 +11,9 @@ import shutil
 import tempfile
 import json
 import platform
+import errno
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 from src.ui import (
     print_success, print_error, print_info, print_warning,
@@ -22,6 +23,10 @@ from src.ui import (
 from config import ALPINE_MINIROOTFS_URL, NETWORK_BLACKLIST_MODULES
 
 
+# Bytes handed to the kernel per copy_file_range/sendfile call when flashing
+FLASH_CHUNK_SIZE = 16 * 1024 * 1024
+
+
 class ISOBuilder:
     def __init__(self):
         self.work_dir: Optional[Path] = None
@@ -31,9 +36,28 @@ class ISOBuilder:
         self.is_windows = platform.system() == 'Windows'
         self.is_macos = platform.system() == 'Darwin'
         self.is_linux = platform.system() == 'Linux'
+        self._progress_cb: Optional[Callable[[int, int, str], None]] = None
+    
+    def _step(self, step: int, total: int, message: str):
+        """Print a build stage and forward it to the caller's progress callback"""
+        print_step(step, total, message)
+        if self._progress_cb:
+            self._progress_cb(step, total, message)
+    
+    def build_complete_iso(self, output_dir: str = "./output",
+                           progress_cb: Optional[Callable[[int, int, str], None]] = None) -> Optional[Path]:
+        """Build complete bootable ISO with transaction signing and keygen
+        
+        progress_cb(step, total, message) is called as each stage starts; it may
+        run on a worker thread when the build is submitted to an executor.
+        """
+        self._progress_cb = progress_cb
+        try:
+            return self._build_complete_iso(output_dir)
+        finally:
+            self._progress_cb = None
     
-    def build_complete_iso(self, output_dir: str = "./output") -> Optional[Path]:
-        """Build complete bootable ISO with transaction signing and keygen"""
+    def _build_complete_iso(self, output_dir: str) -> Optional[Path]:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
@@ -66,7 +90,7 @@ class ISOBuilder:
         
         # On Windows, skip the Alpine download and use simplified approach
         if self.is_windows:
-            print_step(1, 7, "Preparing wallet structure for Windows...")
+            self._step(1, 7, "Preparing wallet structure for Windows...")
             print_info("Using simplified wallet structure for Windows")
             # Create a dummy tarball path to satisfy the workflow
             tarball_path = self.work_dir / "wallet_structure.marker"
@@ -75,7 +99,7 @@ class ISOBuilder:
         
         tarball_path = self.work_dir / "alpine-minirootfs.tar.gz"
         
-        print_step(1, 7, "Downloading Alpine Linux minirootfs...")
+        self._step(1, 7, "Downloading Alpine Linux minirootfs...")
         
         try:
             result = subprocess.run(
@@ -109,7 +133,7 @@ class ISOBuilder:
             return None
     
     def extract_rootfs(self, tarball_path: Path) -> Optional[Path]:
-        print_step(2, 7, "Extracting filesystem...")
+        self._step(2, 7, "Extracting filesystem...")
         
         self.rootfs_dir = self.work_dir / "rootfs"
         self.rootfs_dir.mkdir(parents=True, exist_ok=True)
@@ -143,7 +167,7 @@ class ISOBuilder:
             print_error("No rootfs directory set")
             return False
         
-        print_step(3, 7, "Configuring offline OS...")
+        self._step(3, 7, "Configuring offline OS...")
         
         try:
             wallet_dir = self.rootfs_dir / "wallet"
@@ -191,7 +215,7 @@ class ISOBuilder:
     
     def _install_python_deps(self) -> bool:
         """Create a setup script for installing Python deps on first boot"""
-        print_step(4, 7, "Configuring Python environment...")
+        self._step(4, 7, "Configuring Python environment...")
         
         setup_script = self.rootfs_dir / "etc" / "local.d" / "setup-python.start"
         setup_script.parent.mkdir(parents=True, exist_ok=True)
@@ -669,7 +693,7 @@ fi
     
     def _create_bootable_image(self, output_dir: Path) -> Optional[Path]:
         """Create a bootable disk image"""
-        print_step(5, 7, "Creating bootable image...")
+        self._step(5, 7, "Creating bootable image...")
         
         image_path = output_dir / "solana-cold-wallet.img"
         
@@ -730,7 +754,7 @@ fi
     
     def _create_archive_image(self, output_dir: Path) -> Optional[Path]:
         """Fallback: create a tar.gz archive of the filesystem"""
-        print_step(5, 7, "Creating portable filesystem archive...")
+        self._step(5, 7, "Creating portable filesystem archive...")
         
         archive_path = output_dir / "solana-cold-wallet.tar.gz"
         
@@ -772,7 +796,7 @@ fi
     
     def _generate_wallet_on_usb(self, mount_point: str) -> bool:
         """Generate keypair and wallet on the USB drive (Step 7)"""
-        print_step(7, 7, "Generating keypair and wallet on USB...")
+        self._step(7, 7, "Generating keypair and wallet on USB...")
         
         try:
             from solders.keypair import Keypair
@@ -873,7 +897,7 @@ fi
     
     def _flash_to_usb_windows(self, device_path: str, image_path: str = None) -> bool:
         """Flash on Windows by copying wallet structure to drive"""
-        print_step(6, 7, "Setting up wallet on USB drive...")
+        self._step(6, 7, "Setting up wallet on USB drive...")
         
         # For Windows, we need to get the mount point (drive letter)
         # The device_path might be like \\\\.\\PHYSICALDRIVE1, but we need D:\\ or similar
@@ -963,6 +987,53 @@ For more information, see the project documentation.
             print_error(f"Flash error: {e}")
             return False
     
+    def _write_image_direct(self, image: Path, device_path: str) -> bool:
+        """Copy the image onto the device in-kernel (copy_file_range, then sendfile)
+        
+        Returns False before anything is written if neither call is usable, so
+        the caller can fall back to dd.
+        """
+        total = image.stat().st_size
+        src_fd = os.open(image, os.O_RDONLY)
+        try:
+            dst_fd = os.open(device_path, os.O_WRONLY)
+        except OSError:
+            os.close(src_fd)
+            raise
+        
+        try:
+            copy = getattr(os, 'copy_file_range', None)
+            offset = 0
+            with create_progress_bar("Writing image") as progress:
+                task = progress.add_task(f"Writing to {device_path}", total=total)
+                while offset < total:
+                    count = min(FLASH_CHUNK_SIZE, total - offset)
+                    try:
+                        if copy:
+                            written = copy(src_fd, dst_fd, count, offset, offset)
+                        else:
+                            written = os.sendfile(dst_fd, src_fd, offset, count)
+                    except OSError as e:
+                        if copy and e.errno in (errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP):
+                            # copy_file_range left the device's file position at 0;
+                            # sendfile writes at that position, so move it first
+                            os.lseek(dst_fd, offset, os.SEEK_SET)
+                            copy = None
+                            continue
+                        if offset == 0 and e.errno in (errno.EINVAL, errno.ENOSYS):
+                            return False
+                        raise
+                    if written == 0:
+                        raise OSError(errno.EIO, f"Short write at offset {offset}")
+                    offset += written
+                    progress.update(task, completed=offset)
+            
+            os.fdatasync(dst_fd)
+            return True
+        finally:
+            os.close(dst_fd)
+            os.close(src_fd)
+    
     def _flash_to_usb_linux(self, device_path: str, image_path: str = None) -> bool:
         """Flash on Linux/macOS using dd or mount/copy"""
         image = Path(image_path) if image_path else self.iso_path
@@ -971,18 +1042,22 @@ For more information, see the project documentation.
             print_error("No image file to flash")
             return False
 
-        print_step(6, 7, f"Flashing to {device_path}...")
+        self._step(6, 7, f"Flashing to {device_path}...")
         print_warning(f"This will ERASE ALL DATA on {device_path}")
 
         try:
             mount_point = None
 
             if str(image).endswith('.img') or str(image).endswith('.iso'):
-                result = subprocess.run(
-                    ['dd', f'if={image}', f'of={device_path}', 'bs=4M', 'status=progress', 'oflag=sync'],
-                    capture_output=False,
-                    timeout=600
-                )
+                if self.is_linux and self._write_image_direct(image, device_path):
+                    returncode = 0
+                else:
+                    result = subprocess.run(
+                        ['dd', f'if={image}', f'of={device_path}', 'bs=4M', 'status=progress', 'oflag=sync'],
+                        capture_output=False,
+                        timeout=600
+                    )
+                    returncode = result.returncode
             else:
                 # For tar.gz archives, we need to extract to the USB
                 # macOS and Linux have different formatting tools
@@ -1035,8 +1110,9 @@ For more information, see the project documentation.
                     capture_output=True,
                     timeout=600
                 )
+                returncode = result.returncode
             
-            if result.returncode == 0:
+            if returncode == 0:
                 # Step 7: Generate wallet on USB if we have a mount point
                 if mount_point:
                     if not self._generate_wallet_on_usb(mount_point):
@@ -1063,7 +1139,7 @@ For more information, see the project documentation.
             return False
     
     def cleanup(self):
-        print_step(7, 7, "Cleaning up temporary files...")
+        self._step(7, 7, "Cleaning up temporary files...")
         
         if self.work_dir and self.work_dir.exists():
             try:
@@ -0,0 +1,25 @@
+"""
+JSON Codec Module
+
+Compact JSON encode/decode shared by the RPC client and the signer
+bindings. Uses orjson when it is installed, otherwise the stdlib json
+module; dumps() returns bytes either way.
+"""
+
+import json
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers work for both
+if HAS_ORJSON:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+    loads = json.loads
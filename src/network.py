@@ -4,19 +4,48 @@ Network Operations - RPC communication with Solana blockchain
 B - Love U 3000
 """
 
-import asyncio
-from typing import Optional, Tuple
+import base64
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Union
 import httpx
 
 from solders.pubkey import Pubkey
 from solders.hash import Hash
 from solders.transaction import VersionedTransaction
 
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 from config import SOLANA_RPC_URL, LAMPORTS_PER_SOL
+from src.json_codec import dumps as _json_dumps, loads as _json_loads
 from src.ui import print_success, print_error, print_info, print_warning, create_spinner
 from src.security_validation import validate_balance_value, validate_solana_address, validate_rpc_url
 
 
+# One pooled keep-alive client per SolanaNetwork; every RPC reuses its connections
+RPC_POOL_LIMITS = httpx.Limits(max_connections=25, max_keepalive_connections=10, keepalive_expiry=60.0)
+RPC_CONNECT_RETRIES = 3
+# Fail fast on unreachable endpoints; keep a long read budget for slow sends
+RPC_TIMEOUT = httpx.Timeout(30.0, connect=3.0)
+# Independent RPCs issued together (status screens, post-send refresh)
+RPC_FAN_OUT_WORKERS = 4
+
+# sendTransaction envelope around the base64 payload, serialized once
+_SEND_TX_PREFIX = b'{"jsonrpc":"2.0","id":1,"method":"sendTransaction","params":["'
+_SEND_TX_SUFFIX = b'",{"encoding":"base64","preflightCommitment":"finalized"}]}'
+
+# getSignaturesForAddress returns at most this many entries per call
+HISTORY_PAGE_SIZE = 1000
+
+# Confirmation polling: one getSignatureStatuses per tick covers every pending signature
+CONFIRM_POLL_INTERVAL = 0.4
+_COMMITMENT_LEVELS = {"processed": 0, "confirmed": 1, "finalized": 2}
+
+
 class SolanaNetwork:
     def __init__(self, rpc_url: str = None):
         self.rpc_url = rpc_url or SOLANA_RPC_URL
@@ -28,7 +57,27 @@ class SolanaNetwork:
         if message:  # Warning message
             print_warning(message)
         
-        self.client = httpx.Client(timeout=30.0)
+        self.client = httpx.Client(
+            timeout=RPC_TIMEOUT,
+            transport=httpx.HTTPTransport(
+                retries=RPC_CONNECT_RETRIES,
+                limits=RPC_POOL_LIMITS,
+                http2=HAS_HTTP2,
+            ),
+            headers={"Content-Type": "application/json", "Connection": "keep-alive"},
+        )
+        self._pool: Optional[ThreadPoolExecutor] = None
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=RPC_FAN_OUT_WORKERS, thread_name_prefix="rpc")
+        return self._pool
+    
+    def _fan_out(self, calls: list) -> list:
+        """Run [(fn, *args), ...] concurrently over the shared pooled client; results in order"""
+        pool = self._get_pool()
+        futures = [pool.submit(fn, *args) for fn, *args in calls]
+        return [f.result() for f in futures]
     
     def __enter__(self):
         return self
@@ -45,13 +94,28 @@ class SolanaNetwork:
             "params": params or []
         }
         
-        response = self.client.post(
-            self.rpc_url,
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
+        return self._post_rpc_body(_json_dumps(payload))
+    
+    def _make_rpc_batch(self, calls: list) -> list:
+        """Send [(method, params), ...] as one JSON-RPC batch; results come back in call order"""
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params or []}
+            for i, (method, params) in enumerate(calls)
+        ]
+        replies = self._post_rpc_body(_json_dumps(payload))
+        if isinstance(replies, dict):
+            # Whole-batch rejection (e.g. batching disabled on this endpoint)
+            return [replies] * len(calls)
+        
+        # The spec allows replies in any order; match them back by id
+        by_id = {reply.get("id"): reply for reply in replies}
+        return [by_id.get(i, {"error": {"message": "Missing batch reply"}}) for i in range(len(calls))]
+    
+    def _post_rpc_body(self, body: bytes) -> Union[dict, list]:
+        """POST an already-serialized JSON-RPC request"""
+        response = self.client.post(self.rpc_url, content=body)
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     def get_balance(self, public_key: str) -> Optional[float]:
         try:
@@ -141,16 +205,23 @@ class SolanaNetwork:
         except Exception:
             return None
     
-    def send_transaction(self, signed_tx_base64: str) -> Optional[str]:
+    def send_transaction(self, signed_tx: Union[str, bytes, bytearray, memoryview]) -> Optional[str]:
+        """Broadcast a signed transaction, given as raw bytes or already base64-encoded"""
         try:
+            if isinstance(signed_tx, str):
+                # The str may come from an outbox file; anything outside the
+                # base64 alphabet could inject fields into the spliced body
+                try:
+                    tx_b64 = signed_tx.encode('ascii')
+                    base64.b64decode(tx_b64, validate=True)
+                except ValueError:
+                    print_error("Signed transaction is not valid base64")
+                    return None
+            else:
+                tx_b64 = base64.b64encode(memoryview(signed_tx))
             # B - Love U 3000
-            result = self._make_rpc_request(
-                "sendTransaction",
-                [
-                    signed_tx_base64,
-                    {"encoding": "base64", "preflightCommitment": "finalized"}
-                ]
-            )
+            # base64 needs no JSON escaping, so splice it straight into the envelope
+            result = self._post_rpc_body(_SEND_TX_PREFIX + tx_b64 + _SEND_TX_SUFFIX)
             
             if "error" in result:
                 error_msg = result['error'].get('message', 'Unknown error')
@@ -167,33 +238,46 @@ class SolanaNetwork:
             print_error(f"Error sending transaction: {e}")
             return None
     
-    def confirm_transaction(self, signature: str, max_retries: int = 30) -> bool:
-        for i in range(max_retries):
+    def confirm_transaction(self, signature: str, timeout: float = 30.0) -> bool:
+        return self.confirm_transactions([signature], timeout=timeout)[signature]
+    
+    def confirm_transactions(self, signatures: list, commitment: str = "confirmed",
+                             timeout: float = 30.0) -> dict:
+        """Poll all signatures with one batched status RPC per tick; returns {signature: confirmed}"""
+        required = _COMMITMENT_LEVELS[commitment]
+        results = {signature: False for signature in signatures}
+        pending = list(results)
+        deadline = time.monotonic() + timeout
+        
+        while pending:
             try:
                 result = self._make_rpc_request(
                     "getSignatureStatuses",
-                    [[signature]]
+                    [pending, {"searchTransactionHistory": False}]
                 )
-                
-                if "error" in result:
-                    continue
-                
-                statuses = result.get("result", {}).get("value", [])
-                if statuses and statuses[0]:
-                    status = statuses[0]
-                    if status.get("confirmationStatus") in ["confirmed", "finalized"]:
-                        return True
-                    if status.get("err"):
-                        print_error(f"Transaction error: {status['err']}")
-                        return False
-                
-                import time
-                time.sleep(1)
+                statuses = [] if "error" in result else result.get("result", {}).get("value", [])
             except Exception:
-                import time
-                time.sleep(1)
+                statuses = []
+            
+            still_pending = []
+            for signature, status in zip(pending, statuses):
+                if not status:
+                    still_pending.append(signature)
+                elif status.get("err"):
+                    print_error(f"Transaction error: {status['err']}")
+                elif _COMMITMENT_LEVELS.get(status.get("confirmationStatus"), -1) >= required:
+                    results[signature] = True
+                else:
+                    still_pending.append(signature)
+            # Signatures the node skipped in its reply stay pending
+            still_pending.extend(pending[len(statuses):])
+            pending = still_pending
+            
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(CONFIRM_POLL_INTERVAL)
         
-        return False
+        return results
     
     def request_airdrop(self, public_key: str, amount_sol: float = 1.0) -> Optional[str]:
         try:
@@ -239,9 +323,11 @@ class SolanaNetwork:
     
     def get_network_info(self) -> dict:
         try:
-            version = self._make_rpc_request("getVersion")
-            slot = self._make_rpc_request("getSlot")
-            epoch = self._make_rpc_request("getEpochInfo")
+            version, slot, epoch = self._fan_out([
+                (self._make_rpc_request, "getVersion"),
+                (self._make_rpc_request, "getSlot"),
+                (self._make_rpc_request, "getEpochInfo"),
+            ])
             
             return {
                 "version": version.get("result", {}).get("solana-core", "Unknown"),
@@ -252,20 +338,46 @@ class SolanaNetwork:
         except Exception:
             return {"error": "Could not fetch network info"}
     
+    def _fetch_signatures_page(self, public_key: str, count: int, before: Optional[str]) -> list:
+        options = {"limit": count}
+        if before:
+            options["before"] = before
+        result = self._make_rpc_request("getSignaturesForAddress", [public_key, options])
+        
+        if "error" in result:
+            raise RuntimeError(result["error"]["message"])
+        return result.get("result", [])
+    
+    def iter_transaction_history(self, public_key: str, limit: int = 10,
+                                 page_size: int = HISTORY_PAGE_SIZE):
+        """Yield pages of signature info; page K+1 is fetched while the caller handles page K"""
+        count = min(limit, page_size)
+        page = self._fetch_signatures_page(public_key, count, None)
+        remaining = limit
+        
+        while page:
+            remaining -= len(page)
+            next_page = None
+            # A short page means the address has no older history
+            if remaining > 0 and len(page) == count:
+                count = min(remaining, page_size)
+                next_page = self._get_pool().submit(
+                    self._fetch_signatures_page, public_key, count, page[-1]["signature"]
+                )
+            
+            yield page
+            
+            if next_page is None:
+                return
+            page = next_page.result()
+    
     def get_transaction_history(self, public_key: str, limit: int = 10) -> Optional[list]:
         """Get recent transaction history for an address"""
         try:
-            result = self._make_rpc_request(
-                "getSignaturesForAddress",
-                [public_key, {"limit": limit}]
-            )
-            
-            if "error" in result:
-                print_error(f"Failed to get transaction history: {result['error']['message']}")
-                return None
-            
-            signatures = result.get("result", [])
-            return signatures
+            return [tx for page in self.iter_transaction_history(public_key, limit) for tx in page]
+        except RuntimeError as e:
+            print_error(f"Failed to get transaction history: {e}")
+            return None
         except Exception as e:
             print_error(f"Error getting transaction history: {e}")
             return None
@@ -285,5 +397,49 @@ class SolanaNetwork:
         except Exception:
             return None
     
+    def get_transaction_details_batch(self, signatures: list) -> dict:
+        """Details for many signatures in one round trip: {signature: details or None}"""
+        if not signatures:
+            return {}
+        try:
+            replies = self._make_rpc_batch([
+                ("getTransaction", [sig, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}])
+                for sig in signatures
+            ])
+        except Exception:
+            return {}
+        
+        return {
+            sig: (None if "error" in reply else reply.get("result"))
+            for sig, reply in zip(signatures, replies)
+        }
+    
+    def status_bundle(self) -> dict:
+        """Health, version, slot and epoch in a single batched round trip"""
+        try:
+            health, version, slot, epoch = self._make_rpc_batch([
+                ("getHealth", None),
+                ("getVersion", None),
+                ("getSlot", None),
+                ("getEpochInfo", None),
+            ])
+        except Exception:
+            return {"connected": False}
+        
+        if all("error" in reply for reply in (health, version, slot, epoch)):
+            # Endpoint refuses batches; fall back to concurrent single calls
+            connected, info = self._fan_out([(self.is_connected,), (self.get_network_info,)])
+            return {"connected": connected, **info}
+        
+        return {
+            "connected": health.get("result") == "ok",
+            "version": version.get("result", {}).get("solana-core", "Unknown"),
+            "slot": slot.get("result", 0),
+            "epoch": epoch.get("result", {}).get("epoch", 0),
+            "rpc_url": self.rpc_url
+        }
+    
     def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
         self.client.close()
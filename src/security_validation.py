@@ -16,6 +16,7 @@ from typing import Tuple
 MIN_PASSWORD_LENGTH = 12
 MAX_BALANCE_SOL = 1_000_000_000  # 1 billion SOL (way more than total supply)
 LAMPORTS_PER_SOL = 1_000_000_000
+BASE58_ALPHABET = frozenset('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')
 
 
 def validate_device_path(path: str, platform: str = None) -> Tuple[bool, str]:
@@ -191,8 +192,7 @@ def validate_solana_address(address: str) -> Tuple[bool, str]:
         return False, "Invalid address length"
     
     # Check for valid base58 characters only
-    valid_chars = set('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')
-    if not all(c in valid_chars for c in address):
+    if not BASE58_ALPHABET.issuperset(address):
         return False, "Invalid characters in address (must be base58)"
     
     # Try to parse with solders library for full validation
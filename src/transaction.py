@@ -6,6 +6,7 @@ B - Love U 3000
 
 import json
 import base64
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Tuple
@@ -136,7 +137,7 @@ class TransactionManager:
             print_error(f"Failed to create transaction: {e}")
             return None
     
-    def sign_transaction_secure(self, unsigned_tx_bytes: bytes, encrypted_container: dict, password: str) -> Optional[bytes]:
+    def sign_transaction_secure(self, unsigned_tx_bytes: bytes, encrypted_container: dict, password) -> Optional[bytes]:
         """Sign transaction using Rust secure signer (keys never in Python memory)"""
         if not RUST_SIGNER_AVAILABLE or self.rust_signer is None:
             print_error("Rust signer not available. Cannot sign securely.")
@@ -145,6 +146,8 @@ class TransactionManager:
             
             # Fallback to Python-based signing
             from src.secure_memory import SecureWalletHandler
+            if not isinstance(password, str):
+                password = bytes(password).decode('utf-8')
             keypair = SecureWalletHandler.decrypt_keypair(encrypted_container, password)
             if not keypair:
                 print_error("Failed to decrypt keypair")
@@ -224,6 +227,33 @@ class TransactionManager:
         print_info("Use sign_transaction_secure() instead.")
         raise RuntimeError("Insecure signing method disabled. Use sign_transaction_secure() only.")
     
+    @staticmethod
+    def _write_tx_file(filepath: Path, tx_data: dict):
+        """Atomically replace filepath: one write, one fsync, rename, then sync the directory"""
+        payload = json.dumps(tx_data, indent=2).encode('utf-8')
+        tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+        
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, filepath)
+        
+        # Sync the directory entry (ensures rename is persisted)
+        try:
+            dir_fd = os.open(str(filepath.parent), os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except (OSError, AttributeError):
+            # Windows doesn't support directory sync, but file sync is enough
+            pass
+    
     def save_unsigned_transaction(self, tx_bytes: bytes, path: str) -> bool:
         try:
             filepath = Path(path)
@@ -235,8 +265,7 @@ class TransactionManager:
                 "data": base64.b64encode(tx_bytes).decode('utf-8')
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+            self._write_tx_file(filepath, tx_data)
             
             print_success(f"Unsigned transaction saved to: {filepath}")
             return True
@@ -278,8 +307,7 @@ class TransactionManager:
                 "data": base64.b64encode(tx_bytes).decode('utf-8')
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+            self._write_tx_file(filepath, tx_data)
             
             print_success(f"Signed transaction saved to: {filepath}")
             return True
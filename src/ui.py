@@ -4,7 +4,7 @@ Terminal UI Components using Rich library
 B - Love U 3000
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -16,6 +16,8 @@ import questionary
 from questionary import Style
 
 console = Console()
+# Plain status lines skip rich's markup parser and highlighter regexes
+fast_console = Console(highlight=False, markup=False)
 
 CUSTOM_STYLE = Style([
     ('qmark', 'fg:cyan bold'),
@@ -53,19 +55,34 @@ def print_banner():
     console.print(Text(banner_text, style="cyan"))
 
 
+def _print_status(symbol: str, style: str, message: str, message_style: Optional[str] = None):
+    text = Text(symbol, style=style)
+    text.append(" ")
+    text.append(message, style=message_style)
+    fast_console.print(text)
+
+
 def print_success(message: str):
+    if "[" not in message:
+        return _print_status("✓", "green", message)
     console.print(f"[green]✓[/green] {message}")
 
 
 def print_error(message: str):
+    if "[" not in message:
+        return _print_status("✗", "red", message, "red")
     console.print(f"[red]✗[/red] [red]{message}[/red]")
 
 
 def print_warning(message: str):
+    if "[" not in message:
+        return _print_status("⚠", "yellow", message, "yellow")
     console.print(f"[yellow]⚠[/yellow] [yellow]{message}[/yellow]")
 
 
 def print_info(message: str):
+    if "[" not in message:
+        return _print_status("→", "cyan", message)
     console.print(f"[cyan]→[/cyan] {message}")
 
 
@@ -160,10 +177,19 @@ def confirm_dangerous_action(message: str, confirm_text: str = "CONFIRM") -> boo
     return response == confirm_text
 
 
-def select_menu_option(options: list, message: str = "Select an option:") -> str:
+def select_menu_option(options: Sequence[str], message: str = "Select an option:") -> str:
+    return questionary.select(
+        message,
+        choices=list(options),
+        style=CUSTOM_STYLE
+    ).ask()
+
+
+def select_menu_index(options: Sequence[str], message: str = "Select an option:") -> Optional[int]:
+    """Like select_menu_option, but returns the position of the chosen label (None if aborted)"""
     return questionary.select(
         message,
-        choices=options,
+        choices=[questionary.Choice(label, value=i) for i, label in enumerate(options)],
         style=CUSTOM_STYLE
     ).ask()
 
@@ -6,15 +6,109 @@ B - Love U 3000
 
 import subprocess
 import os
+import errno
 import json
 import platform
+import re
+import time
+import ctypes
+import ctypes.util
 from pathlib import Path
 from typing import List, Optional, Dict
 
+try:
+    import pyudev
+    HAS_PYUDEV = True
+except ImportError:
+    HAS_PYUDEV = False
+
 from src.ui import print_success, print_error, print_info, print_warning, print_device_list
 from src.security_validation import validate_device_path, validate_mount_point
 
 
+# Seconds a device scan stays valid; hotplug events expire it early on Linux
+DEVICE_CACHE_TTL = 2.0
+
+# Kernel-internal block devices that are never USB sticks
+_VIRTUAL_BLOCK_PREFIXES = ('loop', 'ram', 'zram', 'dm-', 'md', 'sr', 'nbd')
+
+_OCTAL_ESCAPE_RE = re.compile(r'\\([0-7]{3})')
+
+# Tried ahead of the rest of /proc/filesystems when udev hasn't probed the
+# device; msdos would also take a FAT stick, but with 8.3 names only
+_PREFERRED_FILESYSTEMS = ('vfat', 'exfat', 'ext4')
+
+_libc = None
+
+
+def _get_libc():
+    """libc handle for mount(2)/umount2(2), or None where it can't be loaded"""
+    global _libc
+    if _libc is None:
+        try:
+            _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        except OSError:
+            _libc = False
+    return _libc or None
+
+
+def _read_sysfs(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _proc_mounts() -> Dict[str, str]:
+    """Map of device node -> mount point parsed from /proc/mounts"""
+    mounts = {}
+    try:
+        with open('/proc/mounts') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 2 and fields[0].startswith('/dev/'):
+                    # Spaces etc. are octal-escaped (e.g. \040)
+                    mounts.setdefault(fields[0], _OCTAL_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), fields[1]))
+    except OSError:
+        pass
+    return mounts
+
+
+def _block_filesystems() -> List[str]:
+    """Filesystem types the kernel can mount from a block device, like mount(8) tries"""
+    try:
+        with open('/proc/filesystems') as f:
+            return [line.strip() for line in f if line.strip() and not line.startswith('nodev')]
+    except OSError:
+        return []
+
+
+def _probed_fs_type(device: str) -> Optional[str]:
+    """Filesystem type udev recorded for a block device (ID_FS_TYPE), if any"""
+    try:
+        rdev = os.stat(device).st_rdev
+        with open(f'/run/udev/data/b{os.major(rdev)}:{os.minor(rdev)}') as f:
+            for line in f:
+                if line.startswith('E:ID_FS_TYPE='):
+                    return line.strip().partition('=')[2] or None
+    except OSError:
+        pass
+    return None
+
+
+def _mount_fs_candidates(device: str) -> List[str]:
+    """Filesystem types to try for device, the probed one first"""
+    available = _block_filesystems()
+    preferred = [fs for fs in _PREFERRED_FILESYSTEMS if fs in available]
+    ordered = preferred + [fs for fs in available if fs not in preferred]
+    probed = _probed_fs_type(device)
+    if probed:
+        # mount(2) autoloads the module, so the probed type may not be listed yet
+        ordered = [probed] + [fs for fs in ordered if fs != probed]
+    return ordered
+
+
 class USBManager:
     def __init__(self):
         self.detected_devices: List[Dict] = []
@@ -24,6 +118,32 @@ class USBManager:
         self.is_windows = self.system == 'Windows'
         self.is_macos = self.system == 'Darwin'
         self.is_linux = self.system == 'Linux'
+        self._device_cache: tuple = ([], 0.0)
+        self._udev_observer = None
+        if self.is_linux and HAS_PYUDEV:
+            self._start_udev_monitor()
+    
+    def _start_udev_monitor(self):
+        """Expire the device cache as soon as udev reports a USB add/remove"""
+        try:
+            context = pyudev.Context()
+            monitor = pyudev.Monitor.from_netlink(context)
+            monitor.filter_by(subsystem='usb')
+            monitor.filter_by(subsystem='block', device_type='disk')
+            
+            def on_event(action, device):
+                if action in ('add', 'remove', 'change'):
+                    self.invalidate_device_cache()
+            
+            self._udev_observer = pyudev.MonitorObserver(monitor, on_event, name='usb-hotplug')
+            self._udev_observer.daemon = True
+            self._udev_observer.start()
+        except Exception:
+            # No netlink access (containers, restricted sandboxes): TTL alone still applies
+            self._udev_observer = None
+    
+    def invalidate_device_cache(self):
+        self._device_cache = (self._device_cache[0], 0.0)
     
     def _validate_device_path_safe(self, device_path: str) -> bool:
         """Validate device path before using in commands"""
@@ -41,14 +161,25 @@ class USBManager:
             return False
         return True
     
-    def detect_usb_devices(self) -> List[Dict]:
-        """Detect USB devices - supports Windows, macOS, and Linux"""
+    def detect_usb_devices(self, force: bool = False) -> List[Dict]:
+        """Detect USB devices - supports Windows, macOS, and Linux
+        
+        Results are reused for DEVICE_CACHE_TTL seconds unless force is set.
+        """
+        devices, expires_at = self._device_cache
+        if not force and time.monotonic() < expires_at:
+            self.detected_devices = devices
+            return devices
+        
         if self.is_windows:
-            return self._detect_windows()
+            devices = self._detect_windows()
         elif self.is_macos:
-            return self._detect_macos()
+            devices = self._detect_macos()
         else:
-            return self._detect_linux()
+            devices = self._detect_linux()
+        
+        self._device_cache = (devices, time.monotonic() + DEVICE_CACHE_TTL)
+        return devices
     
     def _detect_windows(self) -> List[Dict]:
         """Detect USB devices on Windows using PowerShell"""
@@ -353,6 +484,12 @@ class USBManager:
             return []
     
     def _detect_linux(self) -> List[Dict]:
+        """Detect USB devices on Linux from sysfs, falling back to lsblk"""
+        if os.path.isdir('/sys/block'):
+            return self._detect_via_sys()
+        return self._detect_lsblk()
+    
+    def _detect_lsblk(self) -> List[Dict]:
         """Detect USB devices on Linux using lsblk"""
         devices = []
         
@@ -365,8 +502,8 @@ class USBManager:
             )
             
             if result.returncode != 0:
-                print_warning("Could not run lsblk, trying alternative method")
-                return self._detect_via_sys()
+                print_warning("Could not run lsblk")
+                return []
             
             data = json.loads(result.stdout)
             
@@ -401,45 +538,59 @@ class USBManager:
             return []
         except json.JSONDecodeError:
             print_warning("Could not parse lsblk output")
-            return self._detect_via_sys()
+            return []
         except FileNotFoundError:
-            print_warning("lsblk not found, trying alternative method")
-            return self._detect_via_sys()
+            print_warning("lsblk not found")
+            return []
         except Exception as e:
             print_error(f"Error detecting USB devices: {e}")
             return []
     
     def _detect_via_sys(self) -> List[Dict]:
+        """Read /sys/block and /proc/mounts directly instead of forking lsblk"""
         devices = []
         
         try:
-            block_path = Path("/sys/block")
-            if not block_path.exists():
-                return devices
+            mounts = _proc_mounts()
             
-            for device_dir in block_path.iterdir():
-                device_name = device_dir.name
+            for name in sorted(os.listdir('/sys/block')):
+                if name.startswith(_VIRTUAL_BLOCK_PREFIXES):
+                    continue
+                
+                sys_dir = f"/sys/block/{name}"
+                # The resolved sysfs path runs through the USB host controller for USB disks
+                is_usb = '/usb' in os.path.realpath(sys_dir)
+                if not is_usb and _read_sysfs(f"{sys_dir}/removable") != '1':
+                    continue
+                
+                sectors = _read_sysfs(f"{sys_dir}/size")
+                # sysfs always counts size in 512-byte sectors
+                size = self._format_size(int(sectors) * 512) if sectors and sectors.isdigit() else "Unknown"
+                model = _read_sysfs(f"{sys_dir}/device/model") or 'USB Device'
+                
+                dev_info = {
+                    'device': f"/dev/{name}",
+                    'size': size,
+                    'model': model,
+                    'mountpoint': mounts.get(f"/dev/{name}"),
+                    'partitions': []
+                }
+                
+                with os.scandir(sys_dir) as entries:
+                    part_names = sorted(e.name for e in entries
+                                        if e.name.startswith(name) and os.path.exists(f"{e.path}/partition"))
+                for part_name in part_names:
+                    part_sectors = _read_sysfs(f"{sys_dir}/{part_name}/size")
+                    partition = {
+                        'device': f"/dev/{part_name}",
+                        'size': self._format_size(int(part_sectors) * 512) if part_sectors and part_sectors.isdigit() else "Unknown",
+                        'mountpoint': mounts.get(f"/dev/{part_name}")
+                    }
+                    dev_info['partitions'].append(partition)
+                    if partition['mountpoint']:
+                        dev_info['mountpoint'] = partition['mountpoint']
                 
-                if device_name.startswith('sd') or device_name.startswith('nvme'):
-                    removable_path = device_dir / "removable"
-                    if removable_path.exists():
-                        with open(removable_path) as f:
-                            if f.read().strip() == '1':
-                                size_path = device_dir / "size"
-                                size = "Unknown"
-                                if size_path.exists():
-                                    with open(size_path) as f:
-                                        sectors = int(f.read().strip())
-                                        size_bytes = sectors * 512
-                                        size = self._format_size(size_bytes)
-                                
-                                devices.append({
-                                    'device': f"/dev/{device_name}",
-                                    'size': size,
-                                    'model': 'USB Device',
-                                    'mountpoint': None,
-                                    'partitions': []
-                                })
+                devices.append(dev_info)
             
             self.detected_devices = devices
             return devices
@@ -465,6 +616,8 @@ class USBManager:
     
     def mount_device(self, device_path: str = None, mount_point: str = None) -> Optional[str]:
         """Mount a device - Windows and macOS drives are typically already mounted"""
+        # Mount points in the cached listing go stale once we touch the device
+        self.invalidate_device_cache()
         device = device_path or (self.selected_device['device'] if self.selected_device else None)
         if not device:
             print_error("No device specified")
@@ -564,6 +717,19 @@ class USBManager:
         try:
             os.makedirs(mount_point, exist_ok=True)
             
+            mounted, err = self._libc_mount(device, mount_point)
+            if mounted:
+                self.mount_point = mount_point
+                print_success(f"Mounted {device} at {mount_point}")
+                # Run first instance boot process
+                self.first_instance_boot_process(self.mount_point)
+                return mount_point
+            if err == errno.EBUSY:
+                print_info("Device is already mounted")
+                self.first_instance_boot_process(mount_point)
+                return mount_point
+            
+            # FUSE-backed filesystems (ntfs-3g, exfat-fuse) still need mount(8)
             result = subprocess.run(
                 ['mount', device, mount_point],
                 capture_output=True,
@@ -596,8 +762,26 @@ class USBManager:
             print_error(f"Mount error: {e}")
             return None
     
+    def _libc_mount(self, device: str, mount_point: str):
+        """mount(2) without forking mount(8); returns (mounted, errno)"""
+        libc = _get_libc()
+        if libc is None:
+            return False, errno.ENOSYS
+        
+        err = errno.ENODEV
+        for fstype in _mount_fs_candidates(device):
+            if libc.mount(device.encode(), mount_point.encode(), fstype.encode(), 0, None) == 0:
+                return True, 0
+            err = ctypes.get_errno()
+            if err in (errno.EPERM, errno.EACCES):
+                raise PermissionError(err, os.strerror(err))
+            if err == errno.EBUSY:
+                break
+        return False, err
+    
     def unmount_device(self, mount_point: str = None) -> bool:
         """Unmount a device"""
+        self.invalidate_device_cache()
         target = mount_point or self.mount_point
         if not target:
             print_warning("No mount point to unmount")
@@ -671,7 +855,14 @@ class USBManager:
         try:
             # Sync before unmounting
             print_info("Syncing file system...")
-            subprocess.run(['sync'], timeout=10)
+            os.sync()
+            
+            libc = _get_libc()
+            if libc is not None and libc.umount2(target.encode(), 0) == 0:
+                print_success(f"Unmounted {target}")
+                if target == self.mount_point:
+                    self.mount_point = None
+                return True
             
             result = subprocess.run(
                 ['umount', target],
@@ -8,8 +8,12 @@ import json
 import os
 import gc
 import sys
+import threading
+import time
 import base64
 import shutil
+import ctypes
+import ctypes.util
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -19,7 +23,7 @@ import base58
 
 from src.ui import print_success, print_error, print_info, print_warning, get_password_input, confirm_dangerous_action
 from src.secure_memory import SecureWalletHandler
-from src.security_validation import validate_password_strength
+from src.security_validation import validate_password_strength, BASE58_ALPHABET
 
 # Import Rust signer (REQUIRED)
 try:
@@ -34,6 +38,25 @@ except ImportError as e:
     print_info("  cargo build --release")
     sys.exit(1)
 
+# Seconds an unlocked signing session is reused before the password is asked again
+SIGNING_SESSION_TTL = 30.0
+# A session this close to expiry is not handed out, so its timer cannot wipe
+# the password while a signer is still reading it
+SIGNING_SESSION_GRACE = 5.0
+
+
+def _set_buffer_locked(buf: bytearray, lock: bool):
+    """mlock/munlock a bytearray so the cached secret is never swapped out (best effort)"""
+    if not buf or sys.platform == 'win32':
+        return
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'))
+        addr = ctypes.addressof((ctypes.c_char * len(buf)).from_buffer(buf))
+        (libc.mlock if lock else libc.munlock)(ctypes.c_void_p(addr), ctypes.c_size_t(len(buf)))
+    except (OSError, AttributeError, TypeError):
+        pass
+
+
 class WalletManager:
     def __init__(self, wallet_dir: str = None):
         self.wallet_dir = Path(wallet_dir) if wallet_dir else None
@@ -42,6 +65,11 @@ class WalletManager:
         self.pubkey_path: Optional[Path] = None
         self.encrypted_container: Optional[dict] = None  # Store encrypted container for Rust signer
         self._cached_password: Optional[str] = None  # Cache password to avoid multiple prompts
+        # (keypair path, encrypted container, locked password buffer, expires_at) for back-to-back signing
+        self._signing_session: Optional[Tuple[str, dict, bytearray, float]] = None
+        # Wipes the session at expiry even if no further send looks it up
+        self._signing_timer: Optional[threading.Timer] = None
+        self._signing_lock = threading.Lock()
         
         # Initialize Rust signer (REQUIRED for security)
         try:
@@ -291,20 +319,80 @@ class WalletManager:
         return bytes(self.keypair.pubkey())
     
     def validate_address(self, address: str) -> bool:
+        # Length and alphabet reject most typos before the full base58 decode
+        if not address or not 32 <= len(address) <= 44 or not BASE58_ALPHABET.issuperset(address):
+            return False
         try:
             Pubkey.from_string(address)
             return True
         except Exception:
             return False
 
-    def clear_memory(self):
-        """Securely clear the loaded keypair from memory"""
+    def clear_memory(self, keep_signing_session: bool = False):
+        """Securely clear the loaded keypair from memory
+        
+        keep_signing_session leaves an unexpired signing session in place so the
+        next send within SIGNING_SESSION_TTL does not prompt again; its timer
+        still wipes it at expiry.
+        """
         self.keypair = None
         self.encrypted_container = None
         self._cached_password = None  # Clear cached password
+        if not keep_signing_session:
+            self._end_signing_session()
+        else:
+            self._expire_signing_session()
         gc.collect()
         # print_info("Wallet memory cleared.")
     
+    def cache_key_for_signing(self, path: str, container: dict, password: str):
+        """Keep an unlocked container and its password for SIGNING_SESSION_TTL seconds"""
+        self._end_signing_session()
+        buf = bytearray(password.encode('utf-8') if isinstance(password, str) else password)
+        _set_buffer_locked(buf, True)
+        timer = threading.Timer(SIGNING_SESSION_TTL, self._expire_signing_session)
+        timer.daemon = True
+        with self._signing_lock:
+            self._signing_session = (str(path), container, buf, time.monotonic() + SIGNING_SESSION_TTL)
+            self._signing_timer = timer
+        timer.start()
+    
+    def get_cached_key_for_signing(self, path: str) -> Optional[Tuple[dict, bytearray]]:
+        """(container, password) from a live signing session for path, or None
+
+        The password is the session's locked buffer itself, not a copy; pass it
+        straight to the signer and don't keep it past the call. It stays valid
+        for at least SIGNING_SESSION_GRACE seconds.
+        """
+        with self._signing_lock:
+            session = self._signing_session
+        if session is None:
+            return None
+        session_path, container, buf, expires_at = session
+        if session_path != str(path) or time.monotonic() >= expires_at - SIGNING_SESSION_GRACE:
+            self._end_signing_session()
+            return None
+        return container, buf
+    
+    def _expire_signing_session(self):
+        """Wipe the signing session if it has reached its expiry time"""
+        self._end_signing_session(expired_only=True)
+    
+    def _end_signing_session(self, expired_only: bool = False):
+        with self._signing_lock:
+            session = self._signing_session
+            if session is None:
+                return
+            if expired_only and time.monotonic() < session[3] - SIGNING_SESSION_GRACE:
+                return
+            self._signing_session = None
+            timer, self._signing_timer = self._signing_timer, None
+        if timer is not None:
+            timer.cancel()
+        buf = session[2]
+        buf[:] = bytes(len(buf))
+        _set_buffer_locked(buf, False)
+    
     def get_cached_password(self) -> Optional[str]:
         """Get cached password if available"""
         return self._cached_password
@@ -0,0 +1,86 @@
+"""
+Shared fixtures for the test suite.
+
+`fake_signer` writes a stand-in for the Rust `solana-signer --server`
+binary: it speaks the same NDJSON protocol (one request per line, replies
+tagged with the request id) so the Python clients can be exercised without
+a Rust toolchain.
+"""
+
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "secure_signer"))
+
+
+# Each request is echoed back as `data`. Special actions:
+#   sleep   - wait `seconds` before replying
+#   big     - reply with a 2 MiB line
+#   bad_id  - reply with the wrong id
+# With FAKE_SIGNER_REVERSE=N the server holds N requests and answers them
+# in reverse order. Every spawn appends its pid to FAKE_SIGNER_PIDS.
+FAKE_SIGNER = textwrap.dedent("""\
+    import json, os, sys, time
+
+    assert sys.argv[1:] == ["--server"], sys.argv
+    with open(os.environ["FAKE_SIGNER_PIDS"], "a") as f:
+        f.write(f"{os.getpid()}\\n")
+    reverse = int(os.environ.get("FAKE_SIGNER_REVERSE", "0"))
+
+    def reply(req):
+        request_id = req.pop("id", None)
+        action = req.get("action")
+        if action == "sleep":
+            time.sleep(req["seconds"])
+        elif action == "big":
+            req["pad"] = "x" * (2 << 20)
+        elif action == "bad_id":
+            request_id = (request_id or 0) + 1000
+        sys.stdout.write(json.dumps({"id": request_id, "success": True, "data": req}) + "\\n")
+        sys.stdout.flush()
+
+    held = []
+    for line in sys.stdin:
+        req = json.loads(line)
+        if req.get("action") == "quit":
+            break
+        if reverse:
+            held.append(req)
+            if len(held) == reverse:
+                for req in reversed(held):
+                    reply(req)
+                held.clear()
+        else:
+            reply(req)
+""")
+
+
+class FakeSigner:
+    def __init__(self, path: Path, pid_file: Path):
+        self.path = path
+        self.pid_file = pid_file
+
+    @property
+    def pids(self) -> list:
+        if not self.pid_file.exists():
+            return []
+        return [int(line) for line in self.pid_file.read_text().split()]
+
+
+@pytest.fixture
+def fake_signer(tmp_path, monkeypatch):
+    """Path to an executable fake `--server` signer, plus the pids it spawned."""
+    if sys.platform == "win32":
+        pytest.skip("fake signer is a shebang script")
+    script = tmp_path / "fake-signer"
+    script.write_text(f"#!{sys.executable}\n{FAKE_SIGNER}")
+    os.chmod(script, 0o755)
+    pid_file = tmp_path / "pids"
+    monkeypatch.setenv("FAKE_SIGNER_PIDS", str(pid_file))
+    return FakeSigner(script, pid_file)
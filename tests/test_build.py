@@ -0,0 +1,127 @@
+"""
+Tests for the signer source-hash staleness check in build.py.
+"""
+
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+import build
+from build import SIGNER_DIR, record_signer_build, signer_build_matches, signer_source_hash, _LIB_NAME
+
+
+@pytest.fixture
+def signer_dir(tmp_path, monkeypatch):
+    root = tmp_path / "secure_signer"
+    (root / "src" / "nested").mkdir(parents=True)
+    (root / "src" / "lib.rs").write_text("pub fn a() {}\n")
+    (root / "src" / "nested" / "mod.rs").write_text("pub fn b() {}\n")
+    (root / "Cargo.toml").write_text("[package]\nname = \"signer\"\n")
+    monkeypatch.chdir(tmp_path)
+    return root
+
+
+def test_hash_is_independent_of_path_form(signer_dir):
+    relative = signer_source_hash(Path("secure_signer"))
+
+    assert relative == signer_source_hash(signer_dir.resolve())
+    assert relative == signer_source_hash(Path("secure_signer/../secure_signer"))
+
+
+def test_hash_tracks_content_and_profile(signer_dir):
+    before = signer_source_hash(signer_dir)
+    assert signer_source_hash(signer_dir, release=False) != before
+
+    (signer_dir / "src" / "lib.rs").write_text("pub fn a() { }\n")
+    assert signer_source_hash(signer_dir) != before
+
+
+def test_hash_tracks_renames(signer_dir):
+    before = signer_source_hash(signer_dir)
+
+    (signer_dir / "src" / "lib.rs").rename(signer_dir / "src" / "main.rs")
+
+    assert signer_source_hash(signer_dir) != before
+
+
+def test_recorded_build_matches_across_path_forms(signer_dir):
+    lib = signer_dir / "target" / "release" / _LIB_NAME
+    lib.parent.mkdir(parents=True)
+    lib.write_bytes(b"")
+
+    record_signer_build(Path("secure_signer"), signer_source_hash(Path("secure_signer")))
+
+    assert signer_build_matches(signer_dir.resolve(), signer_source_hash(signer_dir.resolve()))
+
+
+def test_build_does_not_match_without_library(signer_dir):
+    (signer_dir / "target").mkdir()
+    source_hash = signer_source_hash(signer_dir)
+
+    record_signer_build(signer_dir, source_hash)
+
+    assert not signer_build_matches(signer_dir, source_hash)
+
+
+def test_signer_dir_is_absolute_and_matches_cwd_relative_hash():
+    assert SIGNER_DIR.is_absolute()
+    assert signer_source_hash(SIGNER_DIR) == signer_source_hash(Path(os.path.relpath(SIGNER_DIR)))
+
+
+# Fails --offline builds the way cargo does for FAKE_CARGO=miss (missing
+# registry crate) or FAKE_CARGO=compile (code error); logs every call
+FAKE_CARGO = """#!/bin/sh
+echo "$*" >> "$FAKE_CARGO_LOG"
+case "$*" in *--offline*) offline=1 ;; esac
+if [ "$FAKE_CARGO" = compile ]; then
+    echo "error[E0308]: mismatched types"; exit 101
+fi
+if [ "$FAKE_CARGO" = miss ] && [ -n "$offline" ]; then
+    echo "error: no matching package named \\`newcrate\\` found"; exit 101
+fi
+exit 0
+"""
+
+
+@pytest.fixture
+def cargo(signer_dir, tmp_path, monkeypatch):
+    if sys.platform == "win32":
+        pytest.skip("fake cargo is a shell script")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "cargo").write_text(FAKE_CARGO)
+    os.chmod(bin_dir / "cargo", 0o755)
+    log = tmp_path / "cargo.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_CARGO_LOG", str(log))
+    monkeypatch.setattr(build.shutil, "which", lambda name: None)  # no sccache
+    monkeypatch.setattr(build, "SIGNER_DIR", signer_dir)
+    monkeypatch.setattr(build, "_TARGET_DIRS", (signer_dir / "target" / "release", signer_dir / "target" / "debug"))
+    # Lockfile plus existing build output select --offline
+    (signer_dir / "Cargo.lock").write_text("")
+    (signer_dir / "target" / "release").mkdir(parents=True)
+    return log
+
+
+def run_build(monkeypatch, mode: str) -> bool:
+    monkeypatch.setenv("FAKE_CARGO", mode)
+    output = io.TextIOWrapper(io.BytesIO(), write_through=True)
+    return build.build_rust_signer(output=output, check_toolchain=False)
+
+
+def test_offline_build_is_not_retried_after_compile_error(cargo, monkeypatch):
+    assert not run_build(monkeypatch, "compile")
+
+    assert len(cargo.read_text().splitlines()) == 1
+
+
+def test_offline_registry_miss_is_retried_online(cargo, monkeypatch):
+    assert run_build(monkeypatch, "miss")
+
+    first, second = cargo.read_text().splitlines()
+    assert "--offline" in first
+    assert "--offline" not in second
@@ -0,0 +1,219 @@
+"""
+Tests for the image write and extract paths in flash_usb.py.
+
+External tools (mkfs.ext4, pigz, mount, umount, tar, lsblk) are replaced by
+shell scripts on PATH that log their calls, and the "device" is a regular
+file, so no real device is touched.
+"""
+
+import errno
+import json
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+import flash_usb
+
+FAKE_TOOLS = {
+    "mkfs.ext4": 'echo "mkfs $*" >> "$FAKE_LOG"; exit "${FAKE_MKFS_RC:-0}"',
+    "pigz": 'cat "$2"',
+    "mount": 'echo "mount $*" >> "$FAKE_LOG"',
+    "umount": 'echo "umount $*" >> "$FAKE_LOG"',
+    "tar": textwrap.dedent("""\
+        case "$FAKE_TAR" in
+            fail) exit 2 ;;
+            hang) exec sleep 30 ;;
+            *) cat > /dev/null ;;
+        esac"""),
+}
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    if sys.platform == "win32":
+        pytest.skip("fake tools are shell scripts")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, body in FAKE_TOOLS.items():
+        path = bin_dir / name
+        path.write_text(f"#!/bin/sh\n{body}\n")
+        os.chmod(path, 0o755)
+    log = tmp_path / "log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_LOG", str(log))
+    monkeypatch.setattr(flash_usb, "EXTRACT_TIMEOUT", 0.5)
+    image = tmp_path / "rootfs.tar.gz"
+    image.write_bytes(b"x" * 4096)
+    return image, log
+
+
+def calls(log):
+    return [line.split()[0] for line in log.read_text().splitlines()]
+
+
+def test_success_leaves_filesystem_mounted_for_caller(tools, tmp_path):
+    image, log = tools
+
+    assert flash_usb.format_and_extract_pigz(image, "/dev/fake", str(tmp_path / "mnt"))
+
+    assert calls(log) == ["mkfs", "mount"]
+
+
+def test_tar_failure_unmounts(tools, tmp_path, monkeypatch):
+    image, log = tools
+    monkeypatch.setenv("FAKE_TAR", "fail")
+
+    assert not flash_usb.format_and_extract_pigz(image, "/dev/fake", str(tmp_path / "mnt"))
+
+    assert calls(log) == ["mkfs", "mount", "umount"]
+
+
+def test_tar_timeout_kills_tar_and_unmounts(tools, tmp_path, monkeypatch):
+    image, log = tools
+    monkeypatch.setenv("FAKE_TAR", "hang")
+    started = []
+    real_popen = flash_usb.subprocess.Popen
+
+    def popen(*args, **kwargs):
+        proc = real_popen(*args, **kwargs)
+        started.append(proc)
+        return proc
+
+    monkeypatch.setattr(flash_usb.subprocess, "Popen", popen)
+
+    with pytest.raises(flash_usb.subprocess.TimeoutExpired):
+        flash_usb.format_and_extract_pigz(image, "/dev/fake", str(tmp_path / "mnt"))
+
+    assert calls(log) == ["mkfs", "mount", "umount"]
+    assert all(proc.poll() is not None for proc in started)
+
+
+def test_mkfs_failure_never_mounts(tools, tmp_path, monkeypatch):
+    image, log = tools
+    monkeypatch.setenv("FAKE_MKFS_RC", "1")
+
+    assert not flash_usb.format_and_extract_pigz(image, "/dev/fake", str(tmp_path / "mnt"))
+
+    assert calls(log) == ["mkfs"]
+
+
+@pytest.fixture
+def raw_image(tmp_path, monkeypatch):
+    """An unaligned .img, a larger regular file standing in for the device, and a fake lsblk"""
+    if sys.platform != "linux":
+        pytest.skip("Linux write paths")
+    bin_dir = tmp_path / "raw-bin"
+    bin_dir.mkdir()
+    (bin_dir / "lsblk").write_text('#!/bin/sh\necho \'{"blockdevices": []}\'\n')
+    os.chmod(bin_dir / "lsblk", 0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(flash_usb, "HAS_LIBURING", False)
+    monkeypatch.setattr(flash_usb, "COPY_CHUNK_SIZE", 4096)
+
+    image = tmp_path / "coldstar.img"
+    image.write_bytes(os.urandom(3 * 4096 + 100))
+    device = tmp_path / "device"
+    device.write_bytes(b"\xff" * (8 * 4096))
+    return image, device
+
+
+def assert_flashed(image, device):
+    written = device.read_bytes()
+    size = image.stat().st_size
+    assert written[:size] == image.read_bytes()
+    assert written[size:] == b"\xff" * (len(written) - size)
+
+
+def test_raw_image_without_io_uring_uses_in_kernel_copy(raw_image, monkeypatch):
+    image, device = raw_image
+    monkeypatch.setattr(flash_usb, "write_image_dd", lambda *args: pytest.fail("dd should not run"))
+
+    assert flash_usb.flash_image(str(device), image)
+
+    assert_flashed(image, device)
+
+
+def test_raw_image_falls_back_to_dd(raw_image, monkeypatch):
+    image, device = raw_image
+
+    def refuse(*args):
+        raise OSError(errno.EINVAL, os.strerror(errno.EINVAL))
+
+    monkeypatch.setattr(os, "copy_file_range", refuse, raising=False)
+    monkeypatch.setattr(os, "sendfile", refuse)
+
+    assert flash_usb.flash_image(str(device), image)
+
+    assert_flashed(image, device)
+
+
+@pytest.fixture
+def block_tree(tmp_path, monkeypatch):
+    """Fake lsblk printing the JSON in a file the test can rewrite, and a logging umount"""
+    if sys.platform != "linux":
+        pytest.skip("Linux unmount path")
+    bin_dir = tmp_path / "lsblk-bin"
+    bin_dir.mkdir()
+    tree = tmp_path / "lsblk.json"
+    log = tmp_path / "umount.log"
+    log.touch()
+    (bin_dir / "lsblk").write_text(f'#!/bin/sh\ncat "{tree}"\n')
+    (bin_dir / "umount").write_text(f'#!/bin/sh\necho "$1" >> "{log}"\n')
+    for name in ("lsblk", "umount"):
+        os.chmod(bin_dir / name, 0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def set_mounts(*partitions):
+        children = [{"name": f"sdb{i}", "mountpoint": mountpoint}
+                    for i, mountpoint in enumerate(partitions, 1)]
+        tree.write_text(json.dumps({"blockdevices": [{"name": "sdb", "mountpoint": None, "children": children}]}))
+
+    return set_mounts, log
+
+
+def test_unmount_sees_partitions_mounted_after_enumeration(block_tree):
+    set_mounts, log = block_tree
+    set_mounts(None, None)
+    flash_usb.unmount_all_partitions("/dev/sdb")
+    assert log.read_text() == ""
+
+    # Automounted between the device scan and the flash
+    set_mounts("/media/usb1", None)
+    assert flash_usb.unmount_all_partitions("/dev/sdb")
+
+    assert log.read_text().split() == ["/dev/sdb1"]
+
+
+@pytest.fixture
+def usb_cache(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "usb_enum.json"
+    monkeypatch.setattr(flash_usb, "USB_CACHE_FILE", path)
+    return path
+
+
+def test_usb_cache_round_trip(usb_cache):
+    devices = [{"device": "/dev/sdb", "size": "16G", "model": "Stick"}]
+
+    flash_usb._save_usb_cache(devices)
+
+    assert flash_usb._load_usb_cache() == devices
+    assert stat.S_IMODE(usb_cache.parent.stat().st_mode) == 0o700
+
+
+def test_usb_cache_ignores_writable_by_others(usb_cache):
+    flash_usb._save_usb_cache([{"device": "/dev/sdb"}])
+    os.chmod(usb_cache, 0o666)
+
+    assert flash_usb._load_usb_cache() is None
+
+
+def test_usb_cache_expires(usb_cache):
+    flash_usb._save_usb_cache([{"device": "/dev/sdb"}])
+    old = usb_cache.stat().st_mtime - flash_usb.USB_CACHE_TTL - 1
+    os.utime(usb_cache, (old, old))
+
+    assert flash_usb._load_usb_cache() is None
@@ -0,0 +1,72 @@
+"""
+Tests for the in-kernel image copy in src/iso_builder.py.
+"""
+
+import errno
+import os
+
+import pytest
+
+pytest.importorskip("rich")
+
+from src import iso_builder as iso_builder_module
+from src.iso_builder import ISOBuilder
+
+CHUNK = 4096
+
+
+@pytest.fixture
+def image(tmp_path, monkeypatch):
+    monkeypatch.setattr(iso_builder_module, "FLASH_CHUNK_SIZE", CHUNK)
+    path = tmp_path / "image.img"
+    path.write_bytes(os.urandom(CHUNK * 4 + 123))
+    return path
+
+
+@pytest.fixture
+def device(tmp_path):
+    path = tmp_path / "device"
+    path.write_bytes(b"\xff" * (CHUNK * 8))
+    return path
+
+
+def fail_copy_after(monkeypatch, calls: int, err: int):
+    """Make copy_file_range succeed `calls` times, then raise err"""
+    real = os.copy_file_range
+    state = {"calls": 0}
+
+    def copy_file_range(src, dst, count, offset_src=None, offset_dst=None):
+        if state["calls"] >= calls:
+            raise OSError(err, os.strerror(err))
+        state["calls"] += 1
+        return real(src, dst, count, offset_src, offset_dst)
+
+    monkeypatch.setattr(os, "copy_file_range", copy_file_range)
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs copy_file_range")
+def test_copy_file_range_writes_whole_image(image, device):
+    assert ISOBuilder()._write_image_direct(image, str(device))
+
+    assert device.read_bytes()[:image.stat().st_size] == image.read_bytes()
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs copy_file_range")
+@pytest.mark.parametrize("err", [errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP])
+def test_sendfile_fallback_mid_copy_keeps_offsets(image, device, monkeypatch, err):
+    fail_copy_after(monkeypatch, 2, err)
+
+    assert ISOBuilder()._write_image_direct(image, str(device))
+
+    written = device.read_bytes()
+    assert written[:image.stat().st_size] == image.read_bytes()
+    assert written[image.stat().st_size:] == b"\xff" * (len(written) - image.stat().st_size)
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs copy_file_range")
+def test_sendfile_fallback_from_start(image, device, monkeypatch):
+    fail_copy_after(monkeypatch, 0, errno.EXDEV)
+
+    assert ISOBuilder()._write_image_direct(image, str(device))
+
+    assert device.read_bytes()[:image.stat().st_size] == image.read_bytes()
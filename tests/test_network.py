@@ -0,0 +1,114 @@
+"""
+Tests for the JSON-RPC batching and confirmation logic in src/network.py.
+
+The RPC endpoint is replaced with an httpx.MockTransport, so nothing here
+touches the network.
+"""
+
+import base64
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("solders")
+pytest.importorskip("rich")
+
+from src import network as network_module
+from src.network import SolanaNetwork
+
+
+def make_network(handler) -> SolanaNetwork:
+    network = SolanaNetwork("https://rpc.example.com")
+    network.client.close()
+    network.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return network
+
+
+def test_batch_replies_are_matched_by_id():
+    def handler(request):
+        calls = json.loads(request.content)
+        replies = [{"jsonrpc": "2.0", "id": call["id"], "result": call["method"]} for call in calls]
+        return httpx.Response(200, json=list(reversed(replies)))
+
+    network = make_network(handler)
+    results = network._make_rpc_batch([("getSlot", []), ("getHealth", []), ("getVersion", [])])
+
+    assert [result["result"] for result in results] == ["getSlot", "getHealth", "getVersion"]
+
+
+def test_batch_missing_reply_is_an_error():
+    def handler(request):
+        return httpx.Response(200, json=[{"jsonrpc": "2.0", "id": 1, "result": "ok"}])
+
+    network = make_network(handler)
+    results = network._make_rpc_batch([("getSlot", []), ("getHealth", [])])
+
+    assert "error" in results[0]
+    assert results[1]["result"] == "ok"
+
+
+def test_batch_rejection_applies_to_every_call():
+    rejection = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch disabled"}}
+
+    network = make_network(lambda request: httpx.Response(200, json=rejection))
+    results = network._make_rpc_batch([("getSlot", []), ("getHealth", [])])
+
+    assert results == [rejection, rejection]
+
+
+def test_confirm_transactions_polls_until_confirmed(monkeypatch):
+    monkeypatch.setattr(network_module, "CONFIRM_POLL_INTERVAL", 0)
+    polls = []
+
+    def handler(request):
+        pending = json.loads(request.content)["params"][0]
+        polls.append(pending)
+        statuses = {
+            "a": {"confirmationStatus": "confirmed", "err": None},
+            "b": {"confirmationStatus": "processed", "err": None} if len(polls) == 1
+                 else {"confirmationStatus": "finalized", "err": None},
+            "c": {"confirmationStatus": "confirmed", "err": {"InstructionError": [0, "Custom"]}},
+        }
+        return httpx.Response(200, json={"result": {"value": [statuses[s] for s in pending]}})
+
+    network = make_network(handler)
+    results = network.confirm_transactions(["a", "b", "c"], timeout=5)
+
+    assert results == {"a": True, "b": True, "c": False}
+    assert polls == [["a", "b", "c"], ["b"]]
+
+
+def test_confirm_transactions_times_out(monkeypatch):
+    monkeypatch.setattr(network_module, "CONFIRM_POLL_INTERVAL", 0)
+
+    def handler(request):
+        return httpx.Response(200, json={"result": {"value": [None]}})
+
+    network = make_network(handler)
+
+    assert network.confirm_transactions(["a"], timeout=0) == {"a": False}
+
+
+def test_send_transaction_rejects_non_base64_str():
+    requests = []
+    network = make_network(lambda request: requests.append(request) or httpx.Response(200, json={}))
+
+    assert network.send_transaction('AAAA"]},{"method":"requestAirdrop') is None
+    assert requests == []
+
+
+def test_send_transaction_body_is_valid_json():
+    tx = base64.b64encode(b"\x01\x02\x03").decode()
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": "sig"})
+
+    network = make_network(handler)
+
+    assert network.send_transaction(tx) == "sig"
+    assert network.send_transaction(base64.b64decode(tx)) == "sig"
+    assert [body["params"][0] for body in bodies] == [tx, tx]
+    assert bodies[0]["method"] == "sendTransaction"
@@ -0,0 +1,216 @@
+"""
+Tests for the persistent `--server` clients in secure_signer/python_integration.py.
+"""
+
+import asyncio
+import base64
+import gc
+import json
+import weakref
+
+import pytest
+
+import python_integration
+from python_integration import AsyncSubprocessSigner, FFISigner, FFISignerResult, SubprocessSigner
+
+
+@pytest.fixture
+def signer(fake_signer):
+    signer = SubprocessSigner(str(fake_signer.path))
+    yield signer
+    signer.close()
+
+
+def test_sign_transaction_round_trip(signer, fake_signer):
+    result = signer.sign_transaction("{}", "pass", b"\x01\x02\xff")
+
+    assert result["success"]
+    assert "id" not in result
+    assert result["data"]["action"] == "sign"
+    assert result["data"]["transaction"] == "0102ff"
+    assert result["data"]["transaction_encoding"] == "hex"
+
+
+def test_server_is_reused_across_calls(signer, fake_signer):
+    for _ in range(3):
+        assert signer.check_capabilities()["success"]
+
+    assert len(fake_signer.pids) == 1
+
+
+def test_sign_transactions_sends_one_batch(signer):
+    result = signer.sign_transactions("{}", "pass", [b"\x01", b"\x02"])
+
+    assert result["data"]["action"] == "sign_batch"
+    assert result["data"]["transactions"] == ["01", "02"]
+
+
+def test_timeout_discards_and_respawns_server(signer, fake_signer):
+    result = signer._run_stdin_mode({"action": "sleep", "seconds": 5}, timeout=0.2)
+
+    assert result == {"success": False, "error": "Command timed out"}
+    assert signer._proc is None
+
+    # The late reply must not be read as the answer to the next request
+    assert signer.check_capabilities()["data"] == {"action": "check"}
+    assert len(fake_signer.pids) == 2
+
+
+def test_mismatched_reply_id_discards_server(signer, fake_signer):
+    result = signer._run_stdin_mode({"action": "bad_id"})
+
+    assert result == {"success": False, "error": "Mismatched reply from signer process"}
+    assert signer.check_capabilities()["success"]
+    assert len(fake_signer.pids) == 2
+
+
+def test_missing_binary(tmp_path):
+    signer = SubprocessSigner(str(tmp_path / "missing"))
+
+    result = signer.check_capabilities()
+
+    assert not result["success"]
+    assert result["error"].startswith("Binary not found")
+
+
+def test_close_stops_server(fake_signer):
+    signer = SubprocessSigner(str(fake_signer.path))
+    signer.check_capabilities()
+    proc = signer._proc
+
+    signer.close()
+
+    assert proc.returncode == 0
+
+
+def test_dropped_signer_stops_its_server(fake_signer):
+    signer = SubprocessSigner(str(fake_signer.path))
+    signer.check_capabilities()
+    proc = signer._proc
+    ref = weakref.ref(signer)
+
+    del signer
+    gc.collect()
+
+    assert ref() is None
+    assert proc.returncode == 0
+
+
+def test_async_concurrent_first_calls_share_one_server(fake_signer):
+    async def run():
+        async with AsyncSubprocessSigner(str(fake_signer.path)) as signer:
+            return await asyncio.gather(*(signer.check_capabilities() for _ in range(4)))
+
+    results = asyncio.run(run())
+
+    assert all(result["success"] for result in results)
+    assert len(fake_signer.pids) == 1
+
+
+def test_async_concurrent_first_calls_without_start(fake_signer):
+    async def run():
+        signer = AsyncSubprocessSigner(str(fake_signer.path))
+        try:
+            return await asyncio.gather(*(signer.check_capabilities() for _ in range(4)))
+        finally:
+            await signer.close()
+
+    asyncio.run(run())
+
+    assert len(fake_signer.pids) == 1
+
+
+def test_async_replies_are_matched_by_id(fake_signer, monkeypatch):
+    monkeypatch.setenv("FAKE_SIGNER_REVERSE", "4")
+
+    async def run():
+        async with AsyncSubprocessSigner(str(fake_signer.path)) as signer:
+            return await asyncio.gather(*(
+                signer.sign_transaction("{}", "pass", bytes([i])) for i in range(4)
+            ))
+
+    results = asyncio.run(run())
+
+    assert [result["data"]["transaction"] for result in results] == ["00", "01", "02", "03"]
+
+
+def test_async_oversized_reply_fails_pending_and_recovers(fake_signer):
+    async def run():
+        async with AsyncSubprocessSigner(str(fake_signer.path)) as signer:
+            big = await asyncio.wait_for(signer._request({"action": "big"}), timeout=10)
+            after = await asyncio.wait_for(signer.check_capabilities(), timeout=10)
+            return big, after
+
+    big, after = asyncio.run(run())
+
+    assert not big["success"]
+    assert big["error"].startswith("Signer reply too large")
+    assert after["success"]
+    assert len(fake_signer.pids) == 2
+
+
+def test_async_missing_binary(tmp_path):
+    async def run():
+        signer = AsyncSubprocessSigner(str(tmp_path / "missing"))
+        return await signer.check_capabilities()
+
+    result = asyncio.run(run())
+
+    assert not result["success"]
+    assert result["error"].startswith("Binary not found")
+
+
+class OldSignerLibrary:
+    """Stand-in for a CDLL built before the raw and batch entry points existed"""
+
+    def __init__(self):
+        self.calls = []
+
+        # Plain functions, so _setup_functions can set argtypes on them like on a CDLL
+        def sign_transaction(container, passphrase, transaction_b64):
+            self.calls.append(transaction_b64)
+            tx = base64.b64decode(transaction_b64)
+            reply = {"signature": f"sig-{tx.hex()}", "signed_transaction": tx.hex(), "public_key": "pk"}
+            return FFISignerResult(0, json.dumps(reply).encode())
+
+        self.signer_sign_transaction = sign_transaction
+        for name in ("signer_create_container", "signer_sign_direct", "signer_free_result",
+                     "signer_version", "signer_check_mlock_support"):
+            setattr(self, name, lambda *args: None)
+
+
+@pytest.fixture
+def old_ffi_signer(monkeypatch):
+    lib = OldSignerLibrary()
+    monkeypatch.setattr(python_integration, "_load_library", lambda path: lib)
+    return FFISigner("libsolana_secure_signer.so"), lib
+
+
+def test_ffi_signer_loads_library_without_new_entry_points(old_ffi_signer):
+    signer, lib = old_ffi_signer
+
+    result = signer.sign_transaction("{}", "pass", b"\x01\x02")
+
+    assert result["data"]["signature"] == "sig-0102"
+    assert lib.calls == [base64.b64encode(b"\x01\x02")]
+
+
+def test_ffi_batch_falls_back_to_one_call_per_transaction(old_ffi_signer):
+    signer, lib = old_ffi_signer
+
+    result = signer.sign_transactions("{}", "pass", [b"\x01", b"\x02"])
+
+    assert result["data"] == {
+        "signatures": ["sig-01", "sig-02"],
+        "signed_transactions": ["01", "02"],
+        "public_key": "pk",
+    }
+
+
+def test_ffi_raw_entry_points_need_a_newer_library(old_ffi_signer):
+    signer, _ = old_ffi_signer
+
+    with pytest.raises(RuntimeError, match="signer_sign_transaction_into"):
+        signer.sign_transaction_raw("{}", "pass", b"\x01")
+    with pytest.raises(RuntimeError, match="signer_sign_batch_raw"):
+        signer.sign_transactions_raw("{}", "pass", [b"\x01"])
@@ -0,0 +1,32 @@
+"""
+Tests for the atomic transaction-file write in src/transaction.py.
+"""
+
+import json
+import os
+import stat
+
+import pytest
+
+pytest.importorskip("solders")
+pytest.importorskip("rich")
+
+from src.transaction import TransactionManager
+
+
+def test_write_tx_file_replaces_atomically(tmp_path):
+    path = tmp_path / "tx.json"
+    path.write_text("old")
+
+    TransactionManager._write_tx_file(path, {"type": "signed_transaction", "data": "AQID"})
+
+    assert json.loads(path.read_text()) == {"type": "signed_transaction", "data": "AQID"}
+    assert os.listdir(tmp_path) == ["tx.json"]
+
+
+def test_write_tx_file_is_owner_only(tmp_path):
+    path = tmp_path / "tx.json"
+
+    TransactionManager._write_tx_file(path, {"type": "unsigned_transaction", "data": ""})
+
+    assert stat.S_IMODE(path.stat().st_mode) & 0o077 == 0
@@ -0,0 +1,92 @@
+"""
+Tests for src/usb.py: the device scan cache and filesystem-type selection
+in the libc mount path.
+"""
+
+import pytest
+
+pytest.importorskip("rich")
+pytest.importorskip("questionary")
+
+from src import usb as usb_module
+
+PROC_FILESYSTEMS = ["ext3", "ext2", "ext4", "squashfs", "msdos", "vfat", "exfat"]
+
+
+@pytest.fixture
+def filesystems(monkeypatch):
+    monkeypatch.setattr(usb_module, "_block_filesystems", lambda: list(PROC_FILESYSTEMS))
+
+
+def test_probed_type_is_tried_first(filesystems, monkeypatch):
+    monkeypatch.setattr(usb_module, "_probed_fs_type", lambda device: "vfat")
+
+    candidates = usb_module._mount_fs_candidates("/dev/sdb1")
+
+    assert candidates[0] == "vfat"
+    assert candidates.count("vfat") == 1
+
+
+def test_probed_type_not_yet_loaded_is_still_tried(filesystems, monkeypatch):
+    monkeypatch.setattr(usb_module, "_probed_fs_type", lambda device: "ntfs3")
+
+    assert usb_module._mount_fs_candidates("/dev/sdb1")[0] == "ntfs3"
+
+
+def test_unprobed_device_tries_vfat_before_msdos(filesystems, monkeypatch):
+    monkeypatch.setattr(usb_module, "_probed_fs_type", lambda device: None)
+
+    candidates = usb_module._mount_fs_candidates("/dev/sdb1")
+
+    assert candidates[:3] == ["vfat", "exfat", "ext4"]
+    assert candidates.index("vfat") < candidates.index("msdos")
+    assert sorted(candidates) == sorted(PROC_FILESYSTEMS)
+
+
+def test_probe_of_missing_device_is_none(tmp_path):
+    assert usb_module._probed_fs_type(str(tmp_path / "missing")) is None
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = usb_module.USBManager()
+    manager.is_windows = manager.is_macos = False
+    scans = []
+
+    def scan():
+        scans.append(1)
+        return [{"device": "/dev/sdb", "scan": len(scans)}]
+
+    monkeypatch.setattr(manager, "_detect_linux", scan)
+    return manager, scans
+
+
+def test_device_scan_is_reused_within_ttl(manager):
+    manager, scans = manager
+
+    first = manager.detect_usb_devices()
+
+    assert manager.detect_usb_devices() == first
+    assert len(scans) == 1
+
+
+def test_force_and_invalidate_rescan(manager):
+    manager, scans = manager
+    manager.detect_usb_devices()
+
+    manager.detect_usb_devices(force=True)
+    manager.invalidate_device_cache()
+    devices = manager.detect_usb_devices()
+
+    assert len(scans) == 3
+    assert devices[0]["scan"] == 3
+
+
+def test_device_scan_expires(manager, monkeypatch):
+    manager, scans = manager
+    monkeypatch.setattr(usb_module, "DEVICE_CACHE_TTL", 0)
+
+    manager.detect_usb_devices()
+    manager.detect_usb_devices()
+
+    assert len(scans) == 2
@@ -0,0 +1,71 @@
+"""
+Tests for the bounded signing session in src/wallet.py.
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("solders")
+pytest.importorskip("base58")
+pytest.importorskip("nacl")
+pytest.importorskip("rich")
+pytest.importorskip("questionary")
+
+from src import wallet as wallet_module
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    # The session logic never signs; skip loading the native library
+    monkeypatch.setattr(wallet_module, "SolanaSecureSigner", lambda: None)
+    monkeypatch.setattr(wallet_module, "SIGNING_SESSION_TTL", 0.4)
+    monkeypatch.setattr(wallet_module, "SIGNING_SESSION_GRACE", 0.1)
+    manager = wallet_module.WalletManager()
+    yield manager
+    manager.clear_memory()
+
+
+def test_session_returns_locked_buffer(manager):
+    manager.cache_key_for_signing("/usb/wallet/keypair.json", {"v": 1}, "hunter2")
+
+    container, password = manager.get_cached_key_for_signing("/usb/wallet/keypair.json")
+
+    assert container == {"v": 1}
+    assert isinstance(password, bytearray)
+    assert password == b"hunter2"
+
+
+def test_session_is_wiped_by_timer_without_lookup(manager):
+    manager.cache_key_for_signing("/usb/wallet/keypair.json", {}, "hunter2")
+    _, password = manager.get_cached_key_for_signing("/usb/wallet/keypair.json")
+
+    time.sleep(0.6)
+
+    assert manager._signing_session is None
+    assert password == bytes(len(password))
+
+
+def test_session_is_not_handed_out_inside_grace_period(manager):
+    manager.cache_key_for_signing("/usb/wallet/keypair.json", {}, "hunter2")
+
+    time.sleep(0.32)
+
+    assert manager.get_cached_key_for_signing("/usb/wallet/keypair.json") is None
+
+
+def test_session_is_for_one_path_only(manager):
+    manager.cache_key_for_signing("/usb/wallet/keypair.json", {}, "hunter2")
+
+    assert manager.get_cached_key_for_signing("/other/keypair.json") is None
+    assert manager.get_cached_key_for_signing("/usb/wallet/keypair.json") is None
+
+
+def test_clear_memory_keeps_only_a_live_session(manager):
+    manager.cache_key_for_signing("/usb/wallet/keypair.json", {}, "hunter2")
+
+    manager.clear_memory(keep_signing_session=True)
+    assert manager.get_cached_key_for_signing("/usb/wallet/keypair.json") is not None
+
+    manager.clear_memory()
+    assert manager.get_cached_key_for_signing("/usb/wallet/keypair.json") is None
@@ -1440,8 +1440,6 @@ class ColdstarLiveWallet(App):
 
     def _do_send(self, to_addr: str, amount: float, password: str, review: Static) -> None:
         """Background worker: create, sign, and broadcast a SOL transfer"""
-        import base64
-
         try:
             keypair_path = Path(self.usb_manager.mount_point) / "wallet" / "keypair.json"
 
@@ -1488,8 +1486,7 @@ class ColdstarLiveWallet(App):
 
             # Step 5: Broadcast
             self.call_from_thread(review.update, "Broadcasting...")
-            tx_base64 = base64.b64encode(signed_tx).decode("utf-8")
-            signature = self.network.send_transaction(tx_base64)
+            signature = self.network.send_transaction(signed_tx)
 
             if signature:
                 sig_short = f"{signature[:8]}...{signature[-8:]}"